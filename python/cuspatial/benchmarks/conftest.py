@@ -112,13 +112,8 @@ def gs_sorted(gs):
 
 def make_geopandas_dataframe_from_naturalearth_lowres(nr):
     source_df = gpd.read_file(gpd.datasets.get_path("naturalearth_lowres"))
-    result_df = gpd.GeoDataFrame()
-    for i in range((nr // len(source_df)) + 1):
-        scramble_df = source_df.iloc[
-            np.random.choice(len(source_df), len(source_df)), :
-        ]
-        result_df = pd.concat([scramble_df, result_df]).reset_index(drop=True)
-    return result_df
+    result_df = source_df.iloc[np.random.choice(len(source_df), nr), :]
+    return result_df.reset_index(drop=True)
 
 
 @pytest_cases.fixture()
@@ -164,6 +159,21 @@ def gpdf_10000(request):
     return make_geopandas_dataframe_from_naturalearth_lowres(10000)
 
 
+@pytest_cases.fixture()
+def gpdf_100000(request):
+    return make_geopandas_dataframe_from_naturalearth_lowres(100000)
+
+
+@pytest_cases.fixture()
+def gpdf_1000000(request):
+    return make_geopandas_dataframe_from_naturalearth_lowres(1000000)
+
+
+@pytest_cases.fixture()
+def gpdf_10000000(request):
+    return make_geopandas_dataframe_from_naturalearth_lowres(10000000)
+
+
 @pytest_cases.fixture()
 def cugpdf_100(gpdf_100):
     return cuspatial.from_geopandas(gpdf_100)
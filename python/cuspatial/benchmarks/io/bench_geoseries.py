@@ -1,4 +1,4 @@
-# Copyright (c) 2022, NVIDIA CORPORATION.
+# Copyright (c) 2022-2023, NVIDIA CORPORATION.
 
 """Benchmarks of GeoSeries methods."""
 
@@ -15,3 +15,25 @@ def bench_from_geoseries_1000(benchmark, gpdf_1000):
 
 def bench_from_geoseries_10000(benchmark, gpdf_10000):
     benchmark(cuspatial.from_geopandas, gpdf_10000["geometry"])
+
+
+def bench_from_geoseries_100000(benchmark, gpdf_100000):
+    benchmark(cuspatial.from_geopandas, gpdf_100000["geometry"])
+
+
+def bench_from_geoseries_1000000(benchmark, gpdf_1000000):
+    benchmark(cuspatial.from_geopandas, gpdf_1000000["geometry"])
+
+
+def bench_from_geoseries_10000000(benchmark, gpdf_10000000):
+    benchmark(cuspatial.from_geopandas, gpdf_10000000["geometry"])
+
+
+def bench_from_wkb_100000(benchmark, gpdf_100000):
+    wkb = gpdf_100000["geometry"].to_wkb()
+    benchmark(cuspatial.GeoSeries.from_wkb, wkb)
+
+
+def bench_to_wkb_100000(benchmark, gpdf_100000):
+    geoseries = cuspatial.from_geopandas(gpdf_100000["geometry"])
+    benchmark(geoseries.to_wkb)
@@ -1,6 +1,9 @@
 from ._version import get_versions
+from .core.concat import GeoSeriesBuilder, concat
 from .core.geodataframe import GeoDataFrame
 from .core.geoseries import GeoSeries
+from .core.quadtree import PointQuadtree
+from .core.rtree import PackedRTree
 from .core.spatial import (
     directed_hausdorff_distance,
     haversine_distance,
@@ -14,9 +17,11 @@ from .core.spatial import (
     point_in_polygon,
     points_in_spatial_window,
     polygon_bounding_boxes,
+    quadtree_join_stats,
     quadtree_on_points,
     quadtree_point_in_polygon,
     quadtree_point_to_nearest_linestring,
+    quadtree_stats,
     sinusoidal_projection,
 )
 from .core.trajectory import (
@@ -25,6 +30,7 @@ from .core.trajectory import (
     trajectory_distances_and_speeds,
 )
 from .io.geopandas import from_geopandas
+from .io.geoparquet import read_geoparquet
 
 __version__ = get_versions()["version"]
 del get_versions
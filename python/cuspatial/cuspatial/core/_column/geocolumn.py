@@ -1,17 +1,20 @@
 # Copyright (c) 2021-2023 NVIDIA CORPORATION
 
+import pickle
 from enum import Enum
 from functools import cached_property
 from typing import Tuple, TypeVar
 
 import cupy as cp
+import numpy as np
 import pyarrow as pa
 
 import cudf
+from cudf.core.abc import Serializable
 from cudf.core.column import ColumnBase, arange, as_column, build_list_column
 
 from cuspatial.core._column.geometa import Feature_Enum, GeoMeta
-from cuspatial.utils.column_utils import empty_geometry_column
+from cuspatial.utils.column_utils import cast_coords, empty_geometry_column
 
 
 class ColumnType(Enum):
@@ -65,15 +68,33 @@ class GeoColumn(ColumnBase):
         super().__init__(None, size=len(self), dtype="geometry")
 
     def to_arrow(self):
-        return pa.UnionArray.from_dense(
-            self._meta.input_types.to_arrow(),
-            self._meta.union_offsets.to_arrow(),
+        return self._to_arrow_union(
             [
                 self.points.to_arrow(),
                 self.mpoints.to_arrow(),
                 self.lines.to_arrow(),
                 self.polygons.to_arrow(),
-            ],
+            ]
+        )
+
+    def _to_arrow_union(self, children):
+        """Build a dense Arrow union of `children`, the Arrow arrays of the
+        four children. Arrow unions have no validity bitmap of their own,
+        so null rows point to a null appended to the points child.
+        """
+        input_types = self._meta.input_types
+        union_offsets = self._meta.union_offsets
+        if self.has_nulls():
+            valid = self._meta.valid
+            points = children[0]
+            input_types = input_types.where(valid, Feature_Enum.POINT.value)
+            union_offsets = union_offsets.where(valid, len(points))
+            children = [
+                pa.concat_arrays([points, pa.nulls(1, points.type)]),
+                *children[1:],
+            ]
+        return pa.UnionArray.from_dense(
+            input_types.to_arrow(), union_offsets.to_arrow(), children
         )
 
     def __len__(self):
@@ -110,20 +131,175 @@ class GeoColumn(ColumnBase):
         )
         return result
 
+    def serialize(self):
+        """Serialize the four children and the GeoMeta series into a header
+        and their device frames, following the cudf `Serializable`
+        protocol.
+        """
+        header = {
+            "type-serialized": pickle.dumps(type(self)),
+            "children": [],
+            "children_frame_counts": [],
+        }
+        frames = []
+        for series in (
+            self.points,
+            self.mpoints,
+            self.lines,
+            self.polygons,
+            self._meta.input_types,
+            self._meta.union_offsets,
+        ):
+            child_header, child_frames = series.serialize()
+            header["children"].append(child_header)
+            header["children_frame_counts"].append(len(child_frames))
+            frames.extend(child_frames)
+        header["frame_count"] = len(frames)
+        return header, frames
+
+    @classmethod
+    def deserialize(cls, header, frames):
+        children = []
+        start = 0
+        for child_header, count in zip(
+            header["children"], header["children_frame_counts"]
+        ):
+            children.append(
+                cudf.Series.deserialize(
+                    child_header, frames[start : start + count]
+                )
+            )
+            start += count
+        *data, input_types, union_offsets = children
+        return cls(
+            tuple(data),
+            {"input_types": input_types, "union_offsets": union_offsets},
+        )
+
+    def __reduce_ex__(self, protocol):
+        return _reduce_out_of_band(self, protocol)
+
+    @property
+    def coord_dtype(self) -> np.dtype:
+        """
+        The dtype of the coordinates, float64 if there are none.
+        """
+        for child in (self.points, self.mpoints, self.lines, self.polygons):
+            if len(child) > 0:
+                return np.dtype(child.dtype.leaf_type)
+        return np.dtype(np.float64)
+
+    def astype_coords(self: T, coord_dtype, max_error=None) -> T:
+        """
+        Create a GeoColumn with coordinates cast to `coord_dtype`, sharing
+        the offsets and the GeoMeta of this GeoColumn. See `cast_coords` for
+        the precision checks. Returns self if the dtype already matches.
+        """
+        if coord_dtype is None or np.dtype(coord_dtype) == self.coord_dtype:
+            return self
+        children = []
+        for feature, child in zip(
+            (
+                Feature_Enum.POINT,
+                Feature_Enum.MULTIPOINT,
+                Feature_Enum.LINESTRING,
+                Feature_Enum.POLYGON,
+            ),
+            (self.points, self.mpoints, self.lines, self.polygons),
+        ):
+            if len(child) == 0:
+                column = empty_geometry_column(feature, coord_dtype)
+            else:
+                column = _cast_leaves(child._column, coord_dtype, max_error)
+            children.append(cudf.Series(column))
+        return GeoColumn(tuple(children), self._meta)
+
+    @property
+    def referenced_fraction(self) -> float:
+        """
+        The fraction of the rows of the four children that are referenced
+        by this GeoColumn. Selections share the children of the column they
+        were taken from, so this drops as they get smaller.
+        """
+        total = (
+            len(self.points)
+            + len(self.mpoints)
+            + len(self.lines)
+            + len(self.polygons)
+        )
+        if total == 0:
+            return 1.0
+        counts = self._meta.type_counts
+        referenced = len(self) - counts[Feature_Enum.NONE]
+        return referenced / total
+
+    def compact(self: T) -> T:
+        """
+        Create a GeoColumn whose children hold only the rows referenced by
+        this GeoColumn, in order, with the union offsets renumbered to match.
+        """
+        counts = self._meta.type_counts
+        input_types = self._meta.input_types
+        union_offsets = cp.full(len(self), -1, dtype=cp.int32)
+        children = []
+        for feature, child in zip(
+            (
+                Feature_Enum.POINT,
+                Feature_Enum.MULTIPOINT,
+                Feature_Enum.LINESTRING,
+                Feature_Enum.POLYGON,
+            ),
+            (self.points, self.mpoints, self.lines, self.polygons),
+        ):
+            mask = input_types == feature.value
+            rows = self._meta.union_offsets[mask]
+            children.append(child.take(rows.values).reset_index(drop=True))
+            union_offsets[mask.values] = cp.arange(
+                counts[feature], dtype=cp.int32
+            )
+        return GeoColumn(
+            tuple(children),
+            {"input_types": input_types, "union_offsets": union_offsets},
+        )
+
+    @property
+    def null_count(self) -> int:
+        """
+        The number of null geometries, counted from the feature types.
+        """
+        return self._meta.type_counts[Feature_Enum.NONE]
+
     @property
     def valid_count(self) -> int:
         """
-        Arrow's UnionArray does not support nulls, so this is always
-        equal to the length of the GeoColumn.
+        The number of non-null geometries.
         """
-        return self._meta.input_types.valid_count
+        return len(self) - self.null_count
 
-    def has_nulls(self) -> bool:
+    def has_nulls(self, include_nan=False) -> bool:
         """
-        Arrow's UnionArray does not support nulls, so this is always
-        False.
+        Whether any geometry is null.
         """
-        return self._meta.input_types.has_nulls
+        return self.null_count > 0
+
+    @property
+    def validity_mask(self):
+        """
+        An Arrow-layout validity bitmap of the rows, least significant bit
+        first, as a cupy array of uint8. None if no geometry is null.
+        """
+        if not self.has_nulls():
+            return None
+        return self._meta.cached(
+            "validity_mask",
+            lambda: cp.packbits(self._meta.valid.values, bitorder="little"),
+        )
+
+    def isnull(self) -> ColumnBase:
+        return as_column(~self._meta.valid.values)
+
+    def notnull(self) -> ColumnBase:
+        return as_column(self._meta.valid.values)
 
     @classmethod
     def _from_points_xy(cls, points_xy: ColumnBase):
@@ -356,6 +532,34 @@ class GeoColumn(ColumnBase):
         return final_size
 
 
+def _reduce_out_of_band(obj, protocol):
+    """Reduce a cudf `Serializable` for pickling.
+
+    The device frames are copied to host once. With pickle protocol 5 they
+    are wrapped in `pickle.PickleBuffer`, so that a `buffer_callback` can
+    send them out-of-band without further copies.
+    """
+    if protocol < 5:
+        return Serializable.__reduce_ex__(obj, protocol)
+    header, frames = obj.host_serialize()
+    frames = [pickle.PickleBuffer(frame) for frame in frames]
+    return obj.host_deserialize, (header, frames)
+
+
+def _cast_leaves(column: ColumnBase, coord_dtype, max_error):
+    """Rebuild a nested list column around its leaf coordinates cast to
+    `coord_dtype`, reusing the offsets of every level.
+    """
+    if not isinstance(column.dtype, cudf.ListDtype):
+        return as_column(cast_coords(column.values, coord_dtype, max_error))
+    return build_list_column(
+        indices=column.offsets,
+        elements=_cast_leaves(column.elements, coord_dtype, max_error),
+        mask=column.mask,
+        size=column.size,
+    )
+
+
 def _xy_as_variable_sized_list(xy: ColumnBase):
     """Given an array of interleaved x-y coordinate, construct a cuDF ListDtype
     type array, where each row is the coordinate.
@@ -1,4 +1,4 @@
-# Copyright (c) 2021-2022 NVIDIA CORPORATION
+# Copyright (c) 2021-2023 NVIDIA CORPORATION
 
 # This allows GeoMeta as its own init type
 from __future__ import annotations
@@ -27,6 +27,7 @@ class GeoMeta:
     """
 
     def __init__(self, meta: Union[GeoMeta, dict]):
+        self._cache = {}
         if isinstance(meta, dict):
             self.input_types = cudf.Series(meta["input_types"], dtype="int8")
             self.union_offsets = cudf.Series(
@@ -36,6 +37,57 @@ class GeoMeta:
             self.input_types = cudf.Series(meta.input_types, dtype="int8")
             self.union_offsets = cudf.Series(meta.union_offsets, dtype="int32")
 
+    @property
+    def input_types(self):
+        return self._input_types
+
+    @input_types.setter
+    def input_types(self, value):
+        self._input_types = value
+        self._cache.clear()
+
+    @property
+    def union_offsets(self):
+        return self._union_offsets
+
+    @union_offsets.setter
+    def union_offsets(self, value):
+        self._union_offsets = value
+        self._cache.clear()
+
+    @property
+    def type_counts(self):
+        """A dict of the number of features of each `Feature_Enum`,
+        including `Feature_Enum.NONE` for null rows.
+
+        Counted once and cached until `input_types` is reassigned. Modify
+        `input_types` by assignment, not in place, to keep it current.
+        """
+        if "type_counts" not in self._cache:
+            counts = self.input_types.value_counts().to_pandas()
+            self._cache["type_counts"] = {
+                feature: int(counts.get(feature.value, 0))
+                for feature in Feature_Enum
+            }
+        return self._cache["type_counts"]
+
+    @property
+    def valid(self):
+        """A boolean Series that is False for null rows, cached until
+        `input_types` is reassigned.
+        """
+        return self.cached(
+            "valid", lambda: self.input_types != Feature_Enum.NONE.value
+        )
+
+    def cached(self, key, compute):
+        """Return the value cached under `key`, calling `compute` to fill
+        it on first use. Cleared along with `type_counts`.
+        """
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
     def copy(self):
         return self.__class__(
             {
@@ -1,7 +1,5 @@
 # Copyright (c) 2022-2023, NVIDIA CORPORATION.
 
-from math import ceil, sqrt
-
 from cudf import DataFrame, Series
 from cudf.core.column import as_column
 
@@ -9,10 +7,11 @@ import cuspatial
 from cuspatial._lib.point_in_polygon import (
     point_in_polygon as cpp_byte_point_in_polygon,
 )
+from cuspatial.utils.column_utils import promote_coord_dtypes
 from cuspatial.utils.join_utils import pip_bitmap_column_to_binary_array
 
 
-def _quadtree_contains_properly(points, polygons):
+def _quadtree_contains_properly(points, polygons, index=None):
     """Compute from a series of points and a series of polygons which points
     are properly contained within the corresponding polygon. Polygon A contains
     Point B properly if B intersects the interior of A but not the boundary (or
@@ -27,6 +26,9 @@ def _quadtree_contains_properly(points, polygons):
         A GeoSeries of points.
     polygons : GeoSeries
         A GeoSeries of polygons.
+    index : PointQuadtree, optional
+        A quadtree already built over `points`. If not given, one is built
+        with automatically chosen parameters.
 
     Returns
     -------
@@ -35,35 +37,16 @@ def _quadtree_contains_properly(points, polygons):
         within its corresponding polygon.
     """
 
-    scale = -1
-    max_depth = 15
-    min_size = ceil(sqrt(len(points)))
     if len(polygons) == 0:
         return Series()
-    x_max = polygons.polygons.x.max()
-    x_min = polygons.polygons.x.min()
-    y_max = polygons.polygons.y.max()
-    y_min = polygons.polygons.y.min()
-    point_indices, quadtree = cuspatial.quadtree_on_points(
-        points,
-        x_min,
-        x_max,
-        y_min,
-        y_max,
-        scale,
-        max_depth,
-        min_size,
-    )
-    poly_bboxes = cuspatial.polygon_bounding_boxes(polygons)
-    intersections = cuspatial.join_quadtree_and_bounding_boxes(
-        quadtree, poly_bboxes, x_min, x_max, y_min, y_max, scale, max_depth
-    )
-    polygons_and_points = cuspatial.quadtree_point_in_polygon(
-        intersections, quadtree, point_indices, points, polygons
-    )
-    polygons_and_points["point_index"] = point_indices.iloc[
-        polygons_and_points["point_index"]
-    ].reset_index(drop=True)
+    if index is None:
+        index = cuspatial.PointQuadtree(points, auto=True)
+    elif len(index) != len(points):
+        raise ValueError(
+            f"index was built over {len(index)} points, expected "
+            f"{len(points)}"
+        )
+    polygons_and_points = index.points_in_polygons(polygons)
     polygons_and_points["part_index"] = polygons_and_points["polygon_index"]
     polygons_and_points.drop("polygon_index", axis=1, inplace=True)
     return polygons_and_points
@@ -115,9 +98,10 @@ def _byte_limited_contains_properly(points, polygons):
     return final_result
 
 
-def contains_properly(polygons, points, how="quadtree"):
+def contains_properly(polygons, points, how="quadtree", index=None):
+    polygons, points = promote_coord_dtypes(polygons, points)
     if "quadtree" == how:
-        return _quadtree_contains_properly(points, polygons)
+        return _quadtree_contains_properly(points, polygons, index)
     elif "byte-limited" == how:
         # Use stack to convert the result to the same shape as quadtree's
         # result, name the columns appropriately, and return the
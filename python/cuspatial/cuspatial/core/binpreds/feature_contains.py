@@ -52,9 +52,13 @@ class ContainsPredicateBase(BinPred, Generic[GeoSeries]):
             Whether to compute all pairs of features in the left-hand and
             right-hand GeoSeries. If False, the feature will be compared in a
             1:1 fashion with the corresponding feature in the other GeoSeries.
+        index: PointQuadtree, optional
+            A quadtree built over the points of the right-hand GeoSeries.
+            If given, the quadtree algorithm is always used.
         """
         super().__init__(**kwargs)
         self.config.allpairs = kwargs.get("allpairs", False)
+        self.config.index = kwargs.get("index", None)
 
     def _preprocess(self, lhs, rhs):
         """Flatten any rhs into only its points xy array. This is necessary
@@ -114,7 +118,8 @@ class ContainsPredicateBase(BinPred, Generic[GeoSeries]):
 
         Notes
         -----
-        1. Quadtree is always used if user requests `allpairs=True`.
+        1. Quadtree is always used if user requests `allpairs=True` or
+           passes a prebuilt `index`.
         2. If the number of polygons in the lhs is less than 32, we use the
            byte-limited algorithm because it is faster and has less memory
            overhead.
@@ -125,7 +130,12 @@ class ContainsPredicateBase(BinPred, Generic[GeoSeries]):
            code complexity would be higher if we did multipolygon
            reconstruction on both code paths.
         """
-        return len(lhs) >= 32 or has_multipolygons(lhs) or self.config.allpairs
+        return (
+            len(lhs) >= 32
+            or has_multipolygons(lhs)
+            or self.config.allpairs
+            or self.config.index is not None
+        )
 
     def _compute_predicate(
         self,
@@ -144,7 +154,9 @@ class ContainsPredicateBase(BinPred, Generic[GeoSeries]):
         points = preprocessor_result.final_rhs
         point_indices = preprocessor_result.point_indices
         if self._should_use_quadtree(lhs):
-            result = contains_properly(lhs, points, how="quadtree")
+            result = contains_properly(
+                lhs, points, how="quadtree", index=self.config.index
+            )
         else:
             result = contains_properly(lhs, points, how="byte-limited")
         op_result = ContainsOpResult(result, points, point_indices)
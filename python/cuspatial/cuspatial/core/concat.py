@@ -0,0 +1,327 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import cupy as cp
+import numpy as np
+
+import cudf
+from cudf.core.column import as_column, build_list_column
+
+from cuspatial.core._column.geocolumn import GeoColumn
+from cuspatial.core._column.geometa import Feature_Enum
+from cuspatial.core.geodataframe import GeoDataFrame
+from cuspatial.core.geoseries import GeoSeries
+from cuspatial.io.geopandas_reader import NONE_OFFSET
+
+_CHILDREN = ("points", "mpoints", "lines", "polygons")
+_FEATURES = (
+    Feature_Enum.POINT,
+    Feature_Enum.MULTIPOINT,
+    Feature_Enum.LINESTRING,
+    Feature_Enum.POLYGON,
+)
+# Number of list levels of each child column
+_DEPTHS = (1, 2, 3, 4)
+
+
+def _common_name(objs):
+    names = {obj.name for obj in objs}
+    return names.pop() if len(names) == 1 else None
+
+
+def _concat_index(objs, ignore_index):
+    if ignore_index:
+        return None
+    return objs[0].index.append([obj.index for obj in objs[1:]])
+
+
+def _concat_frames(objs, ignore_index):
+    columns = list(objs[0].columns)
+    if any(list(obj.columns) != columns for obj in objs[1:]):
+        raise ValueError(
+            "GeoDataFrames with different columns cannot be concatenated"
+        )
+    splits = [obj._split_out_geometry_columns() for obj in objs]
+    geo = GeoDataFrame(
+        {
+            name: _concat_series(
+                [geo_columns[name] for geo_columns, _ in splits], True
+            )
+            for name in splits[0][0].columns
+        }
+    )
+    data = (
+        cudf.concat(
+            [data_columns for _, data_columns in splits], ignore_index=True
+        )
+        if len(splits[0][1].columns)
+        else cudf.DataFrame()
+    )
+    result = GeoDataFrame._from_data(objs[0]._recombine_columns(geo, data))
+    index = _concat_index(objs, ignore_index)
+    result.index = (
+        cudf.RangeIndex(sum(len(obj) for obj in objs))
+        if index is None
+        else index
+    )
+    return result
+
+
+def concat(objs, ignore_index=False):
+    """Concatenate GeoSeries or GeoDataFrames.
+
+    The four child columns of each GeoSeries are appended with their offsets
+    rebased, and the feature types and union offsets are merged in a single
+    pass. A GeoSeries that is a selection of a larger one is compacted first
+    so that the result only holds referenced coordinates.
+
+    GeoDataFrames must have the same columns in the same order. Their
+    geometry columns are concatenated as above, and the other columns with
+    `cudf.concat`.
+
+    Parameters
+    ----------
+    objs : list of GeoSeries or list of GeoDataFrame
+        The objects to concatenate. They must share a coordinate dtype.
+    ignore_index : bool, default False
+        If True, the result has a RangeIndex instead of the concatenated
+        indexes.
+
+    Returns
+    -------
+    result : GeoSeries or GeoDataFrame
+
+    Examples
+    --------
+    >>> from shapely.geometry import Point, LineString
+    >>> first = cuspatial.GeoSeries(
+    ...     [Point(0, 0), LineString([(0, 0), (1, 1)])]
+    ... )
+    >>> second = cuspatial.GeoSeries([Point(2, 2)])
+    >>> cuspatial.concat([first, second], ignore_index=True)
+    0                          POINT (0.00000 0.00000)
+    1    LINESTRING (0.00000 0.00000, 1.00000 1.00000)
+    2                          POINT (2.00000 2.00000)
+    dtype: geometry
+    """
+    objs = list(objs)
+    if len(objs) == 0:
+        raise ValueError("No objects to concatenate")
+    if all(isinstance(obj, GeoDataFrame) for obj in objs):
+        return _concat_frames(objs, ignore_index)
+    if not all(isinstance(obj, GeoSeries) for obj in objs):
+        raise TypeError(
+            "concat only accepts all cuspatial.GeoSeries or all "
+            "cuspatial.GeoDataFrame"
+        )
+    return _concat_series(objs, ignore_index)
+
+
+def _concat_series(objs, ignore_index):
+    columns = [obj.compact()._column for obj in objs]
+    # bases[i, k] is the number of rows of child k before the i-th column
+    bases = np.zeros((len(columns), len(_CHILDREN)), dtype=np.int32)
+    children = []
+    for k, name in enumerate(_CHILDREN):
+        parts = [getattr(column, name) for column in columns]
+        bases[1:, k] = np.cumsum([len(part) for part in parts])[:-1]
+        nonempty = [part for part in parts if len(part) > 0]
+        if len({part.dtype for part in nonempty}) > 1:
+            raise ValueError(
+                "GeoSeries with different coordinate dtypes cannot be "
+                "concatenated"
+            )
+        children.append(
+            cudf.concat(nonempty, ignore_index=True)
+            if nonempty
+            else parts[0].reset_index(drop=True)
+        )
+
+    input_types = cudf.concat(
+        [column._meta.input_types for column in columns], ignore_index=True
+    )
+    union_offsets = cudf.concat(
+        [column._meta.union_offsets for column in columns], ignore_index=True
+    )
+    column_ids = cp.repeat(
+        cp.arange(len(columns), dtype=cp.int32),
+        [len(column) for column in columns],
+    )
+    types = input_types.values.astype(cp.int32)
+    shift = cp.asarray(bases).ravel()[
+        column_ids * len(_CHILDREN) + cp.maximum(types, 0)
+    ]
+    union_offsets = cp.where(
+        types >= 0, union_offsets.values + shift, NONE_OFFSET
+    ).astype(cp.int32)
+
+    column = GeoColumn(
+        tuple(children),
+        {"input_types": input_types, "union_offsets": union_offsets},
+    )
+    return GeoSeries(
+        column,
+        index=_concat_index(objs, ignore_index),
+        name=_common_name(objs),
+    )
+
+
+class _GrowableArray:
+    """A device array with amortized O(1) appends, growing its capacity
+    geometrically.
+    """
+
+    def __init__(self, dtype, capacity=1024):
+        self._data = cp.empty(capacity, dtype=dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    def append(self, values):
+        end = self._size + len(values)
+        if end > len(self._data):
+            data = cp.empty(max(end, 2 * len(self._data)), self._data.dtype)
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+        self._data[self._size : end] = values
+        self._size = end
+
+    def view(self):
+        return self._data[: self._size]
+
+
+class GeoSeriesBuilder:
+    """Append GeoSeries batches into device buffers that grow
+    geometrically, so that building a GeoSeries from many batches copies
+    each coordinate a constant number of times on average.
+
+    Batches are appended in order and may mix geometry types. Only the
+    referenced features of each batch are copied, so selections do not
+    carry their parent's coordinates along.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name of the built GeoSeries.
+    capacity : int, default 1024
+        The initial capacity of each buffer, in elements.
+
+    Examples
+    --------
+    >>> builder = cuspatial.GeoSeriesBuilder()
+    >>> for batch in cuspatial.io.iter_batches("points.parquet"):
+    ...     builder.append(batch)
+    >>> points = builder.build()
+    """
+
+    def __init__(self, name=None, capacity=1024):
+        self.name = name
+        self._capacity = capacity
+        self._input_types = _GrowableArray(np.int8, capacity)
+        self._union_offsets = _GrowableArray(np.int32, capacity)
+        self._counts = dict.fromkeys(_FEATURES, 0)
+        # Allocated on the first append, with its coordinate dtype
+        self._offsets = None
+        self._coords = None
+
+    def __len__(self):
+        return len(self._input_types)
+
+    def _allocate(self, dtype):
+        offsets = {}
+        coords = {}
+        for feature, depth in zip(_FEATURES, _DEPTHS):
+            offsets[feature] = []
+            for _ in range(depth):
+                level = _GrowableArray(np.int32, self._capacity)
+                level.append(cp.zeros(1, dtype=np.int32))
+                offsets[feature].append(level)
+            coords[feature] = _GrowableArray(dtype, self._capacity)
+        return offsets, coords
+
+    def append(self, batch: GeoSeries):
+        """Append the features of `batch`.
+
+        Parameters
+        ----------
+        batch : GeoSeries
+            The features to append. Its coordinate dtype must match the
+            previous batches.
+        """
+        if not isinstance(batch, GeoSeries):
+            raise TypeError(
+                "GeoSeriesBuilder only accepts cuspatial.GeoSeries"
+            )
+        counts = batch._column._meta.type_counts
+        accessors = {
+            Feature_Enum.POINT: batch.points,
+            Feature_Enum.MULTIPOINT: batch.multipoints,
+            Feature_Enum.LINESTRING: batch.lines,
+            Feature_Enum.POLYGON: batch.polygons,
+        }
+        for feature, accessor in accessors.items():
+            if counts[feature] == 0:
+                continue
+            offsets, leaves = accessor._levels()
+            if self._coords is None:
+                self._offsets, self._coords = self._allocate(leaves.dtype)
+            elif leaves.dtype != self._coords[feature].dtype:
+                raise ValueError(
+                    f"Cannot append {leaves.dtype} coordinates to a "
+                    f"GeoSeriesBuilder of {self._coords[feature].dtype}"
+                )
+            levels = self._offsets[feature]
+            for k, offset in enumerate(offsets):
+                # The last offset of a level is the length of the next one
+                if k + 1 < len(levels):
+                    base = len(levels[k + 1]) - 1
+                else:
+                    base = len(self._coords[feature])
+                levels[k].append(offset[1:] + base)
+            self._coords[feature].append(leaves.values)
+
+        input_types = batch._column._meta.input_types.values
+        union_offsets = cp.full(len(batch), NONE_OFFSET, dtype=np.int32)
+        for feature in _FEATURES:
+            if counts[feature] == 0:
+                continue
+            mask = input_types == feature.value
+            union_offsets[mask] = self._counts[feature] + cp.arange(
+                counts[feature], dtype=np.int32
+            )
+            self._counts[feature] += counts[feature]
+        self._input_types.append(input_types)
+        self._union_offsets.append(union_offsets)
+
+    def build(self) -> GeoSeries:
+        """Return a GeoSeries of every feature appended so far, with a
+        RangeIndex. The GeoSeries views the builder's buffers, and later
+        appends do not modify it.
+        """
+        offsets, coords = self._offsets, self._coords
+        if coords is None:
+            offsets, coords = self._allocate(np.float64)
+        children = []
+        for feature in _FEATURES:
+            column = as_column(coords[feature].view())
+            for level in reversed(offsets[feature]):
+                column = build_list_column(
+                    indices=as_column(level.view()),
+                    elements=column,
+                    size=len(level) - 1,
+                )
+            children.append(cudf.Series(column))
+        return GeoSeries(
+            GeoColumn(
+                tuple(children),
+                {
+                    "input_types": self._input_types.view(),
+                    "union_offsets": self._union_offsets.view(),
+                },
+            ),
+            name=self.name,
+        )
@@ -1,4 +1,5 @@
-# Copyright (c) 2020-2022, NVIDIA CORPORATION
+# Copyright (c) 2020-2023, NVIDIA CORPORATION
+import re
 from typing import Dict, Tuple, TypeVar, Union
 
 import pandas as pd
@@ -7,8 +8,16 @@ from geopandas.geoseries import is_geometry_type as gp_is_geometry_type
 
 import cudf
 
-from cuspatial.core._column.geocolumn import GeoColumn, GeoMeta
-from cuspatial.core.geoseries import GeoSeries
+from cuspatial.core._column.geocolumn import (
+    GeoColumn,
+    GeoMeta,
+    _reduce_out_of_band,
+)
+from cuspatial.core.geoseries import (
+    GeoSeries,
+    _repr_preview,
+    _repr_preview_rows,
+)
 from cuspatial.io.geopandas_reader import GeoPandasReader
 
 T = TypeVar("T", bound="GeoDataFrame")
@@ -55,6 +64,12 @@ class GeoDataFrame(cudf.DataFrame):
         else:
             raise ValueError("Invalid type passed to GeoDataFrame ctor")
 
+    def __reduce_ex__(self, protocol):
+        """Pickle with the buffers of every column as out-of-band
+        `pickle.PickleBuffer` frames when `protocol` is 5 or higher.
+        """
+        return _reduce_out_of_band(self, protocol)
+
     @property
     def _constructor(self):
         return GeoDataFrame
@@ -92,8 +107,57 @@ class GeoDataFrame(cudf.DataFrame):
         )
         return result
 
+    def to_geoparquet(
+        self,
+        path,
+        encoding="WKB",
+        sort_key=None,
+        index=None,
+        row_group_size=None,
+    ):
+        """
+        Write the GeoDataFrame to a GeoParquet file without converting the
+        geometries to GeoPandas.
+
+        Parameters
+        ----------
+        path : str or file-like
+            Destination of the file.
+        encoding : {"WKB", "geoarrow"}, default "WKB"
+            Encoding of the geometry columns. "geoarrow" requires each
+            geometry column to hold a single geometry type.
+        sort_key : {None, "morton"}, default None
+            Sort rows along a Morton curve of their primary geometry so
+            that each row group covers a compact region.
+        index : bool, optional
+            Whether to write the index. By default only a non-default index
+            is written.
+        row_group_size : int, optional
+            Maximum number of rows per row group.
+
+        See Also
+        --------
+        cuspatial.read_geoparquet
+        """
+        from cuspatial.io.geoparquet import write_geoparquet
+
+        write_geoparquet(
+            self,
+            path,
+            encoding=encoding,
+            sort_key=sort_key,
+            index=index,
+            row_group_size=row_group_size,
+        )
+
     def __repr__(self):
-        return self.to_pandas().__repr__() + "\n" + "(GPU)" + "\n"
+        output = _repr_preview(self).__repr__()
+        if len(self) > _repr_preview_rows():
+            # The dimensions of a truncated preview give its own length
+            output = re.sub(
+                r"\[\d+ rows x", f"[{len(self)} rows x", output, count=1
+            )
+        return output + "\n" + "(GPU)" + "\n"
 
     def _copy_type_metadata(
         self, other, include_index: bool = True, *, override_dtypes=None
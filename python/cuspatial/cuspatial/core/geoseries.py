@@ -1,5 +1,6 @@
 # Copyright (c) 2020-2023, NVIDIA CORPORATION
 
+import re
 from functools import cached_property
 from numbers import Integral
 from typing import Optional, Tuple, TypeVar, Union
@@ -9,22 +10,24 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import shapely
 from geopandas.geoseries import GeoSeries as gpGeoSeries
-from shapely.geometry import (
-    LineString,
-    MultiLineString,
-    MultiPoint,
-    MultiPolygon,
-    Point,
-    Polygon,
-)
+from shapely.geometry import MultiLineString, MultiPolygon
 
 import cudf
 from cudf._typing import ColumnLike
 from cudf.core.column.column import as_column
 
 import cuspatial.io.pygeoarrow as pygeoarrow
-from cuspatial.core._column.geocolumn import ColumnType, GeoColumn
+import cuspatial.io.wkb as wkb
+from cuspatial._lib.linestring_bounding_boxes import (
+    linestring_bounding_boxes as cpp_linestring_bounding_boxes,
+)
+from cuspatial.core._column.geocolumn import (
+    ColumnType,
+    GeoColumn,
+    _reduce_out_of_band,
+)
 from cuspatial.core._column.geometa import Feature_Enum, GeoMeta
 from cuspatial.core.binpreds.binpred_dispatch import (
     CONTAINS_DISPATCH,
@@ -36,12 +39,16 @@ from cuspatial.core.binpreds.binpred_dispatch import (
     OVERLAPS_DISPATCH,
     WITHIN_DISPATCH,
 )
+from cuspatial.io.geopandas_reader import NONE_OFFSET
 from cuspatial.utils.column_utils import (
+    cast_coords,
     contains_only_linestrings,
     contains_only_multipoints,
     contains_only_points,
     contains_only_polygons,
+    validate_coord_dtype,
 )
+from cuspatial.utils.mixed_utils import apply_by_type
 
 T = TypeVar("T", bound="GeoSeries")
 
@@ -67,6 +74,10 @@ class GeoSeries(cudf.Series):
         dtype: float64
     """
 
+    # Fraction of referenced buffer rows below which `iloc` selections are
+    # compacted, see `GeoSeries.compact`.
+    auto_compact_threshold = 0.0
+
     def __init__(
         self,
         data: Optional[
@@ -105,6 +116,12 @@ class GeoSeries(cudf.Series):
             column, index, dtype=dtype, name=name, nan_as_null=nan_as_null
         )
 
+    def __reduce_ex__(self, protocol):
+        """Pickle with the coordinate and offset buffers as out-of-band
+        `pickle.PickleBuffer` frames when `protocol` is 5 or higher.
+        """
+        return _reduce_out_of_band(self, protocol)
+
     @property
     def feature_types(self):
         return self._column._meta.input_types
@@ -139,6 +156,152 @@ class GeoSeries(cudf.Series):
         else:
             return ColumnType.MIXED
 
+    @property
+    def coord_dtype(self):
+        """The dtype of the coordinates, float32 or float64."""
+        return self._column.coord_dtype
+
+    def astype_coords(self, coord_dtype, max_error=None):
+        """Cast the coordinates to `coord_dtype`.
+
+        float32 coordinates halve the memory and bandwidth of float64 ones,
+        and are enough for many projected datasets. Narrowing casts are
+        checked for precision loss.
+
+        Parameters
+        ----------
+        coord_dtype : {"float32", "float64"} or None
+            The dtype of the coordinates of the result. None keeps the
+            current dtype.
+        max_error : float, optional
+            When narrowing, raise ValueError if any coordinate moves by
+            more than `max_error`. Coordinates that overflow float32 always
+            raise.
+
+        Returns
+        -------
+        GeoSeries
+            This GeoSeries if its coordinates already have `coord_dtype`.
+
+        Examples
+        --------
+        >>> points = cuspatial.GeoSeries.from_points_xy([0.5, 1e6 + 0.1])
+        >>> points.astype_coords("float32").coord_dtype
+        dtype('float32')
+        >>> points.astype_coords("float32", max_error=1e-3)
+        Traceback (most recent call last):
+        ValueError: Casting to float32 moves coordinates by up to ...
+        """
+        coord_dtype = validate_coord_dtype(coord_dtype)
+        column = self._column.astype_coords(coord_dtype, max_error)
+        if column is self._column:
+            return self
+        return GeoSeries(column, index=self.index, name=self.name)
+
+    @property
+    def bounds(self):
+        """The bounding box of each geometry.
+
+        The boxes of all geometry types are computed in one segmented
+        min/max pass per type and cached on the column, so that later
+        calls, predicates and joins on this GeoSeries reuse them.
+
+        Returns
+        -------
+        result : cudf.DataFrame
+            The ``minx``, ``miny``, ``maxx`` and ``maxy`` of each geometry,
+            with the index of this GeoSeries. Null and empty geometries
+            have NaN bounds.
+
+        Examples
+        --------
+        >>> from shapely.geometry import Point, LineString
+        >>> s = cuspatial.GeoSeries(
+        ...     [Point(0, 1), LineString([(0, 0), (2, 3)]), None]
+        ... )
+        >>> s.bounds
+           minx  miny  maxx  maxy
+        0   0.0   1.0   0.0   1.0
+        1   0.0   0.0   2.0   3.0
+        2   NaN   NaN   NaN   NaN
+        """
+        bounds = self._column._meta.cached("bounds", self._compute_bounds)
+        return cudf.DataFrame(
+            {
+                name: bound.copy()
+                for name, bound in zip(
+                    ("minx", "miny", "maxx", "maxy"), bounds
+                )
+            },
+            index=self.index,
+        )
+
+    @property
+    def total_bounds(self):
+        """The ``(minx, miny, maxx, maxy)`` bounds of all geometries, as a
+        numpy array. It is NaN if every geometry is null or empty.
+        """
+        return self._column._meta.cached(
+            "total_bounds", self._compute_total_bounds
+        ).copy()
+
+    def _compute_bounds(self):
+        meta = self._column._meta
+        input_types = meta.input_types.values
+        bounds = cp.full((4, len(self)), cp.nan, dtype=self.coord_dtype)
+        accessors = {
+            Feature_Enum.POINT: self.points,
+            Feature_Enum.MULTIPOINT: self.multipoints,
+            Feature_Enum.LINESTRING: self.lines,
+            Feature_Enum.POLYGON: self.polygons,
+        }
+        for feature, accessor in accessors.items():
+            if meta.type_counts[feature] == 0:
+                continue
+            mask = input_types == feature.value
+            x, y = accessor.x.values, accessor.y.values
+            if feature == Feature_Enum.POINT:
+                bounds[:, mask] = cp.stack([x, y, x, y])
+                continue
+            # Compose the list levels into the offsets of the first point
+            # of each feature; the last level only pairs x and y.
+            offsets, _ = accessor._levels()
+            point_offsets = offsets[0]
+            for level in offsets[1:-1]:
+                point_offsets = level[point_offsets]
+            feature_bounds = cp.stack(
+                [
+                    column.values
+                    for column in cpp_linestring_bounding_boxes(
+                        as_column(point_offsets),
+                        as_column(x),
+                        as_column(y),
+                        0.0,
+                    )
+                ]
+            )
+            empty = point_offsets[1:] == point_offsets[:-1]
+            feature_bounds[:, empty] = cp.nan
+            bounds[:, mask] = feature_bounds
+        return tuple(bounds)
+
+    def _compute_total_bounds(self):
+        minx, miny, maxx, maxy = self._column._meta.cached(
+            "bounds", self._compute_bounds
+        )
+        if len(minx) == 0 or cp.isnan(minx).all():
+            return np.full(4, np.nan)
+        return cp.asnumpy(
+            cp.stack(
+                [
+                    cp.nanmin(minx),
+                    cp.nanmin(miny),
+                    cp.nanmax(maxx),
+                    cp.nanmax(maxy),
+                ]
+            )
+        ).astype(np.float64)
+
     @property
     def point_indices(self):
         if contains_only_polygons(self):
@@ -164,29 +327,119 @@ class GeoSeries(cudf.Series):
             self._meta = meta
             self._type = Feature_Enum.POINT
 
+        def _cached(self, name, compute):
+            # Results are kept on the column's GeoMeta, which outlives this
+            # accessor and is cleared when the column's types change.
+            return self._meta.cached((self._type, name), compute)
+
+        def _cached_series(self, name, compute):
+            # Only the column is cached, each access gets its own Series so
+            # that renaming, reindexing or reassigning it, e.g. `x -= 1`,
+            # does not reach the cache.
+            column = self._cached(name, lambda: compute()._column)
+            return cudf.Series(column)
+
         @property
         def x(self):
-            return self.xy[::2].reset_index(drop=True)
+            """The x coordinates of the current features.
+
+            Each access returns a new Series over a cached column, so the
+            Series must not be modified element-wise in place; `copy` it
+            first.
+            """
+            return self._cached_series("x", lambda: self._strided(0))
 
         @property
         def y(self):
-            return self.xy[1::2].reset_index(drop=True)
+            """The y coordinates of the current features. See `x`."""
+            return self._cached_series("y", lambda: self._strided(1))
 
         @property
         def xy(self):
-            features = self._get_current_features(self._type)
-            if hasattr(features, "leaves"):
-                return cudf.Series(features.leaves().values)
-            else:
+            """The interleaved coordinates of the current features. See
+            `x`.
+            """
+            return self._cached_series("xy", self._leaves)
+
+        def _strided(self, start):
+            xy = self.xy
+            if len(xy) == 0:
+                return xy
+            return cudf.Series(cp.ascontiguousarray(xy.values[start::2]))
+
+        def _leaves(self):
+            offsets, leaves = self._levels()
+            if leaves is None:
                 return cudf.Series()
+            return cudf.Series(leaves)
+
+        def _offsets(self, level):
+            return self._levels()[0][level]
+
+        def _feature_rows(self):
+            # The rows of the child column that hold the current features
+            # of this type, in order.
+            return self._cached(
+                "rows",
+                lambda: self._meta.union_offsets[
+                    self._meta.input_types == self._type.value
+                ],
+            )
+
+        def _contiguous_range(self):
+            """Return `(start, stop)` if the current features are one
+            ascending run of rows of the child column, else None.
+            """
+            rows = self._feature_rows()
+            if len(rows) == 0 or self._col.offset != 0:
+                return None
+            start, stop = int(rows.min()), int(rows.max()) + 1
+            if stop - start != len(rows) or not rows.is_monotonic_increasing:
+                return None
+            return start, stop
+
+        def _levels(self):
+            """Return the offsets of each list level of the current features,
+            rebased to start at zero, and their leaf coordinates.
+
+            When the features are a contiguous run of the child column, as
+            for unsliced and range-sliced series, the leaves are a view of
+            the child's coordinates and only the offsets are copied.
+            Otherwise the features are gathered first.
+            """
+            return self._cached("levels", self._compute_levels)
+
+        def _compute_levels(self):
+            span = self._contiguous_range()
+            offsets = []
+            if span is None:
+                column = self._get_current_features(self._type)
+                if not hasattr(column, "leaves"):
+                    return offsets, None
+                while isinstance(column.dtype, cudf.ListDtype):
+                    offsets.append(column.offsets.values)
+                    column = column.elements
+                return offsets, column
+
+            column = self._col
+            start, stop = span
+            while isinstance(column.dtype, cudf.ListDtype):
+                level = column.offsets.values[start : stop + 1]
+                start, stop = (int(i) for i in level[[0, -1]].get())
+                offsets.append(level - start)
+                column = column.elements
+            return offsets, column.slice(start, stop)
 
         def _get_current_features(self, type):
             # Resample the existing features so that the offsets returned
             # by `_offset` methods reflect previous slicing, and match
             # the values returned by .xy.
-            existing_indices = self._meta.union_offsets[
-                self._meta.input_types == type.value
-            ]
+            if type == self._type:
+                existing_indices = self._feature_rows()
+            else:
+                existing_indices = self._meta.union_offsets[
+                    self._meta.input_types == type.value
+                ]
             existing_features = self._col.take(existing_indices._column)
             return existing_features
 
@@ -207,7 +460,7 @@ class GeoSeries(cudf.Series):
 
         @property
         def geometry_offset(self):
-            return self._get_current_features(self._type).offsets.values
+            return self._offsets(0)
 
         def point_indices(self):
             # Return a cupy.ndarray containing the index values from the
@@ -223,13 +476,11 @@ class GeoSeries(cudf.Series):
 
         @property
         def geometry_offset(self):
-            return self._get_current_features(self._type).offsets.values
+            return self._offsets(0)
 
         @property
         def part_offset(self):
-            return self._get_current_features(
-                self._type
-            ).elements.offsets.values
+            return self._offsets(1)
 
         def point_indices(self):
             # Return a cupy.ndarray containing the index values from the
@@ -245,19 +496,15 @@ class GeoSeries(cudf.Series):
 
         @property
         def geometry_offset(self):
-            return self._get_current_features(self._type).offsets.values
+            return self._offsets(0)
 
         @property
         def part_offset(self):
-            return self._get_current_features(
-                self._type
-            ).elements.offsets.values
+            return self._offsets(1)
 
         @property
         def ring_offset(self):
-            return self._get_current_features(
-                self._type
-            ).elements.elements.offsets.values
+            return self._offsets(2)
 
         def point_indices(self):
             # Return a cupy.ndarray containing the index values from the
@@ -296,38 +543,61 @@ class GeoSeries(cudf.Series):
         )
 
     def __repr__(self):
-        # TODO: Implement Iloc with slices so that we can use `Series.__repr__`
-        return self.to_pandas().__repr__()
+        output = _repr_preview(self).__repr__()
+        if len(self) <= _repr_preview_rows():
+            return output
+        # The footer of a truncated preview gives the length of the preview
+        head, _, footer = output.rpartition("\n")
+        footer = re.sub(r"Length: \d+", f"Length: {len(self)}", footer)
+        return head + "\n" + footer
 
     class GeoSeriesLocIndexer:
-        """Map the index to an integer Series and use that."""
+        """Map index labels to positions with a hash index of the labels,
+        built once per index, and gather those positions with `iloc`.
+        """
 
         def __init__(self, _sr):
             self._sr = _sr
 
         def __getitem__(self, item):
-            booltest = cudf.Series(item)
-            if booltest.dtype in (bool, np.bool_):
+            if isinstance(item, slice):
+                return self._sr.iloc[
+                    self._labels.slice_indexer(
+                        item.start, item.stop, item.step
+                    )
+                ]
+            if pd.api.types.is_scalar(item):
+                # A slice or a boolean mask if the label is duplicated, which
+                # selects every row with the label, as in pandas.
+                return self._sr.iloc[self._labels.get_loc(item)]
+
+            if isinstance(item, (cudf.Series, cudf.Index)):
+                item = item.to_pandas()
+            elif isinstance(item, cp.ndarray):
+                item = item.get()
+            item = np.asarray(item)
+            if item.dtype == np.bool_:
                 return self._sr.iloc[item]
-
-            map_df = cudf.DataFrame(
-                {
-                    "map": self._sr.index,
-                    "idx": cp.arange(len(self._sr.index))
-                    if not isinstance(item, Integral)
-                    else 0,
-                }
-            )
-            index_df = cudf.DataFrame({"map": item}).reset_index()
-            new_index = index_df.merge(
-                map_df, how="left", sort=False
-            ).sort_values("index")
-            if isinstance(item, Integral):
-                return self._sr.iloc[new_index["idx"][0]]
+            if self._labels.is_unique:
+                positions = self._labels.get_indexer(item)
             else:
-                result = self._sr.iloc[new_index["idx"]]
-                result.index = item
-                return result
+                positions = self._labels.get_indexer_for(item)
+            if (positions < 0).any():
+                raise KeyError(
+                    f"{list(item[~np.isin(item, self._labels)])} not in index"
+                )
+            return self._sr.iloc[positions]
+
+        @property
+        def _labels(self) -> pd.Index:
+            # A host copy of the index. pandas builds its hash table on the
+            # first lookup and keeps it, so it is cached on the GeoSeries
+            # for as long as the GeoSeries keeps the same index.
+            cached = getattr(self._sr, "_loc_labels", None)
+            if cached is None or cached[0] is not self._sr.index:
+                cached = (self._sr.index, self._sr.index.to_pandas())
+                self._sr._loc_labels = cached
+            return cached[1]
 
     class GeoSeriesILocIndexer:
         """Each row of a GeoSeries is one of the six types: Point, MultiPoint,
@@ -367,28 +637,155 @@ class GeoSeries(cudf.Series):
             if isinstance(indexes, Integral):
                 return GeoSeries(column, name=self._sr.name).to_shapely()
             else:
-                return GeoSeries(
+                result = GeoSeries(
                     column, index=self._sr.index[indexes], name=self._sr.name
                 )
+                return result.compact(GeoSeries.auto_compact_threshold)
 
-    def from_arrow(union):
-        column = GeoColumn(
-            (
-                cudf.Series(union.child(0)),
-                cudf.Series(union.child(1)),
-                cudf.Series(union.child(2)),
-                cudf.Series(union.child(3)),
-            ),
-            {
-                "input_types": union.type_codes,
-                "union_offsets": union.offsets,
-            },
+    @classmethod
+    def from_arrow(cls, data, encoding=None, coord_dtype=None, max_error=None):
+        """Construct a GeoSeries from Arrow data.
+
+        Parameters
+        ----------
+        data : pa.Array, pa.ChunkedArray or Arrow-compatible object
+            Either the GeoArrow union produced by `to_arrow`, or a GeoArrow
+            `geoarrow.*` array with native (interleaved or separated
+            coordinates) or WKB storage. Objects implementing the Arrow
+            PyCapsule interface (`__arrow_c_array__` or
+            `__arrow_c_stream__`) are imported without copying.
+        encoding : str, optional
+            The GeoArrow encoding of `data`, e.g. "polygon" or "wkb", if it
+            is plain storage without a `geoarrow.*` extension type.
+        coord_dtype : {"float32", "float64"}, optional
+            The dtype of the coordinates of the result. By default the
+            coordinates of `data` are kept, and WKB is read as float64.
+            Narrowing is checked for overflow, see `astype_coords`.
+        max_error : float, optional
+            When narrowing, raise ValueError if any coordinate moves by
+            more than `max_error`.
+
+        Returns
+        -------
+        GeoSeries
+            Null rows of `data` become null geometries.
+        """
+        if not isinstance(data, (pa.Array, pa.ChunkedArray)):
+            if hasattr(data, "__arrow_c_array__"):
+                data = pa.array(data)
+            elif hasattr(data, "__arrow_c_stream__"):
+                data = pa.chunked_array(data)
+            else:
+                raise TypeError(
+                    f"Cannot construct a GeoSeries from {type(data)}"
+                )
+        if isinstance(data, pa.ChunkedArray):
+            data = data.combine_chunks()
+
+        if isinstance(data, pa.UnionArray):
+            children = tuple(
+                cudf.Series.from_arrow(data.field(feature.value))
+                for feature in (
+                    Feature_Enum.POINT,
+                    Feature_Enum.MULTIPOINT,
+                    Feature_Enum.LINESTRING,
+                    Feature_Enum.POLYGON,
+                )
+            )
+            input_types = cudf.Series(data.type_codes, dtype="int8")
+            union_offsets = cudf.Series(data.offsets, dtype="int32")
+            # Null rows point to a null of a child, see `to_arrow`
+            is_null = cp.zeros(len(input_types), dtype=bool)
+            for feature, child in enumerate(children):
+                if child.has_nulls:
+                    rows = (input_types == feature).values
+                    is_null[rows] = child.isna().values[
+                        union_offsets.values[rows]
+                    ]
+            if is_null.any():
+                input_types = input_types.mask(
+                    is_null, Feature_Enum.NONE.value
+                )
+                union_offsets = union_offsets.mask(is_null, NONE_OFFSET)
+            column = GeoColumn(
+                children,
+                {"input_types": input_types, "union_offsets": union_offsets},
+            )
+            return cls(column).astype_coords(coord_dtype, max_error)
+
+        extension_encoding = pygeoarrow.geoarrow_encoding(data.type)
+        if extension_encoding is not None:
+            encoding = extension_encoding
+            data = data.storage
+        if encoding is None:
+            raise ValueError(
+                f"Cannot infer the GeoArrow encoding of {data.type}, "
+                "pass `encoding`."
+            )
+        encoding = encoding.lower()
+        if encoding == "wkb":
+            return cls.from_wkb(
+                data, coord_dtype=coord_dtype, max_error=max_error
+            )
+        return cls._from_geoarrow_native(
+            data, encoding, coord_dtype=coord_dtype, max_error=max_error
         )
-        return GeoSeries(column)
+
+    @classmethod
+    def _from_geoarrow_native(
+        cls,
+        array,
+        encoding: str,
+        to_device=None,
+        coord_dtype=None,
+        max_error=None,
+    ):
+        """Construct a GeoSeries from a GeoArrow native array. Null rows
+        become null geometries.
+
+        `to_device`, if given, is called with the (n, 2) host coordinates
+        and returns them interleaved on device, e.g. through a reused
+        pinned staging buffer. Coordinates are cast to `coord_dtype` on
+        host, before they are copied, with the checks of `cast_coords`.
+        """
+        if encoding not in pygeoarrow.GEOARROW_ENCODING_DEPTH:
+            raise ValueError(f"Unsupported GeoArrow encoding {encoding}")
+        coords, *offsets = pygeoarrow.to_ragged_array(array, encoding)
+        coords = cast_coords(coords, coord_dtype, max_error)
+        xy = coords.ravel() if to_device is None else to_device(coords)
+        single_offset = np.arange(len(array) + 1, dtype=np.int32)
+        if encoding == "point":
+            result = cls.from_points_xy(xy)
+        elif encoding == "multipoint":
+            result = cls.from_multipoints_xy(xy, *offsets)
+        elif encoding == "linestring":
+            result = cls.from_linestrings_xy(xy, *offsets, single_offset)
+        elif encoding == "multilinestring":
+            result = cls.from_linestrings_xy(xy, *offsets)
+        elif encoding == "polygon":
+            result = cls.from_polygons_xy(xy, *offsets, single_offset)
+        else:
+            result = cls.from_polygons_xy(xy, *offsets)
+
+        if array.null_count > 0:
+            is_null = cudf.Series(
+                array.is_null().to_numpy(zero_copy_only=False)
+            )
+            meta = result._column._meta
+            # Reassign rather than modify in place so that the type counts
+            # cached on the meta are refreshed.
+            meta.input_types = meta.input_types.mask(
+                is_null, Feature_Enum.NONE.value
+            )
+            meta.union_offsets = meta.union_offsets.mask(is_null, NONE_OFFSET)
+        return result
 
     @property
     def loc(self):
-        """Not currently supported."""
+        """Access features by index label. Accepts a label, a list or
+        array of labels, a label slice (inclusive of both ends, as in
+        pandas) or a boolean mask.
+        """
         return self.GeoSeriesLocIndexer(self)
 
     @property
@@ -402,9 +799,8 @@ class GeoSeries(cudf.Series):
         """
         if nullable is True:
             raise ValueError("GeoSeries doesn't support <NA> yet")
-        final_union_slice = self.iloc[0 : len(self._column)]
         return gpGeoSeries(
-            final_union_slice.to_shapely(),
+            self._to_shapely_array(),
             index=self.index.to_pandas(),
             name=self.name,
         )
@@ -415,70 +811,326 @@ class GeoSeries(cudf.Series):
         """
         return self.to_geopandas()
 
-    def _linestring_to_shapely(self, geom):
-        if len(geom) == 1:
-            result = [tuple(x) for x in geom[0]]
-            return LineString(result)
-        else:
-            linestrings = []
-            for linestring in geom:
-                linestrings.append(
-                    LineString([tuple(child) for child in linestring])
-                )
-            return MultiLineString(linestrings)
-
-    def _polygon_to_shapely(self, geom):
-        if len(geom) == 1:
-            rings = []
-            for ring in geom[0]:
-                rings.append(tuple(tuple(point) for point in ring))
-            return Polygon(rings[0], rings[1:])
-        else:
-            polygons = []
-            for p in geom:
-                rings = []
-                for ring in p:
-                    rings.append(tuple([tuple(point) for point in ring]))
-                polygons.append(Polygon(rings[0], rings[1:]))
-            return MultiPolygon(polygons)
+    def _host_feature_buffers(self, feature: Feature_Enum, union_offsets):
+        """Gather the rows of the `feature` child referenced by
+        `union_offsets` on device and copy their coordinates and offsets to
+        host in one pass.
+
+        Returns the (n, 2) coordinate array followed by the offset arrays of
+        each nesting level, innermost first.
+        """
+        child = {
+            Feature_Enum.POINT: self._column.points,
+            Feature_Enum.MULTIPOINT: self._column.mpoints,
+            Feature_Enum.LINESTRING: self._column.lines,
+            Feature_Enum.POLYGON: self._column.polygons,
+        }[feature]
+        features = child._column.take(as_column(union_offsets))
+        depth = {
+            Feature_Enum.POINT: 0,
+            Feature_Enum.MULTIPOINT: 1,
+            Feature_Enum.LINESTRING: 2,
+            Feature_Enum.POLYGON: 3,
+        }[feature]
+        offsets = []
+        level = features
+        for _ in range(depth):
+            offsets.insert(0, level.offsets.values_host.astype(np.int64))
+            level = level.elements
+        coords = features.leaves().values_host.astype(np.float64, copy=False)
+        return (coords.reshape(-1, 2), *offsets)
+
+    @staticmethod
+    def _collect_single_parts(parts, geometry_offset, collect, empty):
+        """Assemble per-part shapely geometries into features, returning the
+        part itself for single-part features and a Multi* collection built
+        by `collect` for every other feature.
+        """
+        sizes = np.diff(geometry_offset)
+        result = np.full(len(sizes), empty, dtype=object)
+        single = sizes == 1
+        result[single] = parts[geometry_offset[:-1][single]]
+        part_features = np.repeat(np.arange(len(sizes)), sizes)
+        multi_parts = ~single[part_features]
+        if multi_parts.any():
+            collect(
+                parts[multi_parts],
+                indices=part_features[multi_parts],
+                out=result,
+            )
+        return result
+
+    def _points_to_shapely(self, union_offsets):
+        (coords,) = self._host_feature_buffers(
+            Feature_Enum.POINT, union_offsets
+        )
+        return shapely.points(coords)
+
+    def _multipoints_to_shapely(self, union_offsets):
+        coords, geometry_offset = self._host_feature_buffers(
+            Feature_Enum.MULTIPOINT, union_offsets
+        )
+        return shapely.from_ragged_array(
+            shapely.GeometryType.MULTIPOINT, coords, (geometry_offset,)
+        )
+
+    def _linestrings_to_shapely(self, union_offsets):
+        coords, part_offset, geometry_offset = self._host_feature_buffers(
+            Feature_Enum.LINESTRING, union_offsets
+        )
+        parts = shapely.from_ragged_array(
+            shapely.GeometryType.LINESTRING, coords, (part_offset,)
+        )
+        return self._collect_single_parts(
+            parts,
+            geometry_offset,
+            shapely.multilinestrings,
+            MultiLineString(),
+        )
+
+    def _polygons_to_shapely(self, union_offsets):
+        (
+            coords,
+            ring_offset,
+            part_offset,
+            geometry_offset,
+        ) = self._host_feature_buffers(Feature_Enum.POLYGON, union_offsets)
+        parts = shapely.from_ragged_array(
+            shapely.GeometryType.POLYGON, coords, (ring_offset, part_offset)
+        )
+        return self._collect_single_parts(
+            parts, geometry_offset, shapely.multipolygons, MultiPolygon()
+        )
 
     @cached_property
-    def _arrow_to_shapely(self):
-        type_map = {
-            Feature_Enum.NONE: lambda x: None,
-            Feature_Enum.POINT: Point,
-            Feature_Enum.MULTIPOINT: MultiPoint,
-            Feature_Enum.LINESTRING: self._linestring_to_shapely,
-            Feature_Enum.POLYGON: self._polygon_to_shapely,
+    def _feature_to_shapely(self):
+        return {
+            Feature_Enum.POINT: self._points_to_shapely,
+            Feature_Enum.MULTIPOINT: self._multipoints_to_shapely,
+            Feature_Enum.LINESTRING: self._linestrings_to_shapely,
+            Feature_Enum.POLYGON: self._polygons_to_shapely,
         }
-        return type_map
 
-    def to_shapely(self):
-        # Copy the GPU data to host for iteration and deserialization
-        result_types = self._column._meta.input_types.to_arrow()
-
-        # Get the shapely serialization methods we'll use here.
-        shapely_fns = [
-            self._arrow_to_shapely[Feature_Enum(x)]
-            for x in result_types.to_numpy()
-        ]
-        union = self.to_arrow()
+    def _to_shapely_array(self):
+        """Convert every row to a shapely geometry, returning a numpy object
+        array. Each geometry type is built in bulk from its coordinate and
+        offset buffers and scattered back into row order by the union
+        offsets.
+        """
+        input_types = self._column._meta.input_types.values_host
+        union_offsets = self._column._meta.union_offsets.values_host
+        results = np.full(len(input_types), None, dtype=object)
+        for feature, to_shapely in self._feature_to_shapely.items():
+            mask = input_types == feature.value
+            if mask.any():
+                results[mask] = to_shapely(union_offsets[mask])
+        return results
 
-        # Serialize to Shapely!
-        results = []
-        for (result_index, shapely_serialization_fn) in zip(
-            range(0, len(self)), shapely_fns
-        ):
-            results.append(
-                shapely_serialization_fn(union[result_index].as_py())
-            )
+    def to_shapely(self):
+        results = self._to_shapely_array()
 
         # Finally, a slice determines that we return a list, otherwise
         # an object.
         if len(results) == 1:
             return results[0]
         else:
-            return results
+            return results.tolist()
+
+    @classmethod
+    def from_wkb(
+        cls, data, index=None, name=None, coord_dtype=None, max_error=None
+    ):
+        """Construct a GeoSeries from Well-Known Binary geometries.
+
+        The WKB is decoded on host with vectorized passes over the binary
+        buffer, without creating shapely objects. Z and M coordinates are
+        dropped.
+
+        Parameters
+        ----------
+        data : array-like of bytes
+            A pyarrow binary array, a cudf or pandas Series, or any sequence
+            of WKB bytes. Null entries become null geometries.
+        index : Index, optional
+            The index of the result. Defaults to the index of `data` if it is
+            a Series.
+        name : str, optional
+            The name of the result. Defaults to the name of `data`.
+        coord_dtype : {"float32", "float64"}, optional
+            The dtype of the coordinates of the result, float64 by default.
+        max_error : float, optional
+            With a float32 `coord_dtype`, raise ValueError if any coordinate
+            moves by more than `max_error`. See `astype_coords`.
+
+        Returns
+        -------
+        GeoSeries
+            The decoded geometries.
+
+        Examples
+        --------
+        >>> from shapely.geometry import Point
+        >>> gs = cuspatial.GeoSeries.from_wkb([Point(1, 2).wkb])
+        >>> gs
+        0    POINT (1.00000 2.00000)
+        dtype: geometry
+        """
+        if isinstance(data, (cudf.Series, pd.Series)):
+            index = data.index if index is None else index
+            name = data.name if name is None else name
+        if isinstance(data, cudf.Series):
+            data = data.to_arrow()
+        elif not isinstance(data, (pa.Array, pa.ChunkedArray)):
+            data = pa.array(data, type=pa.binary())
+        result = cls.from_arrow(
+            wkb.from_wkb(data), coord_dtype=coord_dtype, max_error=max_error
+        )
+        if isinstance(index, pd.Index):
+            index = cudf.Index(index)
+        return cls(result._column, index=index, name=name)
+
+    def to_wkb(self):
+        """Encode every geometry as little-endian Well-Known Binary.
+
+        The WKB is encoded on host with vectorized passes over the
+        coordinate and offset buffers, without creating shapely objects.
+        Features holding a single linestring or polygon are written as
+        LineString and Polygon geometries.
+
+        Returns
+        -------
+        pa.BinaryArray
+            The WKB of each geometry, null for null geometries.
+
+        Examples
+        --------
+        >>> gs = cuspatial.GeoSeries.from_points_xy([1.0, 2.0])
+        >>> gs.to_wkb()[0].as_py().hex()
+        '0101000000000000000000f03f0000000000000040'
+        """
+        return wkb.to_wkb(self)
+
+    def save(self, path, quadtree=None):
+        """Write the GeoSeries to an Arrow IPC file.
+
+        The union type codes and offsets and all four coordinate children
+        are stored as they are, along with the index and name.
+
+        Parameters
+        ----------
+        path : str or path
+            Destination of the file.
+        quadtree : tuple, optional
+            The `(point_indices, quadtree)` result of
+            `cuspatial.quadtree_on_points` to store in the same file.
+
+        See Also
+        --------
+        GeoSeries.load
+
+        Examples
+        --------
+        >>> points = cuspatial.GeoSeries.from_points_xy([0.0, 0.0, 1.0, 1.0])
+        >>> quadtree = cuspatial.quadtree_on_points(
+        ...     points, 0, 1, 0, 1, scale=1, max_depth=2, max_size=1
+        ... )
+        >>> points.save("points.arrow", quadtree=quadtree)
+        >>> points, (point_indices, quadtree) = cuspatial.GeoSeries.load(
+        ...     "points.arrow", quadtree=True
+        ... )
+        """
+        from cuspatial.io.ipc import save_geoseries
+
+        save_geoseries(self, path, quadtree=quadtree)
+
+    @classmethod
+    def load(cls, path, mmap=True, quadtree=False):
+        """Read a GeoSeries written by `GeoSeries.save`.
+
+        Parameters
+        ----------
+        path : str or path
+            The file to read.
+        mmap : bool, default True
+            Memory map the file, so that each buffer is copied only once,
+            from the mapped file to device.
+        quadtree : bool, default False
+            Also return the stored `(point_indices, quadtree)` tuple.
+
+        Returns
+        -------
+        GeoSeries, or a tuple of the GeoSeries and the quadtree tuple if
+        `quadtree` is True.
+        """
+        from cuspatial.io.ipc import load_geoseries
+
+        return load_geoseries(path, mmap=mmap, quadtree=quadtree)
+
+    def to_geoarrow(self, interleaved=True):
+        """Convert to a GeoArrow `geoarrow.*` extension array.
+
+        Homogeneous series use the native encoding of their geometry type,
+        with single-part encodings for lines and polygons when no feature
+        has more than one part. Series with mixed geometry types are
+        encoded as `geoarrow.wkb`.
+
+        Parameters
+        ----------
+        interleaved : bool, default True
+            Store coordinates as interleaved xy pairs, which share the
+            memory copied from device, or as separated x and y arrays.
+
+        Returns
+        -------
+        pa.ExtensionArray
+            The GeoArrow array, null for null geometries.
+
+        Examples
+        --------
+        >>> gs = cuspatial.GeoSeries.from_points_xy([1.0, 2.0, 3.0, 4.0])
+        >>> gs.to_geoarrow().type.extension_name
+        'geoarrow.point'
+        """
+        input_types = self._column._meta.input_types.values_host
+        union_offsets = self._column._meta.union_offsets.values_host
+        valid = input_types != Feature_Enum.NONE.value
+        features = np.unique(input_types[valid])
+        if len(features) > 1:
+            storage = self.to_wkb()
+            encoding = "wkb"
+        else:
+            feature = (
+                Feature_Enum(features[0])
+                if len(features)
+                else Feature_Enum.POINT
+            )
+            coords, *offsets = self._host_feature_buffers(
+                feature, union_offsets[valid]
+            )
+            encoding = pygeoarrow.native_encoding(feature, offsets)
+            if encoding in ("linestring", "polygon"):
+                offsets = offsets[:-1]
+            storage = pygeoarrow.from_ragged_array_native(
+                *pygeoarrow.expand_nulls(coords, offsets, valid),
+                mask=None if valid.all() else ~valid,
+                interleaved=interleaved,
+            )
+        geoarrow_type = pygeoarrow.GEOARROW_TYPES[encoding](storage.type)
+        return pa.ExtensionArray.from_storage(geoarrow_type, storage)
+
+    def __arrow_c_array__(self, requested_schema=None):
+        """Export as a `geoarrow.*` array through the Arrow PyCapsule
+        interface, see `to_geoarrow`.
+        """
+        return self.to_geoarrow().__arrow_c_array__(requested_schema)
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        """Export as a single chunk stream of a `geoarrow.*` array through
+        the Arrow PyCapsule interface, see `to_geoarrow`.
+        """
+        return pa.chunked_array([self.to_geoarrow()]).__arrow_c_stream__(
+            requested_schema
+        )
 
     def to_arrow(self):
         """Convert to a GeoArrow Array.
@@ -543,36 +1195,47 @@ class GeoSeries(cudf.Series):
         mpoints = self._column.mpoints
         lines = self._column.lines
         polygons = self._column.polygons
+        coord_type = pa.from_numpy_dtype(self._column.coord_dtype)
         arrow_points = (
-            points.to_arrow().view(pygeoarrow.ArrowPointsType)
+            points.to_arrow().view(
+                pygeoarrow.union_child_type(Feature_Enum.POINT, coord_type)
+            )
             if len(points) > 0
             else points.to_arrow()
         )
         arrow_mpoints = (
-            mpoints.to_arrow().view(pygeoarrow.ArrowMultiPointsType)
+            mpoints.to_arrow().view(
+                pygeoarrow.union_child_type(
+                    Feature_Enum.MULTIPOINT, coord_type
+                )
+            )
             if len(mpoints) > 1
             else mpoints.to_arrow()
         )
         arrow_lines = (
-            lines.to_arrow().view(pygeoarrow.ArrowLinestringsType)
+            lines.to_arrow().view(
+                pygeoarrow.union_child_type(
+                    Feature_Enum.LINESTRING, coord_type
+                )
+            )
             if len(lines) > 1
             else lines.to_arrow()
         )
         arrow_polygons = (
-            polygons.to_arrow().view(pygeoarrow.ArrowPolygonsType)
+            polygons.to_arrow().view(
+                pygeoarrow.union_child_type(Feature_Enum.POLYGON, coord_type)
+            )
             if len(polygons) > 1
             else polygons.to_arrow()
         )
 
-        return pa.UnionArray.from_dense(
-            self._column._meta.input_types.to_arrow(),
-            self._column._meta.union_offsets.to_arrow(),
+        return self._column._to_arrow_union(
             [
                 arrow_points,
                 arrow_mpoints,
                 arrow_lines,
                 arrow_polygons,
-            ],
+            ]
         )
 
     def _align_to_index(
@@ -861,6 +1524,53 @@ class GeoSeries(cudf.Series):
             aligned_right,
         )
 
+    def compact(self, threshold=1.0, return_reclaimed=False):
+        """Rewrite the coordinate and offset buffers to hold only the
+        features of this GeoSeries.
+
+        Selections with `iloc`, `loc` and boolean masks only slice the
+        feature types and offsets, and keep referencing every coordinate of
+        the GeoSeries they were taken from. Compacting a small selection of
+        a large GeoSeries releases the coordinates it no longer uses.
+
+        Selections are compacted automatically when the fraction of the
+        buffer rows they reference falls below
+        `GeoSeries.auto_compact_threshold`, which is 0 (never) by default.
+
+        Parameters
+        ----------
+        threshold : float, default 1.0
+            Compact only when the fraction of the rows of the underlying
+            buffers that this GeoSeries references is below `threshold`.
+            The default compacts whenever any row is unreferenced.
+        return_reclaimed : bool, default False
+            Also return the number of device bytes released.
+
+        Returns
+        -------
+        result : GeoSeries
+            A compacted GeoSeries, or this GeoSeries if it was not
+            compacted.
+        reclaimed : int
+            Bytes released by compacting, only returned if
+            `return_reclaimed` is True.
+
+        Examples
+        --------
+        >>> points = cuspatial.GeoSeries.from_points_xy(cupy.arange(200.0))
+        >>> first, reclaimed = points[:10].compact(return_reclaimed=True)
+        >>> reclaimed
+        1800
+        """
+        result, reclaimed = self, 0
+        if threshold > 0 and self._column.referenced_fraction < threshold:
+            before = self._column.memory_usage
+            result = GeoSeries(
+                self._column.compact(), index=self.index, name=self.name
+            )
+            reclaimed = before - result._column.memory_usage
+        return (result, reclaimed) if return_reclaimed else result
+
     def _gather(
         self, gather_map, keep_index=True, nullify=False, check_bounds=True
     ):
@@ -944,7 +1654,32 @@ class GeoSeries(cudf.Series):
             self.index = cudf_series.index
             return None
 
-    def contains_properly(self, other, align=False, allpairs=False):
+    def _binpred(self, dispatch, other, **kwargs):
+        """Run the binary predicate of `dispatch` for the column types of
+        `self` and `other`. Series that mix geometry types are evaluated
+        one pair of feature types at a time, and rows where either
+        geometry is null are null.
+        """
+        column_types = (self.column_type, other.column_type)
+        if kwargs.get("allpairs") or (
+            ColumnType.MIXED not in column_types
+            and not self._column.has_nulls()
+            and not other._column.has_nulls()
+        ):
+            return dispatch[column_types](**kwargs)(self, other)
+        # A prebuilt index covers all of `other`, not the pieces of it that
+        # are compared one feature type at a time.
+        kwargs.pop("index", None)
+        return apply_by_type(
+            lambda lhs, rhs: lhs._binpred(dispatch, rhs, **kwargs),
+            self,
+            other,
+            dtype=np.bool_,
+        )
+
+    def contains_properly(
+        self, other, align=False, allpairs=False, index=None
+    ):
         """Returns a `Series` of `dtype('bool')` with value `True` for each
         aligned geometry that contains _other_.
 
@@ -974,6 +1709,11 @@ class GeoSeries(cudf.Series):
             between the two GeoSeries. False computes the contains for
             each geometry in the left GeoSeries against the corresponding
             geometry in the right GeoSeries. Defaults to False.
+        index=None
+            A `PointQuadtree` built over the points of `other`, to reuse
+            across calls against the same points. If not given, a quadtree
+            is built for each call. The index is ignored when `self` or
+            `other` mix geometry types or contain nulls.
 
         Examples
         --------
@@ -1037,10 +1777,13 @@ class GeoSeries(cudf.Series):
             `point_indices` and `polygon_indices`, each of which is a
             `Series` of `dtype('int32')` in the case of `allpairs=True`.
         """
-        predicate = CONTAINS_DISPATCH[(self.column_type, other.column_type)](
-            align=align, allpairs=allpairs
+        return self._binpred(
+            CONTAINS_DISPATCH,
+            other,
+            align=align,
+            allpairs=allpairs,
+            index=index,
         )
-        return predicate(self, other)
 
     def geom_equals(self, other, align=True):
         """Compute if a GeoSeries of features A is equal to a GeoSeries of
@@ -1085,10 +1828,7 @@ class GeoSeries(cudf.Series):
             A Series of boolean values indicating whether each feature in A
             is equal to the corresponding feature in B.
         """
-        predicate = EQUALS_DISPATCH[(self.column_type, other.column_type)](
-            align=align
-        )
-        return predicate(self, other)
+        return self._binpred(EQUALS_DISPATCH, other, align=align)
 
     def covers(self, other, align=True):
         """Compute if a GeoSeries of features A covers a second GeoSeries of
@@ -1108,10 +1848,7 @@ class GeoSeries(cudf.Series):
             input GeoSeries covers the corresponding feature in the other
             GeoSeries.
         """
-        predicate = COVERS_DISPATCH[(self.column_type, other.column_type)](
-            align=align
-        )
-        return predicate(self, other)
+        return self._binpred(COVERS_DISPATCH, other, align=align)
 
     def intersects(self, other, align=True):
         """Returns a `Series` of `dtype('bool')` with value `True` for each
@@ -1133,10 +1870,7 @@ class GeoSeries(cudf.Series):
             A Series of boolean values indicating whether the geometries of
             each row intersect.
         """
-        predicate = INTERSECTS_DISPATCH[(self.column_type, other.column_type)](
-            align=align
-        )
-        return predicate(self, other)
+        return self._binpred(INTERSECTS_DISPATCH, other, align=align)
 
     def within(self, other, align=True):
         """Returns a `Series` of `dtype('bool')` with value `True` for each
@@ -1159,10 +1893,7 @@ class GeoSeries(cudf.Series):
             A Series of boolean values indicating whether each feature falls
             within the corresponding polygon in the input.
         """
-        predicate = WITHIN_DISPATCH[(self.column_type, other.column_type)](
-            align=align
-        )
-        return predicate(self, other)
+        return self._binpred(WITHIN_DISPATCH, other, align=align)
 
     def overlaps(self, other, align=True):
         """Returns True for all aligned geometries that overlap other, else
@@ -1185,10 +1916,7 @@ class GeoSeries(cudf.Series):
         result : cudf.Series
             A Series of boolean values indicating whether each geometry
             overlaps the corresponding geometry in the input."""
-        predicate = OVERLAPS_DISPATCH[(self.column_type, other.column_type)](
-            align=align
-        )
-        return predicate(self, other)
+        return self._binpred(OVERLAPS_DISPATCH, other, align=align)
 
     def crosses(self, other, align=True):
         """Returns True for all aligned geometries that cross other, else
@@ -1211,10 +1939,7 @@ class GeoSeries(cudf.Series):
         result : cudf.Series
             A Series of boolean values indicating whether each geometry
             crosses the corresponding geometry in the input."""
-        predicate = CROSSES_DISPATCH[(self.column_type, other.column_type)](
-            align=align
-        )
-        return predicate(self, other)
+        return self._binpred(CROSSES_DISPATCH, other, align=align)
 
     def disjoint(self, other, align=True):
         """Returns True for all aligned geometries that are disjoint from
@@ -1236,7 +1961,31 @@ class GeoSeries(cudf.Series):
             A Series of boolean values indicating whether each pair of
             corresponding geometries is disjoint.
         """
-        predicate = DISJOINT_DISPATCH[(self.column_type, other.column_type)](
-            align=align
-        )
-        return predicate(self, other)
+        return self._binpred(DISJOINT_DISPATCH, other, align=align)
+
+
+def _repr_preview_rows():
+    """The number of rows above which pandas truncates a repr, or infinity
+    if it never does.
+    """
+    max_rows = pd.get_option("display.max_rows")
+    return max_rows if max_rows else float("inf")
+
+
+def _repr_preview(obj):
+    """Convert to pandas only the rows of `obj` that its repr displays.
+
+    Long objects are reduced to their head and tail, with one more row on
+    each side than pandas displays, so that pandas still truncates the
+    preview with the same head and tail rows.
+    """
+    max_rows = _repr_preview_rows()
+    if len(obj) <= max_rows:
+        return obj.to_pandas()
+    num_rows = max_rows // 2 + 1
+    return pd.concat(
+        [
+            obj.iloc[:num_rows].to_pandas(),
+            obj.iloc[len(obj) - num_rows :].to_pandas(),
+        ]
+    )
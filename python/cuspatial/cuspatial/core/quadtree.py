@@ -0,0 +1,382 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+from math import ceil, sqrt
+
+import cupy as cp
+import numpy as np
+
+import cudf
+
+from cuspatial.core.geoseries import GeoSeries
+from cuspatial.core.spatial.bounding import (
+    linestring_bounding_boxes,
+    polygon_bounding_boxes,
+)
+from cuspatial.core.spatial.indexing import (
+    _min_scale,
+    quadtree_join_stats,
+    quadtree_on_points,
+    quadtree_stats,
+)
+from cuspatial.core.spatial.join import (
+    join_quadtree_and_bounding_boxes,
+    quadtree_point_in_polygon,
+    quadtree_point_to_nearest_linestring,
+)
+
+_COLUMNS = ("minx", "miny", "maxx", "maxy")
+
+
+def _leaf_point_positions(quadtree, quad_offsets):
+    """Return the positions in the sorted point indices of every point of
+    the leaf quadrants `quad_offsets`, leaf by leaf, with the position in
+    `quad_offsets` of the leaf of each point.
+    """
+    quad_offsets = cudf.Series(quad_offsets).values
+    starts = quadtree["offset"].values[quad_offsets].astype(np.int64)
+    lengths = quadtree["length"].values[quad_offsets].astype(np.int64)
+    if len(lengths) == 0:
+        empty = cp.empty(0, dtype=np.int64)
+        return empty, empty
+    ends = cp.cumsum(lengths)
+    rank = cp.arange(int(ends[-1]))
+    leaf = cp.searchsorted(ends, rank, side="right")
+    return starts[leaf] + rank - (ends - lengths)[leaf], leaf
+
+
+class PointQuadtree:
+    """A quadtree over a set of points, kept with the parameters it was
+    built with so that any number of joins and queries can reuse it.
+
+    Parameters
+    ----------
+    points : GeoSeries
+        The points to index.
+    x_min, x_max, y_min, y_max : float, optional
+        The area of interest. Defaults to the bounds of `points`.
+    scale : float, optional
+        Scale to apply to each point's distance from ``(x_min, y_min)``.
+        Defaults to the smallest scale for which `max_depth` levels cover
+        the area of interest. Smaller scales are clamped to it with a
+        warning.
+    max_depth : int, optional
+        Maximum quadtree depth. Defaults to 15, or is tuned if `auto`.
+    max_size : int, optional
+        Maximum number of points allowed in a node before it's split into
+        4 leaf nodes. Defaults to the square root of the number of points,
+        or is tuned if `auto`.
+    auto : bool, default False
+        Tune the parameters that are not given from a sample of the points,
+        see `quadtree_on_points`.
+    target_size : int, optional
+        The mean number of points per leaf that `auto` aims for.
+
+    Attributes
+    ----------
+    point_indices : cudf.Series
+        The positions in `points` of the points, sorted by quadrant.
+    quadtree : cudf.DataFrame
+        The quadtree nodes, see `quadtree_on_points`.
+
+    Examples
+    --------
+    >>> points = cuspatial.GeoSeries.from_points_xy(
+    ...     cupy.random.uniform(0, 100, 2_000_000)
+    ... )
+    >>> index = cuspatial.PointQuadtree(points, auto=True)
+    >>> for polygons in batches:
+    ...     pairs = index.points_in_polygons(polygons)
+    """
+
+    def __init__(
+        self,
+        points: GeoSeries,
+        x_min=None,
+        x_max=None,
+        y_min=None,
+        y_max=None,
+        scale=None,
+        max_depth=None,
+        max_size=None,
+        auto=False,
+        target_size=None,
+    ):
+        self.points = points
+        if auto:
+            (
+                self.point_indices,
+                self.quadtree,
+                parameters,
+            ) = quadtree_on_points(
+                points,
+                x_min,
+                x_max,
+                y_min,
+                y_max,
+                scale,
+                max_depth,
+                max_size,
+                auto=True,
+                target_size=target_size,
+            )
+            for name, value in parameters.items():
+                setattr(self, name, value)
+            return
+
+        bounds = None
+        if None in (x_min, x_max, y_min, y_max):
+            bounds = points.total_bounds if len(points) else np.zeros(4)
+        self.x_min, self.x_max = sorted(
+            (
+                bounds[0] if x_min is None else x_min,
+                bounds[2] if x_max is None else x_max,
+            )
+        )
+        self.y_min, self.y_max = sorted(
+            (
+                bounds[1] if y_min is None else y_min,
+                bounds[3] if y_max is None else y_max,
+            )
+        )
+        self.max_depth = 15 if max_depth is None else max_depth
+        self.max_size = (
+            max(1, ceil(sqrt(len(points)))) if max_size is None else max_size
+        )
+        min_scale = _min_scale(
+            self.x_min, self.x_max, self.y_min, self.y_max, self.max_depth
+        )
+        if not min_scale > 0:
+            # Every point is at the same position
+            min_scale = 1.0
+        self.point_indices, self.quadtree = quadtree_on_points(
+            points,
+            self.x_min,
+            self.x_max,
+            self.y_min,
+            self.y_max,
+            min_scale if scale is None else scale,
+            self.max_depth,
+            self.max_size,
+        )
+        # The scale the quadtree was built with, after clamping
+        self.scale = min_scale if scale is None else max(scale, min_scale)
+
+    def __len__(self):
+        return len(self.point_indices)
+
+    def __repr__(self):
+        return (
+            f"PointQuadtree(points={len(self)}, nodes={len(self.quadtree)}, "
+            f"bbox=({self.x_min}, {self.y_min}, {self.x_max}, {self.y_max}), "
+            f"scale={self.scale}, max_depth={self.max_depth}, "
+            f"max_size={self.max_size})"
+        )
+
+    def stats(self):
+        """Summarize the shape of the quadtree, see `quadtree_stats`."""
+        return quadtree_stats(self.quadtree, self.max_size, self.point_indices)
+
+    def join_stats(self, polygons: GeoSeries):
+        """Count the candidate and contained points of each polygon part,
+        see `quadtree_join_stats`.
+
+        Parameters
+        ----------
+        polygons : GeoSeries
+            Polygons to test against. They must be closed.
+
+        Returns
+        -------
+        result : cudf.DataFrame
+            The ``pairs``, ``candidates`` and ``hits`` of each polygon part.
+        """
+        bounding_boxes = polygon_bounding_boxes(polygons)
+        pairs = self.join_bounding_boxes(bounding_boxes)
+        hits = quadtree_point_in_polygon(
+            pairs, self.quadtree, self.point_indices, self.points, polygons
+        )
+        return quadtree_join_stats(
+            self.quadtree, pairs, hits["polygon_index"], len(bounding_boxes)
+        )
+
+    def join_bounding_boxes(self, bounding_boxes):
+        """Find the leaf quadrants that intersect each bounding box.
+
+        Parameters
+        ----------
+        bounding_boxes : cudf.DataFrame
+            The ``minx``, ``miny``, ``maxx`` and ``maxy`` of each box, as
+            returned by `polygon_bounding_boxes`.
+
+        Returns
+        -------
+        result : cudf.DataFrame
+            The ``bbox_offset`` and ``quad_offset`` of each intersecting
+            pair, see `join_quadtree_and_bounding_boxes`.
+        """
+        return join_quadtree_and_bounding_boxes(
+            self.quadtree,
+            bounding_boxes,
+            self.x_min,
+            self.x_max,
+            self.y_min,
+            self.y_max,
+            self.scale,
+            self.max_depth,
+        )
+
+    def points_in_polygons(self, polygons: GeoSeries):
+        """Find the points inside each polygon.
+
+        Parameters
+        ----------
+        polygons : GeoSeries
+            Polygons to test against. They must be closed.
+
+        Returns
+        -------
+        result : cudf.DataFrame
+            One row per point and polygon that contains it.
+
+            polygon_index : cudf.Series
+                Position of the polygon part, as in
+                `quadtree_point_in_polygon`.
+            point_index : cudf.Series
+                Position of the point in `points`.
+        """
+        pairs = self.join_bounding_boxes(polygon_bounding_boxes(polygons))
+        result = quadtree_point_in_polygon(
+            pairs, self.quadtree, self.point_indices, self.points, polygons
+        )
+        result["point_index"] = self.point_indices.iloc[
+            result["point_index"]
+        ].reset_index(drop=True)
+        return result
+
+    def nearest_linestrings(self, linestrings: GeoSeries, expansion_radius=0):
+        """Find the nearest linestring to each point within
+        `expansion_radius` of the bounding box of a linestring.
+
+        Parameters
+        ----------
+        linestrings : GeoSeries
+            Linestrings to test against.
+        expansion_radius : float, default 0
+            Distance by which the bounding box of each linestring is
+            expanded before it is joined with the quadtree.
+
+        Returns
+        -------
+        result : cudf.DataFrame
+            point_index : cudf.Series
+                Position of the point in `points`.
+            linestring_index : cudf.Series
+                Position of its nearest linestring.
+            distance : cudf.Series
+                Distance between the point and the linestring.
+        """
+        pairs = self.join_bounding_boxes(
+            linestring_bounding_boxes(linestrings, expansion_radius)
+        )
+        result = quadtree_point_to_nearest_linestring(
+            pairs, self.quadtree, self.point_indices, self.points, linestrings
+        )
+        result["point_index"] = self.point_indices.iloc[
+            result["point_index"]
+        ].reset_index(drop=True)
+        return result
+
+    def query_window(self, min_x, max_x, min_y, max_y):
+        """Find the points inside a rectangular window.
+
+        Only the points of the leaf quadrants that intersect the window are
+        tested. As in `points_in_spatial_window`, a point is inside if
+        ``min_x < x < max_x`` and ``min_y < y < max_y``. Points outside
+        the area of interest of the quadtree are never found.
+
+        Parameters
+        ----------
+        min_x, max_x, min_y, max_y : float
+            The window. The bounds of each axis are swapped if reversed.
+
+        Returns
+        -------
+        result : cudf.Series
+            The positions in `points` of the points inside the window, in
+            ascending order.
+        """
+        windows = cudf.DataFrame(
+            {
+                "minx": [min_x],
+                "miny": [min_y],
+                "maxx": [max_x],
+                "maxy": [max_y],
+            }
+        )
+        return self.query_windows(windows)["point_index"]
+
+    def query_windows(self, windows):
+        """Find the points inside each of many rectangular windows.
+
+        All windows are joined with the quadtree at once, see
+        `query_window`.
+
+        Parameters
+        ----------
+        windows : cudf.DataFrame
+            The ``minx``, ``miny``, ``maxx`` and ``maxy`` of each window.
+            The bounds of each axis are swapped if reversed.
+
+        Returns
+        -------
+        result : cudf.DataFrame
+            One row per window and point inside it, sorted by window, then
+            point.
+
+            window_index : cudf.Series
+                Position of the window in `windows`.
+            point_index : cudf.Series
+                Position of the point in `points`.
+
+        Examples
+        --------
+        >>> index = cuspatial.PointQuadtree(points, auto=True)
+        >>> viewports = cudf.DataFrame(
+        ...     {"minx": [0, 10], "miny": [0, 10], "maxx": [5, 20],
+        ...      "maxy": [5, 20]}
+        ... )
+        >>> matches = index.query_windows(viewports)
+        >>> counts = matches["window_index"].value_counts()
+        """
+        dtype = self.points.coord_dtype
+        bounds = [windows[name].values.astype(dtype) for name in _COLUMNS]
+        min_x = cp.minimum(bounds[0], bounds[2])
+        max_x = cp.maximum(bounds[0], bounds[2])
+        min_y = cp.minimum(bounds[1], bounds[3])
+        max_y = cp.maximum(bounds[1], bounds[3])
+        if len(windows) == 0 or len(self.quadtree) == 0:
+            window_index = point_index = cp.empty(0, dtype=np.int64)
+        else:
+            pairs = self.join_bounding_boxes(
+                cudf.DataFrame(
+                    dict(zip(_COLUMNS, (min_x, min_y, max_x, max_y)))
+                )
+            )
+            positions, pair = _leaf_point_positions(
+                self.quadtree, pairs["quad_offset"]
+            )
+            window_index = pairs["bbox_offset"].values[pair]
+            point_index = self.point_indices.values[positions]
+            x = self.points.points.x.values[point_index]
+            y = self.points.points.y.values[point_index]
+            inside = (
+                (min_x[window_index] < x)
+                & (x < max_x[window_index])
+                & (min_y[window_index] < y)
+                & (y < max_y[window_index])
+            )
+            window_index = window_index[inside]
+            point_index = point_index[inside]
+        return cudf.DataFrame(
+            {"window_index": window_index, "point_index": point_index}
+        ).sort_values(["window_index", "point_index"], ignore_index=True)
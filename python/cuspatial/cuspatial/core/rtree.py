@@ -0,0 +1,360 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import cupy as cp
+import numpy as np
+import pandas as pd
+
+import cudf
+
+from cuspatial.core.geoseries import GeoSeries
+from cuspatial.utils.column_utils import contains_only_points
+
+_COLUMNS = ("minx", "miny", "maxx", "maxy")
+# Bits per axis of the grid the box centers are sorted on.
+_HILBERT_ORDER = 16
+
+
+def _hilbert_distance(xp, x, y):
+    """Position of each cell ``(x, y)`` of a ``2 ** _HILBERT_ORDER`` square
+    grid along the Hilbert curve that covers it.
+    """
+    n = 1 << _HILBERT_ORDER
+    d = xp.zeros(len(x), dtype=np.int64)
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx.astype(np.int64)) ^ ry.astype(np.int64))
+        # Rotate the quadrant so that the curve enters it at its origin
+        flip = rx & ~ry
+        x = xp.where(flip, n - 1 - x, x)
+        y = xp.where(flip, n - 1 - y, y)
+        x, y = xp.where(ry, x, y), xp.where(ry, y, x)
+        s >>= 1
+    return d
+
+
+def _pack(xp, boxes, node_size):
+    """The bounding boxes of each run of `node_size` consecutive boxes."""
+    padding = -len(boxes[0]) % node_size
+    packed = []
+    for i, column in enumerate(boxes):
+        fill = np.inf if i < 2 else -np.inf
+        column = xp.concatenate(
+            [column, xp.full(padding, fill, dtype=column.dtype)]
+        ).reshape(-1, node_size)
+        packed.append(column.min(axis=1) if i < 2 else column.max(axis=1))
+    return tuple(packed)
+
+
+def _rank(xp, queries, values):
+    """Sort `values` by query, then value, and return the order with the
+    rank of each value within its query.
+    """
+    order = xp.lexsort(xp.stack([values, queries]))
+    queries = queries[order]
+    rank = xp.arange(len(order)) - xp.searchsorted(queries, queries)
+    return order, rank
+
+
+class PackedRTree:
+    """A static R-tree over bounding boxes, bulk loaded from the boxes
+    sorted along a Hilbert curve through their centers.
+
+    The tree is stored as one array of boxes per level. The leaves are the
+    sorted boxes and each node of a level bounds `node_size` consecutive
+    nodes of the level below, so the children of a node are found from its
+    position alone. Queries descend all levels for a batch of queries at
+    once, which makes them vectorized on device or on host.
+
+    Parameters
+    ----------
+    bounding_boxes : cudf.DataFrame or pandas.DataFrame
+        The ``minx``, ``miny``, ``maxx`` and ``maxy`` of each box, as
+        returned by `polygon_bounding_boxes` or `linestring_bounding_boxes`.
+        Boxes with a NaN bound are not indexed.
+    node_size : int, default 16
+        Number of children of each node.
+    device : bool, default True
+        Build and query the tree with cupy arrays. If False, numpy arrays
+        are used and queries return pandas DataFrames.
+
+    Attributes
+    ----------
+    bbox_index : cupy.ndarray or numpy.ndarray
+        The positions in `bounding_boxes` of the leaves, in tree order.
+
+    Examples
+    --------
+    Find the candidate pairs of intersecting polygons of two GeoSeries,
+    without comparing every pair:
+
+    >>> tree = cuspatial.PackedRTree(cuspatial.polygon_bounding_boxes(a))
+    >>> pairs = tree.query(cuspatial.polygon_bounding_boxes(b))
+    """
+
+    def __init__(self, bounding_boxes, node_size=16, device=True):
+        if node_size < 2:
+            raise ValueError("node_size must be at least 2")
+        xp = cp if device else np
+        self._xp = xp
+        self.node_size = node_size
+
+        boxes = tuple(
+            self._as_array(bounding_boxes[name]) for name in _COLUMNS
+        )
+        valid = ~xp.isnan(xp.stack(boxes)).any(axis=0)
+        positions = xp.flatnonzero(valid)
+        boxes = tuple(column[positions] for column in boxes)
+        if len(positions):
+            centers = ((boxes[0] + boxes[2]) / 2, (boxes[1] + boxes[3]) / 2)
+            extent = max(float(c.max() - c.min()) for c in centers)
+            if not extent > 0:
+                extent = 1.0
+            cells = (1 << _HILBERT_ORDER) - 1
+            x, y = (
+                ((c - c.min()) / extent * cells).astype(np.int64)
+                for c in centers
+            )
+            order = xp.argsort(_hilbert_distance(xp, x, y))
+            positions = positions[order]
+            boxes = tuple(column[order] for column in boxes)
+        self.bbox_index = positions
+
+        self._levels = [boxes]
+        while len(self._levels[-1][0]) > 1:
+            self._levels.append(_pack(xp, self._levels[-1], node_size))
+
+    @classmethod
+    def from_geoseries(cls, geoseries: GeoSeries, node_size=16, device=True):
+        """Build the tree over the bounding box of each geometry of
+        `geoseries`, see `GeoSeries.bounds`. Null and empty geometries are
+        not indexed.
+        """
+        return cls(geoseries.bounds, node_size, device)
+
+    def __len__(self):
+        return len(self.bbox_index)
+
+    def __repr__(self):
+        return (
+            f"PackedRTree(boxes={len(self)}, levels={len(self._levels)}, "
+            f"node_size={self.node_size}, "
+            f"device={self._xp is cp})"
+        )
+
+    def _as_array(self, column):
+        if self._xp is cp:
+            return cp.asarray(column.values)
+        return np.asarray(column.to_numpy())
+
+    def _points_xy(self, points):
+        if len(points) > 0 and not contains_only_points(points):
+            raise ValueError("GeoSeries must contain only points.")
+        return self._as_array(points.points.x), self._as_array(points.points.y)
+
+    def _frame(self, data):
+        if self._xp is cp:
+            return cudf.DataFrame(data)
+        return pd.DataFrame(data)
+
+    def _children(self, queries, nodes, level):
+        """Pair each query with the children on `level` of its node."""
+        xp = self._xp
+        children = (
+            nodes[:, None] * self.node_size + xp.arange(self.node_size)
+        ).ravel()
+        queries = xp.repeat(queries, self.node_size)
+        keep = children < len(self._levels[level][0])
+        return queries[keep], children[keep]
+
+    def _batched(self, search, num_queries, batch_size):
+        """Run `search` on consecutive ranges of at most `batch_size`
+        queries and concatenate its results.
+        """
+        xp = self._xp
+        if batch_size is None or batch_size >= num_queries:
+            return search(0, num_queries)
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        results = [
+            search(start, min(start + batch_size, num_queries))
+            for start in range(0, num_queries, batch_size)
+        ]
+        return tuple(xp.concatenate(arrays) for arrays in zip(*results))
+
+    def _search_boxes(self, qminx, qminy, qmaxx, qmaxy, start, stop):
+        """The query positions and leaves of every intersecting pair of the
+        queries ``start:stop``, sorted by query, then box.
+        """
+        xp = self._xp
+        queries = xp.arange(start, stop)
+        nodes = xp.zeros(len(queries), dtype=np.int64)
+        empty = xp.zeros(0, dtype=np.int64)
+        if len(self) == 0:
+            return empty, empty
+        for level in range(len(self._levels) - 1, -1, -1):
+            minx, miny, maxx, maxy = self._levels[level]
+            hit = (
+                (minx[nodes] <= qmaxx[queries])
+                & (maxx[nodes] >= qminx[queries])
+                & (miny[nodes] <= qmaxy[queries])
+                & (maxy[nodes] >= qminy[queries])
+            )
+            queries, nodes = queries[hit], nodes[hit]
+            if level > 0:
+                queries, nodes = self._children(queries, nodes, level - 1)
+        bbox_index = self.bbox_index[nodes]
+        order = xp.lexsort(xp.stack([bbox_index, queries]))
+        return queries[order], bbox_index[order]
+
+    def query(self, bounding_boxes, batch_size=None):
+        """Find the indexed boxes that intersect each query box.
+
+        Boxes that only touch intersect.
+
+        Parameters
+        ----------
+        bounding_boxes : cudf.DataFrame or pandas.DataFrame
+            The ``minx``, ``miny``, ``maxx`` and ``maxy`` of each query.
+        batch_size : int, optional
+            The number of queries to descend the tree with at once, to
+            bound the memory used by large batches. All queries at once by
+            default.
+
+        Returns
+        -------
+        result : cudf.DataFrame or pandas.DataFrame
+            One row per intersecting pair, sorted by query, then box.
+
+            query_index
+                Position of the query box.
+            bbox_index
+                Position of the indexed box in the boxes of the tree.
+        """
+        queries = tuple(
+            self._as_array(bounding_boxes[name]) for name in _COLUMNS
+        )
+        query_index, bbox_index = self._batched(
+            lambda start, stop: self._search_boxes(*queries, start, stop),
+            len(queries[0]),
+            batch_size,
+        )
+        return self._frame(
+            {"query_index": query_index, "bbox_index": bbox_index}
+        )
+
+    def query_points(self, points: GeoSeries, batch_size=None):
+        """Find the indexed boxes that contain each point, boundary
+        included.
+
+        Parameters
+        ----------
+        points : GeoSeries
+            The query points.
+        batch_size : int, optional
+            The number of points to descend the tree with at once.
+
+        Returns
+        -------
+        result : cudf.DataFrame or pandas.DataFrame
+            One row per point and box that contains it, sorted by point,
+            then box.
+
+            point_index
+                Position of the point.
+            bbox_index
+                Position of the indexed box in the boxes of the tree.
+        """
+        x, y = self._points_xy(points)
+        point_index, bbox_index = self._batched(
+            lambda start, stop: self._search_boxes(x, y, x, y, start, stop),
+            len(x),
+            batch_size,
+        )
+        return self._frame(
+            {"point_index": point_index, "bbox_index": bbox_index}
+        )
+
+    def _search_nearest(self, x, y, k, start, stop):
+        """The query positions, leaves and distances of the `k` nearest
+        boxes of the queries ``start:stop``, sorted by query, then
+        distance.
+        """
+        xp = self._xp
+        queries = xp.arange(start, stop)
+        nodes = xp.zeros(len(queries), dtype=np.int64)
+        if len(self) == 0:
+            empty = xp.zeros(0, dtype=np.int64)
+            return empty, empty, xp.zeros(0, dtype=x.dtype)
+        for level in range(len(self._levels) - 1, -1, -1):
+            minx, miny, maxx, maxy = self._levels[level]
+            qx, qy = x[queries], y[queries]
+            dx = xp.maximum(xp.maximum(minx[nodes] - qx, qx - maxx[nodes]), 0)
+            dy = xp.maximum(xp.maximum(miny[nodes] - qy, qy - maxy[nodes]), 0)
+            distance = xp.hypot(dx, dy)
+            if level == 0:
+                break
+            # Each node bounds at least one box and no two nodes of a
+            # level share a box, so the k-th smallest distance to the
+            # farthest corner of a node bounds the k-th nearest box.
+            far = xp.hypot(
+                xp.maximum(xp.abs(qx - minx[nodes]), xp.abs(qx - maxx[nodes])),
+                xp.maximum(xp.abs(qy - miny[nodes]), xp.abs(qy - maxy[nodes])),
+            )
+            order, rank = _rank(xp, queries, far)
+            bound = xp.full(len(x), np.inf, dtype=far.dtype)
+            kth = rank == k - 1
+            bound[queries[order][kth]] = far[order][kth]
+            keep = distance <= bound[queries]
+            queries, nodes = self._children(
+                queries[keep], nodes[keep], level - 1
+            )
+
+        order, rank = _rank(xp, queries, distance)
+        order = order[rank < k]
+        return queries[order], self.bbox_index[nodes[order]], distance[order]
+
+    def nearest(self, points: GeoSeries, k=1, batch_size=None):
+        """Find the `k` indexed boxes nearest to each point.
+
+        The distance between a point and a box that contains it is 0. Ties
+        between the k-th and next boxes are broken arbitrarily.
+
+        Parameters
+        ----------
+        points : GeoSeries
+            The query points.
+        k : int, default 1
+            The number of boxes to find for each point. Fewer are returned
+            if the tree has fewer boxes.
+        batch_size : int, optional
+            The number of points to descend the tree with at once.
+
+        Returns
+        -------
+        result : cudf.DataFrame or pandas.DataFrame
+            One row per point and near box, sorted by point, then distance.
+
+            point_index
+                Position of the point.
+            bbox_index
+                Position of the indexed box in the boxes of the tree.
+            distance
+                Euclidean distance between the point and the box.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        x, y = self._points_xy(points)
+        point_index, bbox_index, distance = self._batched(
+            lambda start, stop: self._search_nearest(x, y, k, start, stop),
+            len(x),
+            batch_size,
+        )
+        return self._frame(
+            {
+                "point_index": point_index,
+                "bbox_index": bbox_index,
+                "distance": distance,
+            }
+        )
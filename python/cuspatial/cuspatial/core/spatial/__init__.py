@@ -10,7 +10,7 @@ from .distance import (
     pairwise_point_polygon_distance,
 )
 from .filtering import points_in_spatial_window
-from .indexing import quadtree_on_points
+from .indexing import quadtree_join_stats, quadtree_on_points, quadtree_stats
 from .join import (
     join_quadtree_and_bounding_boxes,
     point_in_polygon,
@@ -34,7 +34,9 @@ __all__ = [
     "linestring_bounding_boxes",
     "point_in_polygon",
     "points_in_spatial_window",
+    "quadtree_join_stats",
     "quadtree_on_points",
     "quadtree_point_in_polygon",
     "quadtree_point_to_nearest_linestring",
+    "quadtree_stats",
 ]
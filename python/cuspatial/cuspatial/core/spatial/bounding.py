@@ -42,12 +42,13 @@ def polygon_bounding_boxes(polygons: GeoSeries):
     -----
     Has no notion of multipolygons. If a multipolygon is passed, the bounding
     boxes for each polygon will be computed and returned. The user is
-    responsible for handling the multipolygon case.
+    responsible for handling the multipolygon case. Use `GeoSeries.bounds`
+    for the bounding box of each multipolygon.
     """
 
     column_names = ["minx", "miny", "maxx", "maxy"]
     if len(polygons) == 0:
-        return DataFrame(columns=column_names, dtype="f8")
+        return DataFrame(columns=column_names, dtype=polygons.coord_dtype)
 
     if not contains_only_polygons(polygons):
         raise ValueError("Geoseries must contain only polygons.")
@@ -57,23 +58,22 @@ def polygon_bounding_boxes(polygons: GeoSeries):
     # by combining the geometry offset and parts offset of the multipolygon
     # array.
 
-    poly_offsets = polygons.polygons.part_offset
-    ring_offsets = polygons.polygons.ring_offset
-    x = polygons.polygons.x
-    y = polygons.polygons.y
-
-    return DataFrame._from_data(
-        dict(
-            zip(
-                column_names,
-                cpp_polygon_bounding_boxes(
-                    as_column(poly_offsets),
-                    as_column(ring_offsets),
-                    as_column(x),
-                    as_column(y),
-                ),
+    def compute():
+        return tuple(
+            cpp_polygon_bounding_boxes(
+                as_column(polygons.polygons.part_offset),
+                as_column(polygons.polygons.ring_offset),
+                as_column(polygons.polygons.x),
+                as_column(polygons.polygons.y),
             )
         )
+
+    # The boxes are cached on the column, so that repeated joins against
+    # the same polygons do not recompute them. The result gets copies so
+    # that changes to it do not reach the cache.
+    results = polygons._column._meta.cached("polygon_bounding_boxes", compute)
+    return DataFrame._from_data(
+        {name: column.copy() for name, column in zip(column_names, results)}
     )
 
 
@@ -104,7 +104,7 @@ def linestring_bounding_boxes(linestrings: GeoSeries, expansion_radius: float):
 
     column_names = ["minx", "miny", "maxx", "maxy"]
     if len(linestrings) == 0:
-        return DataFrame(columns=column_names, dtype="f8")
+        return DataFrame(columns=column_names, dtype=linestrings.coord_dtype)
 
     if not contains_only_linestrings(linestrings):
         raise ValueError("Geoseries must contain only linestrings.")
@@ -2,6 +2,8 @@
 
 from typing import Tuple
 
+import cupy as cp
+
 import cudf
 from cudf import DataFrame, Series
 from cudf.core.column import as_column
@@ -23,7 +25,9 @@ from cuspatial.utils.column_utils import (
     contains_only_multipoints,
     contains_only_points,
     contains_only_polygons,
+    promote_coord_dtypes,
 )
+from cuspatial.utils.mixed_utils import apply_by_type, propagate_nulls
 
 
 def directed_hausdorff_distance(multipoints: GeoSeries):
@@ -40,7 +44,7 @@ def directed_hausdorff_distance(multipoints: GeoSeries):
     -------
     result : cudf.DataFrame
         result[i, j] indicates the hausdorff distance between multipoints[i]
-        and multipoint[j].
+        and multipoint[j]. It is null if either multipoint is null.
 
     Examples
     --------
@@ -84,6 +88,21 @@ def directed_hausdorff_distance(multipoints: GeoSeries):
     if num_spaces == 0:
         return DataFrame()
 
+    if multipoints._column.has_nulls():
+        valid = multipoints._column._meta.valid.values
+        positions = cp.flatnonzero(valid)
+        distances = directed_hausdorff_distance(multipoints.iloc[positions])
+        result = cp.zeros(
+            (num_spaces, num_spaces), dtype=multipoints.coord_dtype
+        )
+        result[cp.ix_(positions, positions)] = distances.values
+        return DataFrame._from_data(
+            {
+                j: cudf.Series(result[:, j]).mask(~(valid & valid[j]))._column
+                for j in range(num_spaces)
+            }
+        )
+
     if not contains_only_multipoints(multipoints):
         raise ValueError("Input must be a series of multipoints.")
 
@@ -96,6 +115,7 @@ def directed_hausdorff_distance(multipoints: GeoSeries):
     return DataFrame._from_columns(result, range(num_spaces))
 
 
+@propagate_nulls
 def haversine_distance(p1: GeoSeries, p2: GeoSeries):
     """Compute the haversine distances in kilometers between an arbitrary
     list of lon/lat pairs
@@ -112,6 +132,7 @@ def haversine_distance(p1: GeoSeries, p2: GeoSeries):
     result : cudf.Series
         The distance between pairs of points between `p1` and `p2`
     """
+    p1, p2 = promote_coord_dtypes(p1, p2)
 
     if any([not contains_only_points(p1), not contains_only_points(p2)]):
         raise ValueError("Input muist be two series of points.")
@@ -129,12 +150,12 @@ def haversine_distance(p1: GeoSeries, p2: GeoSeries):
     )
 
 
+@propagate_nulls
 def pairwise_point_distance(points1: GeoSeries, points2: GeoSeries):
     """Compute shortest distance between pairs of points and multipoints
 
-    Currently `points1` and `points2` must contain either only points or
-    multipoints. Mixing points and multipoints in the same series is
-    unsupported.
+    `points1` and `points2` must contain only points and multipoints, and
+    may mix both.
 
     Parameters
     ----------
@@ -163,12 +184,13 @@ def pairwise_point_distance(points1: GeoSeries, points2: GeoSeries):
     1    0.500000
     dtype: float64
     """
+    points1, points2 = promote_coord_dtypes(points1, points2)
 
     if not len(points1) == len(points2):
         raise ValueError("`points1` and `points2` must have the same length")
 
     if len(points1) == 0:
-        return cudf.Series(dtype="float64")
+        return cudf.Series(dtype=points1.coord_dtype)
 
     if not contains_only_points(points1):
         raise ValueError("`points1` array must contain only points")
@@ -177,9 +199,7 @@ def pairwise_point_distance(points1: GeoSeries, points2: GeoSeries):
     if (len(points1.points.xy) > 0 and len(points1.multipoints.xy) > 0) or (
         len(points2.points.xy) > 0 and len(points2.multipoints.xy) > 0
     ):
-        raise NotImplementedError(
-            "Mixing point and multipoint geometries is not supported"
-        )
+        return apply_by_type(pairwise_point_distance, points1, points2)
 
     points1_xy, points1_geometry_offsets = _flatten_point_series(points1)
     points2_xy, points2_geometry_offsets = _flatten_point_series(points2)
@@ -195,6 +215,7 @@ def pairwise_point_distance(points1: GeoSeries, points2: GeoSeries):
     )
 
 
+@propagate_nulls
 def pairwise_linestring_distance(
     multilinestrings1: GeoSeries, multilinestrings2: GeoSeries
 ):
@@ -238,6 +259,9 @@ def pairwise_linestring_distance(
     1    1.414214
     dtype: float64
     """
+    multilinestrings1, multilinestrings2 = promote_coord_dtypes(
+        multilinestrings1, multilinestrings2
+    )
 
     if not len(multilinestrings1) == len(multilinestrings2):
         raise ValueError(
@@ -246,7 +270,7 @@ def pairwise_linestring_distance(
         )
 
     if len(multilinestrings1) == 0:
-        return cudf.Series(dtype="float64")
+        return cudf.Series(dtype=multilinestrings1.coord_dtype)
 
     return Series._from_data(
         {
@@ -262,6 +286,7 @@ def pairwise_linestring_distance(
     )
 
 
+@propagate_nulls
 def pairwise_point_linestring_distance(
     points: GeoSeries, linestrings: GeoSeries
 ):
@@ -289,9 +314,8 @@ def pairwise_point_linestring_distance(
     Notes
     -----
     The input `GeoSeries` must contain a single type geometry.
-    For example, `points` series cannot contain both points and polygons.
-    Currently, it is unsupported that `points` contains both points and
-    multipoints.
+    For example, `points` series cannot contain both points and polygons,
+    but may contain both points and multipoints.
 
     Examples
     --------
@@ -356,6 +380,7 @@ def pairwise_point_linestring_distance(
     2     0.680451
     dtype: float64
     """
+    points, linestrings = promote_coord_dtypes(points, linestrings)
     if not contains_only_points(points):
         raise ValueError("`points` array must contain only points")
 
@@ -363,8 +388,10 @@ def pairwise_point_linestring_distance(
         raise ValueError("`linestrings` array must contain only linestrings")
 
     if len(points.points.xy) > 0 and len(points.multipoints.xy) > 0:
-        raise NotImplementedError(
-            "Mixing point and multipoint geometries is not supported"
+        return apply_by_type(
+            pairwise_point_linestring_distance,
+            points,
+            linestrings,
         )
 
     point_xy_col, points_geometry_offset = _flatten_point_series(points)
@@ -382,6 +409,7 @@ def pairwise_point_linestring_distance(
     )
 
 
+@propagate_nulls
 def pairwise_point_polygon_distance(points: GeoSeries, polygons: GeoSeries):
     """Compute distance between pairs of (multi)points and (multi)polygons
 
@@ -408,9 +436,8 @@ def pairwise_point_polygon_distance(points: GeoSeries, polygons: GeoSeries):
     Notes
     -----
     The input `GeoSeries` must contain a single type geometry.
-    For example, `points` series cannot contain both points and polygons.
-    Currently, it is unsupported that `points` contains both points and
-    multipoints.
+    For example, `points` series cannot contain both points and polygons,
+    but may contain both points and multipoints.
 
     Examples
     --------
@@ -432,6 +459,7 @@ def pairwise_point_polygon_distance(points: GeoSeries, polygons: GeoSeries):
     0    0.5
     dtype: float64
     """
+    points, polygons = promote_coord_dtypes(points, polygons)
 
     if len(points) != len(polygons):
         raise ValueError("Unmatched input geoseries length.")
@@ -446,9 +474,7 @@ def pairwise_point_polygon_distance(points: GeoSeries, polygons: GeoSeries):
         raise ValueError("`linestrings` array must contain only linestrings")
 
     if len(points.points.xy) > 0 and len(points.multipoints.xy) > 0:
-        raise NotImplementedError(
-            "Mixing point and multipoint geometries is not supported"
-        )
+        return apply_by_type(pairwise_point_polygon_distance, points, polygons)
 
     point_collection_type = (
         CollectionType.SINGLE
@@ -1,5 +1,7 @@
 # Copyright (c) 2022-2023, NVIDIA CORPORATION.
 
+import cupy as cp
+
 from cudf import DataFrame
 from cudf.core.column import as_column
 
@@ -40,6 +42,10 @@ def points_in_spatial_window(points: GeoSeries, min_x, max_x, min_y, max_y):
     -----
     * Swaps ``min_x`` and ``max_x`` if ``min_x > max_x``
     * Swaps ``min_y`` and ``max_y`` if ``min_y > max_y``
+    * Every point is tested. To query the same points with many windows,
+      build a `PointQuadtree` once and use `PointQuadtree.query_windows`,
+      which only tests the points of the quadrants that intersect each
+      window and returns the positions of the points.
     """
 
     if len(points) == 0:
@@ -48,6 +54,13 @@ def points_in_spatial_window(points: GeoSeries, min_x, max_x, min_y, max_y):
     if not contains_only_points(points):
         raise ValueError("GeoSeries must contain only points.")
 
+    # Skip the kernel when the window misses the cached extent of `points`
+    min_x, max_x = sorted((min_x, max_x))
+    min_y, max_y = sorted((min_y, max_y))
+    x0, y0, x1, y1 = points.total_bounds
+    if not (min_x < x1 and x0 < max_x and min_y < y1 and y0 < max_y):
+        return GeoSeries.from_points_xy(cp.empty(0, dtype=points.coord_dtype))
+
     xs = as_column(points.points.x)
     ys = as_column(points.points.y)
 
@@ -1,6 +1,10 @@
 # Copyright (c) 2022-2023, NVIDIA CORPORATION.
 
 import warnings
+from math import ceil, log, sqrt
+
+import cupy as cp
+import numpy as np
 
 from cudf import DataFrame, Series
 from cudf.core.column import as_column
@@ -11,9 +15,156 @@ from cuspatial._lib.quadtree import (
 )
 from cuspatial.utils.column_utils import contains_only_points
 
+# Morton codes are uint32_t, so quadtrees have at most 15 levels.
+_MAX_DEPTH = 15
+# Number of points sampled to tune the quadtree parameters.
+_AUTO_SAMPLE_SIZE = 1 << 20
+# Values of `max_size` tried by the tuning, as multiples of the target leaf
+# size. Splitting a node of `max_size` points leaves about a quarter of them
+# in each child, so leaves hold between a quarter of `max_size` and
+# `max_size` points.
+_AUTO_MAX_SIZE_FACTORS = (1, 1.5, 2, 3, 4)
+
+
+def _min_scale(x_min, x_max, y_min, y_max, max_depth):
+    """The smallest scale for which `max_depth` levels cover the area of
+    interest.
+    """
+    return max(x_max - x_min, y_max - y_min) / ((1 << max_depth) + 2)
+
+
+def _sample_cells(points, x_min, x_max, y_min, y_max):
+    """Sample the points inside the area of interest and return their
+    cells on the deepest level of a quadtree, with the fraction of the
+    points that was sampled.
+    """
+    num_points = len(points)
+    size = min(num_points, _AUTO_SAMPLE_SIZE)
+    x = points.points.x.values
+    y = points.points.y.values
+    if size < num_points:
+        positions = np.random.default_rng(0).integers(0, num_points, size)
+        positions = cp.asarray(positions)
+        x, y = x[positions], y[positions]
+    inside = (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+    x, y = x[inside], y[inside]
+
+    extent = max(x_max - x_min, y_max - y_min)
+    if not extent > 0:
+        extent = 1.0
+    cells = 1 << _MAX_DEPTH
+    cx = cp.clip(((x - x_min) / extent * cells).astype(np.int64), 0, cells - 1)
+    cy = cp.clip(((y - y_min) / extent * cells).astype(np.int64), 0, cells - 1)
+    return cx, cy, size / num_points
+
+
+def _cell_counts(cx, cy, level):
+    """The sorted ids and point counts of the non-empty cells of the
+    ``4 ** level`` cells of the area of interest.
+    """
+    shift = _MAX_DEPTH - level
+    ids = ((cx >> shift) << level) | (cy >> shift)
+    return cp.unique(ids, return_counts=True)
+
+
+def _leaf_sizes(levels, max_depth, max_size):
+    """Point counts of the leaves of the quadtree of the cells `levels`,
+    as built by `quadtree_on_points`.
+    """
+    leaves = []
+    split = cp.zeros(1, dtype=np.int64)  # the root
+    for level, (ids, counts) in enumerate(levels[:max_depth], 1):
+        if len(split) == 0:
+            break
+        cx, cy = ids >> level, ids & ((1 << level) - 1)
+        parents = ((cx >> 1) << (level - 1)) | (cy >> 1)
+        found = cp.searchsorted(split, parents)
+        in_split = split[cp.minimum(found, len(split) - 1)] == parents
+        oversize = counts > max_size
+        is_leaf = in_split & ~oversize if level < max_depth else in_split
+        leaves.append(counts[is_leaf])
+        split = ids[in_split & oversize]
+    return cp.concatenate(leaves) if leaves else cp.zeros(0, np.int64)
+
+
+def _auto_parameters(
+    points, x_min, x_max, y_min, y_max, max_depth, max_size, target_size
+):
+    """Pick the quadtree parameters that are not given, see
+    `quadtree_on_points`.
+    """
+    num_points = len(points)
+    if None in (x_min, x_max, y_min, y_max):
+        bounds = points.total_bounds if num_points else np.zeros(4)
+        x_min = bounds[0] if x_min is None else x_min
+        x_max = bounds[2] if x_max is None else x_max
+        y_min = bounds[1] if y_min is None else y_min
+        y_max = bounds[3] if y_max is None else y_max
+    x_min, x_max = sorted((float(x_min), float(x_max)))
+    y_min, y_max = sorted((float(y_min), float(y_max)))
+    if target_size is None:
+        target_size = min(max(ceil(sqrt(num_points)), 32), 1024)
+
+    if num_points > 0 and (max_depth is None or max_size is None):
+        cx, cy, fraction = _sample_cells(points, x_min, x_max, y_min, y_max)
+        levels = [
+            _cell_counts(cx, cy, level) for level in range(1, _MAX_DEPTH + 1)
+        ]
+        # Counts below one sampled point are not resolved by the sample.
+        sample_target = max(target_size * fraction, 1)
+        if max_depth is None:
+            # The shallowest tree whose densest cell fits in a leaf
+            max_depth = _MAX_DEPTH
+            for level, (_, counts) in enumerate(levels, 1):
+                if len(counts) == 0 or int(counts.max()) <= sample_target:
+                    max_depth = level
+                    break
+        if max_size is None:
+            # The leaf capacity whose mean leaf size is nearest the target
+            def error(size):
+                sizes = _leaf_sizes(levels, max_depth, size * fraction)
+                if len(sizes) == 0:
+                    return 0.0
+                return abs(log(float(sizes.mean()) / sample_target))
+
+            max_size = min(
+                (
+                    ceil(target_size * factor)
+                    for factor in _AUTO_MAX_SIZE_FACTORS
+                ),
+                key=error,
+            )
+    if max_depth is None:
+        max_depth = 1
+    if max_size is None:
+        max_size = target_size
+
+    scale = _min_scale(x_min, x_max, y_min, y_max, max_depth)
+    if not scale > 0:
+        # Every point is at the same position
+        scale = 1.0
+    return {
+        "x_min": x_min,
+        "x_max": x_max,
+        "y_min": y_min,
+        "y_max": y_max,
+        "scale": scale,
+        "max_depth": max_depth,
+        "max_size": max_size,
+    }
+
 
 def quadtree_on_points(
-    points: GeoSeries, x_min, x_max, y_min, y_max, scale, max_depth, max_size
+    points: GeoSeries,
+    x_min=None,
+    x_max=None,
+    y_min=None,
+    y_max=None,
+    scale=None,
+    max_depth=None,
+    max_size=None,
+    auto=False,
+    target_size=None,
 ):
     """
     Construct a quadtree from a set of points for a given area-of-interest
@@ -38,10 +189,19 @@ def quadtree_on_points(
     max_size
         Maximum number of points allowed in a node before it's split into
         4 leaf nodes.
+    auto : bool, default False
+        Choose the parameters that are not given from a sample of the
+        points, see Notes. The area of interest defaults to the bounds of
+        the points and the scale to the minimum scale of `max_depth`.
+    target_size : int, optional
+        The mean number of points per leaf that ``auto=True`` aims for.
+        Defaults to the square root of the number of points, between 32
+        and 1024.
 
     Returns
     -------
-    result : tuple (cudf.Series, cudf.DataFrame)
+    result : tuple (cudf.Series, cudf.DataFrame) or (cudf.Series, \
+cudf.DataFrame, dict)
         keys_to_points  : cudf.Series(dtype=np.int32)
             A column of sorted keys to original point indices
         quadtree        : cudf.DataFrame
@@ -67,6 +227,11 @@ def quadtree_on_points(
 
                 Otherwise this column's value is the position of the leaf
                 quadrant's first point.
+        parameters      : dict
+            Only returned with ``auto=True``. The ``x_min``, ``x_max``,
+            ``y_min``, ``y_max``, ``scale``, ``max_depth`` and ``max_size``
+            the quadtree was built with, which can be passed back to
+            `quadtree_on_points` to build the same quadtree.
 
     Notes
     -----
@@ -81,6 +246,11 @@ def quadtree_on_points(
     * All intermediate quadtree nodes will have fewer than `max_size` number of
       points. Leaf nodes are permitted (but not guaranteed) to have >=
       `max_size` number of points.
+    * With ``auto=True``, `max_depth` is the smallest depth at which the
+      densest cell of the sample holds at most `target_size` points, so that
+      few leaves exceed `max_size` on clustered data. `max_size` is the
+      multiple of `target_size` that brings the mean leaf size of the
+      quadtree of the sample nearest to `target_size`.
 
     Examples
     --------
@@ -154,11 +324,47 @@ def quadtree_on_points(
         118     98
         119     24
         Length: 120, dtype: int32
+
+    Or let the parameters be picked from a sample of the points::
+
+        >>> key_to_point, quadtree, parameters = cuspatial.quadtree_on_points(
+                cuspatial.GeoSeries.from_points_xy(
+                    points.interleave_columns()
+                ),
+                auto=True,
+            )
+        >>> sorted(parameters)
+        ['max_depth', 'max_size', 'scale', 'x_max', 'x_min', 'y_max', 'y_min']
     """
 
     if not len(points) == 0 and not contains_only_points(points):
         raise ValueError("GeoSeries must contain only points.")
 
+    parameters = None
+    if auto:
+        parameters = _auto_parameters(
+            points,
+            x_min,
+            x_max,
+            y_min,
+            y_max,
+            max_depth,
+            max_size,
+            target_size,
+        )
+        if scale is not None:
+            parameters["scale"] = max(scale, parameters["scale"])
+        x_min, x_max = parameters["x_min"], parameters["x_max"]
+        y_min, y_max = parameters["y_min"], parameters["y_max"]
+        scale = parameters["scale"]
+        max_depth = parameters["max_depth"]
+        max_size = parameters["max_size"]
+    elif None in (x_min, x_max, y_min, y_max, scale, max_depth, max_size):
+        raise ValueError(
+            "x_min, x_max, y_min, y_max, scale, max_depth and max_size are "
+            "required unless auto=True"
+        )
+
     xs = as_column(points.points.x)
     ys = as_column(points.points.y)
 
@@ -169,7 +375,7 @@ def quadtree_on_points(
         max(y_min, y_max),
     )
 
-    min_scale = max(x_max - x_min, y_max - y_min) / ((1 << max_depth) + 2)
+    min_scale = _min_scale(x_min, x_max, y_min, y_max, max_depth)
     if scale < min_scale:
         warnings.warn(
             "scale {} is less than required minimum ".format(scale)
@@ -187,4 +393,158 @@ def quadtree_on_points(
         max_depth,
         max_size,
     )
-    return Series(key_to_point), DataFrame._from_data(*quadtree)
+    result = Series(key_to_point), DataFrame._from_data(*quadtree)
+    if parameters is not None:
+        return result + (parameters,)
+    return result
+
+
+def quadtree_stats(quadtree, max_size=None, point_indices=None):
+    """
+    Summarize the shape of a quadtree built by `quadtree_on_points`.
+
+    Parameters
+    ----------
+    quadtree : cudf.DataFrame
+        The quadtree, as returned by `quadtree_on_points`.
+    max_size : int, optional
+        The ``max_size`` the quadtree was built with, to count the leaves
+        that exceed it.
+    point_indices : cudf.Series, optional
+        The sorted point indices returned with the quadtree, to include
+        them in the memory footprint.
+
+    Returns
+    -------
+    result : dict
+        depth : cudf.DataFrame
+            The number of ``nodes``, ``leaves`` and leaf ``points`` of each
+            level, indexed by level.
+        leaf_size : cudf.Series
+            The count, mean, standard deviation, minimum, median, 90th and
+            99th percentiles and maximum of the number of points per leaf.
+        oversize_leaves : int or None
+            The number of leaves with more than `max_size` points, or None
+            if `max_size` is not given. Leaves on the last level are not
+            split, see `quadtree_on_points`.
+        empty_quadrant_ratio : float
+            The fraction of the four quadrants of the root and of each
+            internal node that hold no point.
+        memory_usage : int
+            The number of bytes of the quadtree, and of `point_indices` if
+            given.
+
+    Examples
+    --------
+    >>> point_indices, quadtree = cuspatial.quadtree_on_points(
+    ...     points, 0, 10, 0, 10, 1, 3, 4
+    ... )
+    >>> stats = cuspatial.quadtree_stats(quadtree, 4, point_indices)
+    >>> stats["depth"]
+           nodes  leaves  points
+    level
+    0          4       3      10
+    1          4       4       7
+    """
+    is_leaf = ~quadtree["is_internal_node"].values
+    lengths = quadtree["length"].values.astype(np.int64)
+    levels = quadtree["level"].values
+
+    depth = (
+        DataFrame(
+            {
+                "level": levels,
+                "nodes": cp.ones(len(quadtree), dtype=np.int64),
+                "leaves": is_leaf.astype(np.int64),
+                "points": cp.where(is_leaf, lengths, 0),
+            }
+        )
+        .groupby("level")
+        .sum()
+        .sort_index()
+    )
+    leaf_size = Series(lengths[is_leaf]).describe(percentiles=[0.5, 0.9, 0.99])
+
+    oversize_leaves = None
+    if max_size is not None:
+        oversize_leaves = int((lengths[is_leaf] > max_size).sum())
+
+    # Quadrants of the root and of the internal nodes that have a child
+    num_parents = 1 + int((~is_leaf).sum())
+    num_children = int((levels == 0).sum()) + int(lengths[~is_leaf].sum())
+    empty_quadrant_ratio = (
+        1 - num_children / (4 * num_parents) if len(quadtree) else 0.0
+    )
+
+    memory_usage = int(quadtree.memory_usage().sum())
+    if point_indices is not None:
+        memory_usage += int(point_indices.memory_usage())
+
+    return {
+        "depth": depth,
+        "leaf_size": leaf_size,
+        "oversize_leaves": oversize_leaves,
+        "empty_quadrant_ratio": empty_quadrant_ratio,
+        "memory_usage": memory_usage,
+    }
+
+
+def quadtree_join_stats(quadtree, pairs, hits=None, num_queries=None):
+    """
+    Count the candidates of each query of a quadtree join.
+
+    Parameters
+    ----------
+    quadtree : cudf.DataFrame
+        The quadtree, as returned by `quadtree_on_points`.
+    pairs : cudf.DataFrame
+        The ``bbox_offset`` and ``quad_offset`` pairs, as returned by
+        `join_quadtree_and_bounding_boxes`.
+    hits : cudf.Series, optional
+        The query of each true hit of the join, such as the
+        ``polygon_index`` column of `quadtree_point_in_polygon`.
+    num_queries : int, optional
+        The number of bounding boxes joined. Defaults to one more than the
+        largest query in `pairs` and `hits`.
+
+    Returns
+    -------
+    result : cudf.DataFrame
+        One row per query, with the number of leaf quadrant ``pairs`` and of
+        ``candidates`` points in them, and the number of ``hits`` if given.
+
+    Examples
+    --------
+    >>> bboxes = cuspatial.polygon_bounding_boxes(polygons)
+    >>> pairs = cuspatial.join_quadtree_and_bounding_boxes(
+    ...     quadtree, bboxes, 0, 10, 0, 10, 1, 3
+    ... )
+    >>> hits = cuspatial.quadtree_point_in_polygon(
+    ...     pairs, quadtree, point_indices, points, polygons
+    ... )
+    >>> stats = cuspatial.quadtree_join_stats(
+    ...     quadtree, pairs, hits["polygon_index"], len(bboxes)
+    ... )
+    >>> stats["hits"].sum() / stats["candidates"].sum()
+    """
+    queries = pairs["bbox_offset"].values.astype(np.int64)
+    lengths = quadtree["length"].values.astype(np.int64)
+    candidates = lengths[pairs["quad_offset"].values]
+    if hits is not None:
+        hits = Series(hits).values.astype(np.int64)
+
+    if num_queries is None:
+        num_queries = 0
+        for query in (queries, hits):
+            if query is not None and len(query):
+                num_queries = max(num_queries, int(query.max()) + 1)
+
+    result = {
+        "pairs": cp.bincount(queries, minlength=num_queries),
+        "candidates": cp.bincount(
+            queries, weights=candidates, minlength=num_queries
+        ).astype(np.int64),
+    }
+    if hits is not None:
+        result["hits"] = cp.bincount(hits, minlength=num_queries)
+    return DataFrame(result)
@@ -14,6 +14,7 @@ from cuspatial.utils.column_utils import (
     contains_only_linestrings,
     contains_only_points,
     contains_only_polygons,
+    promote_coord_dtypes,
 )
 from cuspatial.utils.join_utils import pip_bitmap_column_to_binary_array
 
@@ -60,6 +61,7 @@ def point_in_polygon(points: GeoSeries, polygons: GeoSeries):
         A DataFrame of boolean values indicating whether each point falls
         within each polygon.
     """
+    points, polygons = promote_coord_dtypes(points, polygons)
 
     if len(polygons) == 0:
         return DataFrame()
@@ -205,6 +207,7 @@ def quadtree_point_in_polygon(
             Index of contained point. This index refers to ``point_indices``,
             so it is an index to an index.
     """
+    points, polygons = promote_coord_dtypes(points, polygons)
 
     if not contains_only_points(points):
         raise ValueError(
@@ -280,6 +283,7 @@ def quadtree_point_to_nearest_linestring(
         distance : cudf.Series
             Distance between point and its nearest linestring.
     """
+    points, linestrings = promote_coord_dtypes(points, linestrings)
 
     if not contains_only_points(points):
         raise ValueError(
@@ -1,14 +1,18 @@
 import cupy as cp
 
+import cudf
 from cudf.core.column import as_column
 
 import cuspatial._lib.nearest_points as nearest_points
 from cuspatial.core._column.geocolumn import GeoColumn
+from cuspatial.core._column.geometa import Feature_Enum
 from cuspatial.core.geodataframe import GeoDataFrame
 from cuspatial.core.geoseries import GeoSeries
+from cuspatial.io.geopandas_reader import NONE_OFFSET
 from cuspatial.utils.column_utils import (
     contains_only_linestrings,
     contains_only_points,
+    promote_coord_dtypes,
 )
 
 
@@ -42,13 +46,28 @@ def pairwise_point_linestring_nearest_points(
           contains the nearest point.
         - "geometry" contains the points of the nearest
           point on the linestring.
+
+        Rows where `points` or `linestrings` is null are null in every
+        column.
     """
+    points, linestrings = promote_coord_dtypes(points, linestrings)
 
     if len(points) != len(linestrings):
         raise ValueError(
             "The inputs should have the same number of geometries"
         )
 
+    if points._column.has_nulls() or linestrings._column.has_nulls():
+        valid = (
+            points._column._meta.valid.values
+            & linestrings._column._meta.valid.values
+        )
+        positions = cp.flatnonzero(valid)
+        result = pairwise_point_linestring_nearest_points(
+            points.iloc[positions], linestrings.iloc[positions]
+        )
+        return _scatter_nearest_points(result, positions, valid)
+
     if len(points) == 0:
         data = {
             "point_geometry_id": [],
@@ -110,3 +129,34 @@ def pairwise_point_linestring_nearest_points(
     }
 
     return GeoDataFrame._from_data(data)
+
+
+def _scatter_nearest_points(result, positions, valid):
+    """Place the rows of `result`, computed for the rows `positions` of
+    the inputs, at these positions of a GeoDataFrame of `len(valid)` rows
+    whose other rows are null.
+    """
+    size = len(valid)
+    data = {}
+    for name in ("point_geometry_id", "linestring_geometry_id", "segment_id"):
+        values = cp.zeros(size, dtype=cp.int32)
+        values[positions] = cudf.Series(result[name]).values
+        data[name] = cudf.Series(values).mask(~valid)
+
+    geometry = result["geometry"]._column
+    input_types = cp.full(size, Feature_Enum.NONE.value, dtype=cp.int8)
+    input_types[positions] = Feature_Enum.POINT.value
+    union_offsets = cp.full(size, NONE_OFFSET, dtype=cp.int32)
+    union_offsets[positions] = cp.arange(len(positions), dtype=cp.int32)
+    data["geometry"] = GeoSeries(
+        GeoColumn(
+            (
+                geometry.points,
+                geometry.mpoints,
+                geometry.lines,
+                geometry.polygons,
+            ),
+            {"input_types": input_types, "union_offsets": union_offsets},
+        )
+    )
+    return GeoDataFrame._from_data(data)
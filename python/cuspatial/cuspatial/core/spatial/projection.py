@@ -1,16 +1,16 @@
 # Copyright (c) 2022, NVIDIA CORPORATION.
 
-from cudf import DataFrame
+from cudf import DataFrame, Series
 
 from cuspatial._lib.spatial import (
     sinusoidal_projection as cpp_sinusoidal_projection,
 )
 from cuspatial.core.geoseries import GeoSeries
 from cuspatial.utils.column_utils import (
-    contain_single_type_geometry,
     contains_only_multipoints,
     contains_only_points,
 )
+from cuspatial.utils.mixed_utils import map_coordinates
 
 
 def sinusoidal_projection(origin_lon, origin_lat, lonlat: GeoSeries):
@@ -33,8 +33,8 @@ def sinusoidal_projection(origin_lon, origin_lat, lonlat: GeoSeries):
         latitude offset (this is subtracted from each input before
         converting to x,y)
     lonlat: GeoSeries
-        A GeoSeries of Points that contains the longitude and latitude
-        to transform
+        A GeoSeries of the longitude and latitude to transform. It may
+        contain any geometry types, including a mix of them.
 
     Returns
     -------
@@ -42,19 +42,15 @@ def sinusoidal_projection(origin_lon, origin_lat, lonlat: GeoSeries):
         A GeoSeries that contains the transformed coordinates.
     """
 
-    if contain_single_type_geometry(lonlat):
-        if not contains_only_points(lonlat) or contains_only_multipoints(
-            lonlat
-        ):
-            raise ValueError("`lonlat` must contain only POINTS geometry.")
-
-    result = cpp_sinusoidal_projection(
-        origin_lon,
-        origin_lat,
-        lonlat.points.x._column,
-        lonlat.points.y._column,
-    )
-    lonlat_transformed = DataFrame(
-        {"x": result[0], "y": result[1]}
-    ).interleave_columns()
+    def transform(lon, lat):
+        x, y = cpp_sinusoidal_projection(
+            origin_lon, origin_lat, lon._column, lat._column
+        )
+        return Series(x), Series(y)
+
+    if not contains_only_points(lonlat) or contains_only_multipoints(lonlat):
+        return map_coordinates(lonlat, transform)
+
+    x, y = transform(lonlat.points.x, lonlat.points.y)
+    lonlat_transformed = DataFrame({"x": x, "y": y}).interleave_columns()
     return GeoSeries.from_points_xy(lonlat_transformed)
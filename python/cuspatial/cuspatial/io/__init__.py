@@ -0,0 +1,4 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+from cuspatial.io.soa import read_soa_points, read_soa_polygons
+from cuspatial.io.streaming import iter_batches
@@ -1,13 +1,25 @@
-# Copyright (c) 2020-2022, NVIDIA CORPORATION.
+# Copyright (c) 2020-2023, NVIDIA CORPORATION.
 
 import pandas as pd
 from geopandas import GeoDataFrame as gpGeoDataFrame
 from geopandas.geoseries import GeoSeries as gpGeoSeries
 
 from cuspatial import GeoDataFrame, GeoSeries
+from cuspatial.core._column.geocolumn import GeoColumn
+from cuspatial.core._column.geometa import GeoMeta
+from cuspatial.core.geodataframe import is_geometry_type
+from cuspatial.io.geopandas_reader import GeoPandasReader
+from cuspatial.utils.column_utils import validate_coord_dtype
 
 
-def from_geopandas(gpdf):
+def _to_geocolumn(gs, coord_dtype, max_error):
+    adapter = GeoPandasReader(gs, coord_dtype, max_error)
+    return GeoColumn(
+        adapter._get_geotuple(), GeoMeta(adapter.get_geopandas_meta())
+    )
+
+
+def from_geopandas(gpdf, coord_dtype=None, max_error=None):
     """
     Converts a geopandas mixed geometry dataframe into a cuspatial geometry
     dataframe.
@@ -16,11 +28,36 @@ def from_geopandas(gpdf):
 
     - :class:`geopandas.GeoSeries`
     - :class:`geopandas.GeoDataFrame`
+
+    Parameters
+    ----------
+    gpdf : geopandas.GeoSeries or geopandas.GeoDataFrame
+    coord_dtype : {"float32", "float64"}, optional
+        The dtype of the coordinates of the result, float64 by default. The
+        coordinates are cast on host, before they are copied to the device.
+        See `GeoSeries.astype_coords`.
+    max_error : float, optional
+        When narrowing, raise ValueError if any coordinate moves by more
+        than `max_error`. Coordinates that overflow float32 always raise.
     """
+    coord_dtype = validate_coord_dtype(coord_dtype)
     if isinstance(gpdf, gpGeoSeries):
-        return GeoSeries(gpdf)
+        return GeoSeries(
+            _to_geocolumn(gpdf, coord_dtype, max_error), index=gpdf.index
+        )
     elif isinstance(gpdf, gpGeoDataFrame):
-        return GeoDataFrame(gpdf)
+        if coord_dtype is None:
+            return GeoDataFrame(gpdf)
+        result = GeoDataFrame()
+        result.index = gpdf.index
+        for name in gpdf.columns:
+            if is_geometry_type(gpdf[name]):
+                result._data[name] = _to_geocolumn(
+                    gpdf[name], coord_dtype, max_error
+                )
+            else:
+                result._data[name] = gpdf[name]
+        return result
     elif isinstance(gpdf, pd.Series):
         raise TypeError("Mixed pandas/geometry types not supported yet.")
     else:
@@ -1,98 +1,172 @@
-# Copyright (c) 2020-2022 NVIDIA CORPORATION.
+# Copyright (c) 2020-2023 NVIDIA CORPORATION.
 
+import numpy as np
+import pyarrow as pa
+import shapely
 from geopandas import GeoSeries as gpGeoSeries
-from shapely.geometry import (
-    LineString,
-    MultiLineString,
-    MultiPoint,
-    MultiPolygon,
-    Point,
-    Polygon,
-    mapping,
-)
+from shapely import GeometryType
 
 import cudf
 
 from cuspatial.core._column.geometa import Feature_Enum
 from cuspatial.io import pygeoarrow
+from cuspatial.utils.column_utils import cast_coords
 
 NONE_OFFSET = -1
 
+# Maps `shapely.get_type_id` results (shifted by one so that missing
+# geometries at -1 land on index 0) onto the union type codes. Single and
+# multi variants of linestrings and polygons share one union child.
+_FEATURE_OF_SHAPELY_TYPE = np.array(
+    [
+        Feature_Enum.NONE.value,  # MISSING
+        Feature_Enum.POINT.value,  # POINT
+        Feature_Enum.LINESTRING.value,  # LINESTRING
+        Feature_Enum.NONE.value,  # LINEARRING, rejected below
+        Feature_Enum.POLYGON.value,  # POLYGON
+        Feature_Enum.MULTIPOINT.value,  # MULTIPOINT
+        Feature_Enum.LINESTRING.value,  # MULTILINESTRING
+        Feature_Enum.POLYGON.value,  # MULTIPOLYGON
+        Feature_Enum.NONE.value,  # GEOMETRYCOLLECTION, rejected below
+    ],
+    dtype=np.int8,
+)
+
+
+def _single_geometry_offset(count: int) -> np.ndarray:
+    return np.arange(count + 1, dtype=np.int32)
+
+
+def _empty(feature: Feature_Enum, coord_dtype) -> pa.ListArray:
+    coord_type = pa.from_numpy_dtype(np.dtype(coord_dtype or np.float64))
+    return pa.array([], type=pygeoarrow.union_child_type(feature, coord_type))
 
-def parse_geometries(geoseries: gpGeoSeries) -> tuple:
-    point_coords = []
-    mpoint_coords = []
-    line_coords = []
-    polygon_coords = []
-    all_offsets = []
-    type_buffer = []
-    point_offsets = [0]
-    mpoint_offsets = [0]
-    line_offsets = [0]
-    polygon_offsets = [0]
-
-    for geom in geoseries:
-        if geom is None:
-            all_offsets.append(NONE_OFFSET)
-            type_buffer.append(Feature_Enum.NONE.value)
-            continue
-        coords = mapping(geom)["coordinates"]
-        if isinstance(geom, Point):
-            point_coords.append(coords)
-            all_offsets.append(point_offsets[-1])
-            point_offsets.append(point_offsets[-1] + 1)
-            type_buffer.append(Feature_Enum.POINT.value)
-        elif isinstance(geom, MultiPoint):
-            mpoint_coords.append(coords)
-            all_offsets.append(mpoint_offsets[-1])
-            mpoint_offsets.append(mpoint_offsets[-1] + 1)
-            type_buffer.append(Feature_Enum.MULTIPOINT.value)
-        elif isinstance(geom, LineString):
-            line_coords.append([coords])
-            all_offsets.append(line_offsets[-1])
-            line_offsets.append(line_offsets[-1] + 1)
-            type_buffer.append(Feature_Enum.LINESTRING.value)
-        elif isinstance(geom, MultiLineString):
-            line_coords.append(coords)
-            all_offsets.append(line_offsets[-1])
-            line_offsets.append(line_offsets[-1] + 1)
-            type_buffer.append(Feature_Enum.LINESTRING.value)
-        elif isinstance(geom, Polygon):
-            polygon_coords.append([coords])
-            all_offsets.append(polygon_offsets[-1])
-            polygon_offsets.append(polygon_offsets[-1] + 1)
-            type_buffer.append(Feature_Enum.POLYGON.value)
-        elif isinstance(geom, MultiPolygon):
-            polygon_coords.append(coords)
-            all_offsets.append(polygon_offsets[-1])
-            polygon_offsets.append(polygon_offsets[-1] + 1)
-            type_buffer.append(Feature_Enum.POLYGON.value)
-        else:
-            raise TypeError(type(geom))
-    return (
-        type_buffer,
-        all_offsets,
-        point_coords,
-        mpoint_coords,
-        line_coords,
-        polygon_coords,
+
+def _parse_points(geoms: np.ndarray, coord_dtype, max_error) -> pa.ListArray:
+    if len(geoms) == 0:
+        return _empty(Feature_Enum.POINT, coord_dtype)
+    _, coords, _ = shapely.to_ragged_array(geoms, include_z=False)
+    coords = cast_coords(coords, coord_dtype, max_error)
+    return pygeoarrow.from_ragged_array(coords, ())
+
+
+def _parse_multipoints(
+    geoms: np.ndarray, coord_dtype, max_error
+) -> pa.ListArray:
+    if len(geoms) == 0:
+        return _empty(Feature_Enum.MULTIPOINT, coord_dtype)
+    _, coords, offsets = shapely.to_ragged_array(geoms, include_z=False)
+    coords = cast_coords(coords, coord_dtype, max_error)
+    return pygeoarrow.from_ragged_array(coords, offsets)
+
+
+def _parse_linestrings(
+    geoms: np.ndarray, coord_dtype, max_error
+) -> pa.ListArray:
+    if len(geoms) == 0:
+        return _empty(Feature_Enum.LINESTRING, coord_dtype)
+    geometry_type, coords, offsets = shapely.to_ragged_array(
+        geoms, include_z=False
     )
+    coords = cast_coords(coords, coord_dtype, max_error)
+    # LineStrings are stored as single-part MultiLineStrings
+    if geometry_type == GeometryType.LINESTRING:
+        offsets = (*offsets, _single_geometry_offset(len(geoms)))
+    return pygeoarrow.from_ragged_array(coords, offsets)
+
+
+def _parse_polygons(geoms: np.ndarray, coord_dtype, max_error) -> pa.ListArray:
+    if len(geoms) == 0:
+        return _empty(Feature_Enum.POLYGON, coord_dtype)
+    geometry_type, coords, offsets = shapely.to_ragged_array(
+        geoms, include_z=False
+    )
+    coords = cast_coords(coords, coord_dtype, max_error)
+    # Polygons are stored as single-part MultiPolygons
+    if geometry_type == GeometryType.POLYGON:
+        offsets = (*offsets, _single_geometry_offset(len(geoms)))
+    return pygeoarrow.from_ragged_array(coords, offsets)
+
+
+_FEATURE_PARSERS = {
+    Feature_Enum.POINT: _parse_points,
+    Feature_Enum.MULTIPOINT: _parse_multipoints,
+    Feature_Enum.LINESTRING: _parse_linestrings,
+    Feature_Enum.POLYGON: _parse_polygons,
+}
+
+
+def parse_geometries(
+    geoseries: gpGeoSeries, coord_dtype=None, max_error=None
+) -> tuple:
+    """Split a GeoPandas GeoSeries into the buffers of a GeoArrow union.
+
+    Each geometry family is selected with a type mask and exported in bulk
+    with `shapely.to_ragged_array`, so no Python work is done per row. z
+    coordinates are dropped, and the coordinates are cast to `coord_dtype`,
+    if given, with the checks of `cast_coords`.
+
+    Returns
+    -------
+    result : tuple
+        The union type codes, the union offsets and the point, multipoint,
+        linestring and polygon children as `pyarrow.ListArray`.
+    """
+    geoms = np.asarray(geoseries.values, dtype=object)
+    shapely_types = shapely.get_type_id(geoms)
+    unsupported = np.isin(
+        shapely_types,
+        [GeometryType.LINEARRING, GeometryType.GEOMETRYCOLLECTION],
+    )
+    if unsupported.any():
+        raise TypeError(type(geoms[np.argmax(unsupported)]))
+
+    type_buffer = _FEATURE_OF_SHAPELY_TYPE[shapely_types + 1]
+    all_offsets = np.full(len(geoms), NONE_OFFSET, dtype=np.int32)
+    children = []
+    for feature, parse in _FEATURE_PARSERS.items():
+        mask = type_buffer == feature.value
+        all_offsets[mask] = np.arange(np.count_nonzero(mask), dtype=np.int32)
+        children.append(parse(geoms[mask], coord_dtype, max_error))
+    return (type_buffer, all_offsets, *children)
 
 
 class GeoPandasReader:
     buffers = None
     source = None
 
-    def __init__(self, geoseries: gpGeoSeries):
+    def __init__(
+        self, geoseries: gpGeoSeries, coord_dtype=None, max_error=None
+    ):
         """
-        GeoPandasReader copies a GeoPandas GeoSeries object iteratively into
-        a set of arrays: points, multipoints, lines, and polygons.
+        GeoPandasReader copies a GeoPandas GeoSeries object into a set of
+        arrays: points, multipoints, lines, and polygons.
 
         Parameters
         ----------
         geoseries : A GeoPandas GeoSeries
+        coord_dtype : {"float32", "float64"}, optional
+            The dtype of the coordinates, float64 by default. The cast is
+            done on host.
+        max_error : float, optional
+            See `GeoSeries.astype_coords`.
         """
-        self.buffers = pygeoarrow.from_lists(*parse_geometries(geoseries))
+        (
+            type_buffer,
+            all_offsets,
+            point_coords,
+            mpoint_coords,
+            line_coords,
+            polygon_coords,
+        ) = parse_geometries(geoseries, coord_dtype, max_error)
+        self.buffers = pygeoarrow.from_pyarrow_lists(
+            pa.array(type_buffer),
+            pa.array(all_offsets),
+            point_coords,
+            mpoint_coords,
+            line_coords,
+            polygon_coords,
+        )
 
     def _get_geotuple(self) -> cudf.Series:
         """
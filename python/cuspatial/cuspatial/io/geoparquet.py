@@ -0,0 +1,493 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import json
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import shapely
+
+import cudf
+
+from cuspatial.core._column.geometa import Feature_Enum
+from cuspatial.core.geodataframe import GeoDataFrame
+from cuspatial.core.geoseries import GeoSeries
+from cuspatial.io import pygeoarrow
+
+BBOX_KEYS = ("xmin", "ymin", "xmax", "ymax")
+
+
+def read_geoparquet(
+    path, columns=None, bbox=None, coord_dtype=None, max_error=None
+):
+    """Read a GeoParquet file into a GeoDataFrame.
+
+    Geometry columns encoded as WKB or as native GeoArrow arrays are decoded
+    from their Arrow buffers into GeoSeries. Non-geometry columns are copied
+    to the device unchanged.
+
+    Parameters
+    ----------
+    path : str or file-like
+        Path to the GeoParquet file.
+    columns : list of str, optional
+        Names of the columns to read. All columns are read if omitted.
+    bbox : tuple of float, optional
+        Query window ``(xmin, ymin, xmax, ymax)``. Row groups whose bounding
+        box statistics do not intersect the window are not read. When the
+        primary geometry column has a bbox covering column, rows whose box
+        does not intersect the window are also dropped.
+    coord_dtype : {"float32", "float64"}, optional
+        The dtype of the coordinates of the geometry columns. By default
+        native columns keep their stored dtype and WKB is read as float64.
+        Narrowing is checked for overflow, see `GeoSeries.astype_coords`.
+    max_error : float, optional
+        When narrowing, raise ValueError if any coordinate moves by more
+        than `max_error`.
+
+    Returns
+    -------
+    result : GeoDataFrame
+
+    Notes
+    -----
+    * Row group pruning requires the ``covering`` bbox columns described
+      by the GeoParquet 1.1 specification. Files without a covering can
+      only be pruned as a whole, using the file level ``bbox`` metadata.
+    * Only the xy dimensions of the coordinates are read.
+
+    Examples
+    --------
+    >>> gpdf = geopandas.GeoDataFrame(
+    ...     {"id": [0, 1]},
+    ...     geometry=[Point(0, 0), Point(10, 10)],
+    ... )
+    >>> gpdf.to_parquet("points.parquet")
+    >>> cuspatial.read_geoparquet("points.parquet", columns=["geometry"])
+                        geometry
+    0    POINT (0.00000 0.00000)
+    1  POINT (10.00000 10.00000)
+    (GPU)
+    """
+    parquet_file = pq.ParquetFile(path)
+    geo_meta = _geo_metadata(parquet_file.schema_arrow)
+    geometry_columns = geo_meta["columns"]
+    primary = geo_meta.get("primary_column")
+    covering = _bbox_covering(geometry_columns.get(primary, {}))
+
+    read_columns = columns
+    if columns is not None and bbox is not None and covering is not None:
+        covering_column = covering["xmin"][0]
+        if covering_column not in columns:
+            read_columns = list(columns) + [covering_column]
+
+    row_groups = range(parquet_file.num_row_groups)
+    if bbox is not None:
+        row_groups = _prune_row_groups(
+            parquet_file.metadata,
+            geometry_columns.get(primary, {}),
+            covering,
+            bbox,
+        )
+    table = parquet_file.read_row_groups(
+        list(row_groups), columns=read_columns
+    )
+
+    if bbox is not None and covering is not None:
+        table = table.filter(_covering_intersects(table, covering, bbox))
+        if read_columns is not columns:
+            table = table.drop([covering["xmin"][0]])
+
+    return _table_to_geodataframe(
+        table, geometry_columns, coord_dtype, max_error
+    )
+
+
+def _geo_metadata(schema: pa.Schema) -> dict:
+    metadata = schema.metadata or {}
+    if b"geo" not in metadata:
+        raise ValueError("Missing GeoParquet 'geo' metadata.")
+    return json.loads(metadata[b"geo"])
+
+
+def _bbox_covering(column_meta: dict):
+    """Return the ``{"xmin": [...], ...}`` column paths of the bbox covering
+    of a geometry column, or None if it has no covering.
+    """
+    covering = column_meta.get("covering", {}).get("bbox")
+    if covering is None or not all(key in covering for key in BBOX_KEYS):
+        return None
+    return covering
+
+
+def _intersects(bounds, bbox) -> bool:
+    xmin, ymin, xmax, ymax = bounds
+    qxmin, qymin, qxmax, qymax = bbox
+    return not (xmin > qxmax or xmax < qxmin or ymin > qymax or ymax < qymin)
+
+
+def _prune_row_groups(metadata, column_meta, covering, bbox):
+    """Select the row groups that may contain geometries intersecting
+    `bbox`, using the min/max statistics of the covering columns.
+    """
+    all_row_groups = list(range(metadata.num_row_groups))
+    file_bounds = column_meta.get("bbox")
+    if file_bounds is not None and len(file_bounds) == 4:
+        if not _intersects(file_bounds, bbox):
+            return []
+    if covering is None:
+        return all_row_groups
+
+    column_index = {
+        metadata.schema.column(i).path: i for i in range(metadata.num_columns)
+    }
+    paths = {key: ".".join(covering[key]) for key in BBOX_KEYS}
+    if not all(path in column_index for path in paths.values()):
+        return all_row_groups
+
+    result = []
+    for i in all_row_groups:
+        row_group = metadata.row_group(i)
+        stats = {
+            key: row_group.column(column_index[path]).statistics
+            for key, path in paths.items()
+        }
+        if any(s is None or not s.has_min_max for s in stats.values()):
+            result.append(i)
+            continue
+        bounds = (
+            stats["xmin"].min,
+            stats["ymin"].min,
+            stats["xmax"].max,
+            stats["ymax"].max,
+        )
+        if _intersects(bounds, bbox):
+            result.append(i)
+    return result
+
+
+def _covering_field(table: pa.Table, path):
+    array = table.column(path[0]).combine_chunks()
+    for name in path[1:]:
+        array = array.flatten()[array.type.get_field_index(name)]
+    return array
+
+
+def _covering_intersects(table: pa.Table, covering, bbox):
+    qxmin, qymin, qxmax, qymax = bbox
+    xmin, ymin, xmax, ymax = (
+        _covering_field(table, covering[key]) for key in BBOX_KEYS
+    )
+    return pc.and_(
+        pc.and_(pc.less_equal(xmin, qxmax), pc.greater_equal(xmax, qxmin)),
+        pc.and_(pc.less_equal(ymin, qymax), pc.greater_equal(ymax, qymin)),
+    )
+
+
+def _table_to_geodataframe(
+    table: pa.Table, geometry_columns: dict, coord_dtype=None, max_error=None
+):
+    pandas_meta = table.schema.pandas_metadata or {}
+    index_columns = [
+        name
+        for name in pandas_meta.get("index_columns", [])
+        if isinstance(name, str) and name in table.column_names
+    ]
+
+    data = {}
+    for name in table.column_names:
+        array = table.column(name)
+        if name in geometry_columns:
+            encoding = geometry_columns[name].get("encoding", "WKB")
+            if encoding.upper() == "WKB":
+                data[name] = GeoSeries.from_wkb(
+                    array, coord_dtype=coord_dtype, max_error=max_error
+                )
+            else:
+                data[name] = GeoSeries._from_geoarrow_native(
+                    array,
+                    encoding.lower(),
+                    coord_dtype=coord_dtype,
+                    max_error=max_error,
+                )
+        else:
+            data[name] = cudf.Series.from_arrow(array)
+
+    index = None
+    if index_columns:
+        index = cudf.DataFrame(
+            {name: data.pop(name) for name in index_columns}
+        ).set_index(index_columns)
+        index = index.index
+        index.names = [
+            None if name.startswith("__index_level_") else name
+            for name in index_columns
+        ]
+    result = GeoDataFrame(data)
+    if index is not None:
+        result.index = index
+    return result
+
+
+# GeoParquet geometry type names of the shapely type ids, see
+# `shapely.GeometryType`.
+_GEOMETRY_TYPE_NAMES = {
+    0: "Point",
+    1: "LineString",
+    3: "Polygon",
+    4: "MultiPoint",
+    5: "MultiLineString",
+    6: "MultiPolygon",
+}
+
+_SHAPELY_TYPE_OF_ENCODING = {
+    "point": shapely.GeometryType.POINT,
+    "linestring": shapely.GeometryType.LINESTRING,
+    "polygon": shapely.GeometryType.POLYGON,
+    "multipoint": shapely.GeometryType.MULTIPOINT,
+    "multilinestring": shapely.GeometryType.MULTILINESTRING,
+    "multipolygon": shapely.GeometryType.MULTIPOLYGON,
+}
+
+
+def write_geoparquet(
+    gdf: GeoDataFrame,
+    path,
+    encoding="WKB",
+    sort_key=None,
+    index=None,
+    row_group_size=None,
+):
+    """Write a GeoDataFrame to a GeoParquet file.
+
+    Parameters
+    ----------
+    gdf : GeoDataFrame
+        The frame to write.
+    path : str or file-like
+        Destination of the file.
+    encoding : {"WKB", "geoarrow"}, default "WKB"
+        Encoding of the geometry columns. "geoarrow" writes native GeoArrow
+        arrays with separated coordinates and requires every geometry
+        column to hold a single geometry type (and its multi variant).
+    sort_key : {None, "morton"}, default None
+        If "morton", rows are sorted by the Morton code of the center of
+        their primary geometry bounding box before writing, so that each
+        row group covers a compact region.
+    index : bool, optional
+        Whether to write the index. By default only a non-default index is
+        written, unless `sort_key` reorders the rows: the index is then
+        always written, so that rows keep their labels.
+    row_group_size : int, optional
+        Maximum number of rows per row group.
+
+    Notes
+    -----
+    Each geometry column is written with a ``<name>_bbox`` struct column of
+    per-row ``xmin``, ``ymin``, ``xmax`` and ``ymax`` values, declared as
+    its bbox ``covering``. Parquet writes min/max statistics for these
+    columns in every row group, which `read_geoparquet` uses to prune row
+    groups outside a query window.
+    """
+    if encoding.upper() not in ("WKB", "GEOARROW"):
+        raise ValueError("encoding must be either 'WKB' or 'geoarrow'")
+    if sort_key not in (None, "morton"):
+        raise ValueError("sort_key must be either None or 'morton'")
+
+    geo_columns, data_columns = gdf._split_out_geometry_columns()
+    if len(geo_columns.columns) == 0:
+        raise ValueError("GeoDataFrame has no geometry column to write.")
+    if index is None and sort_key is not None:
+        # A RangeIndex is only stored as metadata, which would relabel the
+        # reordered rows.
+        index = True
+    data_table = data_columns.to_arrow(preserve_index=index)
+
+    geometry_arrays = {}
+    covering_arrays = {}
+    geometry_meta = {}
+    primary_bounds = None
+    for name in geo_columns.columns:
+        array, bounds, column_meta = _geometry_column_to_arrow(
+            geo_columns[name], encoding
+        )
+        covering_name = f"{name}_bbox"
+        geometry_arrays[name] = array
+        covering_arrays[covering_name] = pa.StructArray.from_arrays(
+            [pa.array(bounds[:, i]) for i in range(4)], list(BBOX_KEYS)
+        )
+        column_meta["covering"] = {
+            "bbox": {key: [covering_name, key] for key in BBOX_KEYS}
+        }
+        geometry_meta[name] = column_meta
+        if primary_bounds is None:
+            primary_bounds = bounds
+
+    # Keep the column order of `gdf`, followed by the covering columns and
+    # any index columns added by `to_arrow`.
+    columns = {
+        name: geometry_arrays[name]
+        if name in geometry_arrays
+        else data_table.column(name)
+        for name in gdf.columns
+    }
+    columns.update(covering_arrays)
+    for name in data_table.column_names:
+        if name not in columns:
+            columns[name] = data_table.column(name)
+    table = pa.table(columns)
+
+    if sort_key == "morton":
+        table = table.take(pa.array(_morton_order(primary_bounds)))
+
+    metadata = dict(data_table.schema.metadata or {})
+    metadata[b"geo"] = json.dumps(
+        {
+            "version": "1.1.0",
+            "primary_column": geo_columns.columns[0],
+            "columns": geometry_meta,
+        }
+    ).encode()
+    table = table.replace_schema_metadata(metadata)
+    pq.write_table(table, path, row_group_size=row_group_size)
+
+
+def _geometry_column_to_arrow(series: GeoSeries, encoding: str):
+    """Encode a GeoSeries for GeoParquet.
+
+    Returns the Arrow geometry array, an (n, 4) array of per-row bounds
+    that holds NaN for null rows, and the column metadata.
+    """
+    input_types = series._column._meta.input_types.values_host
+    union_offsets = series._column._meta.union_offsets.values_host
+    valid = input_types != Feature_Enum.NONE.value
+    if encoding.upper() == "WKB":
+        array = series.to_wkb()
+        bounds = np.full((len(input_types), 4), np.nan)
+        shapely_types = np.full(len(input_types), -1)
+        for feature in np.unique(input_types[valid]):
+            mask = input_types == feature
+            coords, *offsets = series._host_feature_buffers(
+                Feature_Enum(feature), union_offsets[mask]
+            )
+            bounds[mask] = _ragged_bounds(
+                coords, offsets, np.count_nonzero(mask)
+            )
+            shapely_types[mask] = _wkb_types(Feature_Enum(feature), offsets)
+        column_meta = {"encoding": "WKB"}
+    else:
+        features = np.unique(input_types[valid])
+        if len(features) > 1:
+            raise ValueError(
+                "Native GeoArrow encoding requires a single geometry type "
+                "per column, use encoding='WKB' for mixed geometries."
+            )
+        feature = (
+            Feature_Enum(features[0]) if len(features) else Feature_Enum.POINT
+        )
+        coords, *offsets = series._host_feature_buffers(
+            feature, union_offsets[valid]
+        )
+        native_encoding = pygeoarrow.native_encoding(feature, offsets)
+        if native_encoding in ("linestring", "polygon"):
+            offsets = offsets[:-1]
+
+        bounds = np.full((len(input_types), 4), np.nan)
+        bounds[valid] = _ragged_bounds(
+            coords, offsets, np.count_nonzero(valid)
+        )
+        array = pygeoarrow.from_ragged_array_native(
+            *pygeoarrow.expand_nulls(coords, offsets, valid), mask=~valid
+        )
+        shapely_types = np.where(
+            valid, _SHAPELY_TYPE_OF_ENCODING[native_encoding], -1
+        )
+        column_meta = {"encoding": native_encoding}
+
+    column_meta["geometry_types"] = [
+        _GEOMETRY_TYPE_NAMES[t]
+        for t in np.unique(shapely_types)
+        if t in _GEOMETRY_TYPE_NAMES
+    ]
+    if not np.isnan(bounds).all():
+        column_meta["bbox"] = [
+            float(np.nanmin(bounds[:, 0])),
+            float(np.nanmin(bounds[:, 1])),
+            float(np.nanmax(bounds[:, 2])),
+            float(np.nanmax(bounds[:, 3])),
+        ]
+    return array, bounds, column_meta
+
+
+def _wkb_types(feature: Feature_Enum, offsets):
+    """Return the shapely type id `GeoSeries.to_wkb` writes for each row of
+    a feature. Rows with a single line or polygon are not Multi* types.
+    """
+    if feature == Feature_Enum.POINT:
+        return shapely.GeometryType.POINT
+    if feature == Feature_Enum.MULTIPOINT:
+        return shapely.GeometryType.MULTIPOINT
+    single_part = np.diff(offsets[-1]) == 1
+    if feature == Feature_Enum.LINESTRING:
+        return np.where(
+            single_part,
+            shapely.GeometryType.LINESTRING,
+            shapely.GeometryType.MULTILINESTRING,
+        )
+    return np.where(
+        single_part,
+        shapely.GeometryType.POLYGON,
+        shapely.GeometryType.MULTIPOLYGON,
+    )
+
+
+def _ragged_bounds(coords, offsets, num_rows):
+    """Compute per-row xmin, ymin, xmax, ymax of ragged coordinates. Empty
+    rows are NaN.
+    """
+    row_offsets = np.arange(num_rows + 1)
+    for offset in reversed(offsets):
+        row_offsets = offset[row_offsets]
+    starts = row_offsets[:-1]
+    nonempty = row_offsets[1:] > starts
+    bounds = np.full((num_rows, 4), np.nan)
+    if nonempty.any():
+        starts = starts[nonempty]
+        bounds[nonempty, 0] = np.minimum.reduceat(coords[:, 0], starts)
+        bounds[nonempty, 1] = np.minimum.reduceat(coords[:, 1], starts)
+        bounds[nonempty, 2] = np.maximum.reduceat(coords[:, 0], starts)
+        bounds[nonempty, 3] = np.maximum.reduceat(coords[:, 1], starts)
+    return bounds
+
+
+def _morton_order(bounds):
+    """Return the row order that sorts the centers of `bounds` along a
+    16-bit per axis Morton curve. Rows with NaN bounds are placed last.
+    """
+    centers = np.column_stack(
+        [
+            (bounds[:, 0] + bounds[:, 2]) / 2,
+            (bounds[:, 1] + bounds[:, 3]) / 2,
+        ]
+    )
+    valid = ~np.isnan(centers).any(axis=1)
+    keys = np.full(len(bounds), np.iinfo(np.uint64).max, dtype=np.uint64)
+    if valid.any():
+        lo = centers[valid].min(axis=0)
+        extent = np.maximum(
+            centers[valid].max(axis=0) - lo, np.finfo(np.float64).tiny
+        )
+        cells = ((centers[valid] - lo) / extent * 0xFFFF).astype(np.uint64)
+        keys[valid] = _part1by1(cells[:, 0]) | (_part1by1(cells[:, 1]) << 1)
+    return np.argsort(keys, kind="stable")
+
+
+def _part1by1(n):
+    """Spread the lower 16 bits of `n` to the even bit positions."""
+    n = n & np.uint64(0x0000FFFF)
+    n = (n | (n << np.uint64(8))) & np.uint64(0x00FF00FF)
+    n = (n | (n << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+    n = (n | (n << np.uint64(2))) & np.uint64(0x33333333)
+    n = (n | (n << np.uint64(1))) & np.uint64(0x55555555)
+    return n
@@ -0,0 +1,131 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+"""Persist GeoSeries and quadtrees in Arrow IPC files.
+
+A file holds a single record batch with one row. Each column wraps a whole
+buffer of the GeoSeries or quadtree in a one element list, so that arrays of
+different lengths share a container and every buffer can be memory mapped
+without copies when loading.
+"""
+
+import json
+
+import pyarrow as pa
+
+import cudf
+
+from cuspatial.core._column.geocolumn import GeoColumn
+from cuspatial.core.geoseries import GeoSeries
+
+FORMAT_VERSION = 1
+_METADATA_KEY = b"cuspatial"
+_CHILDREN = ("points", "mpoints", "lines", "polygons")
+
+
+def _wrap(array: pa.Array) -> pa.LargeListArray:
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    return pa.LargeListArray.from_arrays(
+        pa.array([0, len(array)], type=pa.int64()), array
+    )
+
+
+def save_geoseries(series: GeoSeries, path, quadtree=None):
+    """Write a GeoSeries, and optionally a quadtree built on its points, to
+    an Arrow IPC file. See `GeoSeries.save`.
+    """
+    column = series._column
+    arrays = {
+        "input_types": column._meta.input_types.to_arrow(),
+        "union_offsets": column._meta.union_offsets.to_arrow(),
+        "points": column.points.to_arrow(),
+        "mpoints": column.mpoints.to_arrow(),
+        "lines": column.lines.to_arrow(),
+        "polygons": column.polygons.to_arrow(),
+    }
+    metadata = {"version": FORMAT_VERSION, "name": series.name}
+    if isinstance(series.index, cudf.RangeIndex):
+        metadata["index"] = {
+            "start": series.index.start,
+            "stop": series.index.stop,
+            "step": series.index.step,
+            "name": series.index.name,
+        }
+    else:
+        arrays["index"] = series.index.to_arrow()
+        metadata["index"] = {"name": series.index.name}
+
+    if quadtree is not None:
+        point_indices, nodes = quadtree
+        arrays["point_indices"] = point_indices.to_arrow()
+        nodes = nodes.to_arrow(preserve_index=False)
+        arrays["quadtree"] = pa.StructArray.from_arrays(
+            [
+                nodes.column(name).combine_chunks()
+                for name in nodes.column_names
+            ],
+            nodes.column_names,
+        )
+
+    batch = pa.record_batch(
+        [_wrap(array) for array in arrays.values()],
+        names=list(arrays),
+        metadata={_METADATA_KEY: json.dumps(metadata)},
+    )
+    with pa.ipc.new_file(path, batch.schema) as writer:
+        writer.write_batch(batch)
+
+
+def load_geoseries(path, mmap=True, quadtree=False):
+    """Read a GeoSeries written by `save_geoseries`. See `GeoSeries.load`."""
+    source = pa.memory_map(str(path)) if mmap else pa.OSFile(str(path))
+    with source:
+        reader = pa.ipc.open_file(source)
+        metadata = reader.schema.metadata or {}
+        if _METADATA_KEY not in metadata:
+            raise ValueError(f"{path} was not written by GeoSeries.save")
+        metadata = json.loads(metadata[_METADATA_KEY])
+        if metadata["version"] > FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported GeoSeries file version {metadata['version']}"
+            )
+        batch = reader.get_batch(0)
+
+        def array(name):
+            return batch.column(batch.schema.get_field_index(name)).flatten()
+
+        column = GeoColumn(
+            tuple(cudf.Series.from_arrow(array(name)) for name in _CHILDREN),
+            {
+                "input_types": array("input_types"),
+                "union_offsets": array("union_offsets"),
+            },
+        )
+        index_meta = metadata["index"]
+        if "index" in batch.schema.names:
+            index = cudf.Index(
+                cudf.Series.from_arrow(array("index")),
+                name=index_meta["name"],
+            )
+        else:
+            index = cudf.RangeIndex(
+                index_meta["start"],
+                index_meta["stop"],
+                index_meta["step"],
+                name=index_meta["name"],
+            )
+        series = GeoSeries(column, index=index, name=metadata["name"])
+        if not quadtree:
+            return series
+
+        if "quadtree" not in batch.schema.names:
+            raise ValueError(f"{path} does not hold a quadtree")
+        nodes = array("quadtree")
+        nodes = cudf.DataFrame(
+            {
+                field.name: cudf.Series.from_arrow(child)
+                for field, child in zip(nodes.type, nodes.flatten())
+            }
+        )
+        point_indices = cudf.Series.from_arrow(array("point_indices"))
+        return series, (point_indices, nodes)
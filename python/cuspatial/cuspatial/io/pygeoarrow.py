@@ -1,8 +1,12 @@
-# Copyright (c) 2022, NVIDIA CORPORATION
+# Copyright (c) 2022-2023, NVIDIA CORPORATION
 
-from typing import List
+from typing import List, Sequence
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
+
+from cuspatial.core._column.geometa import Feature_Enum
 
 ArrowPolygonsType: pa.ListType = pa.list_(
     pa.list_(pa.list_(pa.list_(pa.float64())))
@@ -14,6 +18,27 @@ ArrowMultiPointsType: pa.ListType = pa.list_(pa.list_(pa.float64()))
 
 ArrowPointsType: pa.ListType = pa.list_(pa.float64())
 
+# Number of list levels of each union child, including the list of the two
+# coordinates of a point.
+_UNION_CHILD_DEPTH = {
+    Feature_Enum.POINT: 1,
+    Feature_Enum.MULTIPOINT: 2,
+    Feature_Enum.LINESTRING: 3,
+    Feature_Enum.POLYGON: 4,
+}
+
+
+def union_child_type(
+    feature: Feature_Enum, coord_type: pa.DataType = pa.float64()
+) -> pa.ListType:
+    """Return the type of the union child holding `feature`, e.g.
+    `ArrowPolygonsType` for the default float64 coordinates.
+    """
+    result = coord_type
+    for _ in range(_UNION_CHILD_DEPTH[feature]):
+        result = pa.list_(result)
+    return result
+
 
 def getGeoArrowUnionRootType() -> pa.union:
     return pa.union(
@@ -68,3 +93,252 @@ def from_lists(
         pa.array(line_coords, type=ArrowLinestringsType),
         pa.array(polygon_coords, type=ArrowPolygonsType),
     )
+
+
+def from_ragged_array(
+    coords: np.ndarray, offsets: Sequence[np.ndarray]
+) -> pa.ListArray:
+    """Build a nested coordinate list array from flat buffers.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        An (n, 2) array of xy coordinates.
+    offsets : sequence of np.ndarray
+        Offset arrays ordered from the innermost level (into the
+        coordinates) to the outermost level (one entry per geometry), as
+        returned by `shapely.to_ragged_array`.
+
+    Returns
+    -------
+    result : pa.ListArray
+        A list array with one list level per offset array wrapped around
+        a list of two coordinates per point. float32 coordinates are kept,
+        others become float64. Coordinate buffers are not copied when they
+        are already contiguous.
+    """
+    if coords.ndim != 2 or coords.shape[1] != 2:
+        raise ValueError(
+            f"Expected an (n, 2) array of xy coordinates, got shape "
+            f"{coords.shape}"
+        )
+    dtype = np.float32 if coords.dtype == np.float32 else np.float64
+    coords = np.ascontiguousarray(coords, dtype=dtype)
+    num_points = len(coords)
+    result = pa.ListArray.from_arrays(
+        pa.array(np.arange(0, num_points * 2 + 1, 2, dtype=np.int32)),
+        pa.array(coords.ravel()),
+    )
+    for offset in offsets:
+        result = pa.ListArray.from_arrays(
+            pa.array(np.asarray(offset, dtype=np.int32)), result
+        )
+    return result
+
+
+# Number of list levels above the coordinates for each GeoArrow native
+# encoding name.
+GEOARROW_ENCODING_DEPTH = {
+    "point": 0,
+    "linestring": 1,
+    "polygon": 2,
+    "multipoint": 1,
+    "multilinestring": 2,
+    "multipolygon": 3,
+}
+
+
+def _native_coords(points: pa.Array) -> np.ndarray:
+    """Return an (n, 2) array of the xy coordinates of a GeoArrow point
+    array, stored either as a struct of separated coordinates or as an
+    interleaved fixed size list.
+    """
+    if pa.types.is_struct(points.type):
+        fields = points.flatten()
+        x = fields[points.type.get_field_index("x")]
+        y = fields[points.type.get_field_index("y")]
+        return np.column_stack(
+            [
+                x.to_numpy(zero_copy_only=False),
+                y.to_numpy(zero_copy_only=False),
+            ]
+        )
+    dim = points.type.list_size
+    coords = points.flatten().to_numpy(zero_copy_only=False)
+    return coords.reshape(-1, dim)[:, :2]
+
+
+def to_ragged_array(array: pa.Array, encoding: str) -> tuple:
+    """Split a GeoArrow native array into coordinate and offset buffers.
+
+    Parameters
+    ----------
+    array : pa.Array
+        A GeoArrow native array, e.g. `geoarrow.polygon` storage.
+    encoding : str
+        One of the keys of `GEOARROW_ENCODING_DEPTH`.
+
+    Returns
+    -------
+    result : tuple
+        The (n, 2) coordinate array followed by the offset arrays of each
+        list level, innermost first. Offsets are rebased to start at zero.
+    """
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if isinstance(array, pa.ExtensionArray):
+        array = array.storage
+    offsets = []
+    for _ in range(GEOARROW_ENCODING_DEPTH[encoding]):
+        offset = array.offsets.to_numpy()
+        offsets.insert(0, offset - offset[0])
+        array = array.values.slice(int(offset[0]), int(offset[-1] - offset[0]))
+    return (_native_coords(array), *offsets)
+
+
+def from_ragged_array_native(
+    coords: np.ndarray,
+    offsets: Sequence[np.ndarray],
+    mask: np.ndarray = None,
+    interleaved: bool = False,
+) -> pa.Array:
+    """Build a GeoArrow native array from flat buffers.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        An (n, 2) array of xy coordinates.
+    offsets : sequence of np.ndarray
+        Offset arrays ordered from the innermost level to the outermost.
+    mask : np.ndarray, optional
+        Boolean array marking the null rows of the outermost level.
+    interleaved : bool, default False
+        Store points as a fixed size list of interleaved xy values instead
+        of a struct of separated x and y arrays. Interleaved coordinates
+        share the memory of a contiguous `coords`.
+
+    Returns
+    -------
+    result : pa.Array
+        An array of points if `offsets` is empty, otherwise nested list
+        arrays of points. float32 coordinates are kept, others become
+        float64.
+    """
+    dtype = np.float32 if coords.dtype == np.float32 else np.float64
+    coords = np.asarray(coords, dtype=dtype).reshape(-1, 2)
+    mask = None if mask is None else pa.array(mask, type=pa.bool_())
+    point_mask = mask if len(offsets) == 0 else None
+    if interleaved:
+        values = pa.array(np.ascontiguousarray(coords).ravel())
+        result = pa.FixedSizeListArray.from_arrays(
+            values, type=pa.list_(pa.field("xy", values.type), 2)
+        )
+        if point_mask is not None:
+            result = pa.Array.from_buffers(
+                result.type,
+                len(result),
+                [pc.invert(point_mask).buffers()[1]],
+                children=[values],
+            )
+    else:
+        result = pa.StructArray.from_arrays(
+            [pa.array(coords[:, 0]), pa.array(coords[:, 1])],
+            ["x", "y"],
+            mask=point_mask,
+        )
+    for level, offset in enumerate(offsets):
+        result = pa.ListArray.from_arrays(
+            pa.array(np.asarray(offset, dtype=np.int32)),
+            result,
+            mask=mask if level == len(offsets) - 1 else None,
+        )
+    return result
+
+
+def expand_nulls(coords: np.ndarray, offsets: Sequence[np.ndarray], valid):
+    """Insert empty placeholders for null rows into ragged buffers that
+    hold only the valid rows.
+    """
+    if len(offsets) == 0:
+        expanded = np.zeros((len(valid), 2), dtype=coords.dtype)
+        expanded[valid] = coords
+        return expanded, ()
+    sizes = np.zeros(len(valid), dtype=np.int64)
+    sizes[valid] = np.diff(offsets[-1])
+    outer = np.concatenate([[0], np.cumsum(sizes)])
+    return coords, (*offsets[:-1], outer)
+
+
+def native_encoding(feature: Feature_Enum, offsets: Sequence[np.ndarray]):
+    """Return the GeoArrow native encoding of a homogeneous geometry column
+    with the given host offsets. Lines and polygons use their single-part
+    encoding if no row has more than one part.
+    """
+    if feature == Feature_Enum.POINT:
+        return "point"
+    if feature == Feature_Enum.MULTIPOINT:
+        return "multipoint"
+    single_part = bool((np.diff(offsets[-1]) == 1).all())
+    if feature == Feature_Enum.LINESTRING:
+        return "linestring" if single_part else "multilinestring"
+    return "polygon" if single_part else "multipolygon"
+
+
+class GeoArrowType(pa.ExtensionType):
+    """Base of the `geoarrow.*` extension types, one subclass per encoding
+    in `GEOARROW_TYPES`.
+    """
+
+    encoding = None
+
+    def __init__(self, storage_type: pa.DataType):
+        super().__init__(storage_type, f"geoarrow.{self.encoding}")
+
+    def __arrow_ext_serialize__(self):
+        return b"{}"
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized):
+        return cls(storage_type)
+
+
+GEOARROW_TYPES = {
+    encoding: type(
+        f"GeoArrow{encoding.title()}Type",
+        (GeoArrowType,),
+        {"encoding": encoding},
+    )
+    for encoding in (*GEOARROW_ENCODING_DEPTH, "wkb")
+}
+
+
+def geoarrow_encoding(arrow_type: pa.DataType):
+    """Return the encoding of a `geoarrow.*` extension type, or None if
+    `arrow_type` is not one.
+
+    The types of `GEOARROW_TYPES` are not registered with pyarrow, so that
+    other GeoArrow implementations, e.g. geoarrow-pyarrow, can own the
+    `geoarrow.*` names. Their types are recognized by name.
+    """
+    return _encoding_of_name(getattr(arrow_type, "extension_name", ""))
+
+
+def geoarrow_field_encoding(field: pa.Field):
+    """Return the encoding of a field of a `geoarrow.*` extension type, or
+    None. Extension types that are not registered are read from files as
+    their storage, with the extension name kept in the field metadata.
+    """
+    encoding = geoarrow_encoding(field.type)
+    if encoding is None and field.metadata:
+        name = field.metadata.get(b"ARROW:extension:name", b"")
+        encoding = _encoding_of_name(name.decode())
+    return encoding
+
+
+def _encoding_of_name(name: str):
+    if not name.startswith("geoarrow."):
+        return None
+    encoding = name[len("geoarrow.") :]
+    if encoding not in GEOARROW_TYPES:
+        raise ValueError(f"Unsupported GeoArrow extension type {name}")
+    return encoding
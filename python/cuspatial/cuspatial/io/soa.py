@@ -0,0 +1,184 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+"""Readers for the structure-of-arrays files written by `data/json2soa.cpp`
+and `data/poly2soa.cpp`.
+
+The files are memory mapped and each buffer is copied to device once,
+straight from the mapping.
+"""
+
+import os
+
+import cupy as cp
+import numpy as np
+
+import cudf
+
+from cuspatial.utils.column_utils import cast_coords
+
+# `struct Time` of json2soa.cpp: two 32-bit words of bit fields, least
+# significant bits first.
+_TIME_FIELDS = {
+    "year": (0, 0, 6),
+    "month": (0, 6, 4),
+    "day": (0, 10, 5),
+    "hour": (0, 15, 5),
+    "minute": (0, 20, 6),
+    "second": (0, 26, 6),
+    "millisecond": (1, 12, 10),
+}
+
+
+def _memmap(path, dtype, offset=0, count=-1):
+    """Memory map `count` items of `dtype` starting at byte `offset`."""
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=count)
+
+
+def _days_from_civil(year, month, day):
+    """Days since 1970-01-01 of a proleptic Gregorian date, see
+    http://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    """
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + cp.where(month > 2, -3, 9)) + 2) // 5 + (
+        day - 1
+    )
+    day_of_era = (
+        year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    )
+    return era * 146097 + day_of_era - 719468
+
+
+def _decode_times(words: cp.ndarray) -> cudf.Series:
+    """Decode packed json2soa timestamps to datetime64[ms]."""
+    fields = {
+        name: (words[:, word] >> shift) & ((1 << width) - 1)
+        for name, (word, shift, width) in _TIME_FIELDS.items()
+    }
+    days = _days_from_civil(
+        fields["year"].astype(np.int64) + 2000,
+        fields["month"].astype(np.int64) + 1,
+        fields["day"].astype(np.int64),
+    )
+    milliseconds = (
+        ((days * 24 + fields["hour"]) * 60 + fields["minute"]) * 60
+        + fields["second"]
+    ) * 1000 + fields["millisecond"]
+    return cudf.Series(milliseconds.astype(np.int64)).astype("datetime64[ms]")
+
+
+def read_soa_points(path, coord_dtype=None, max_error=None):
+    """Read the object ids, timestamps and locations written by json2soa.
+
+    Parameters
+    ----------
+    path : str
+        The output root passed to json2soa. The `.objectid`, `.time` and
+        `.location` files with this root are read.
+    coord_dtype : {"float32", "float64"}, optional
+        The dtype of the coordinates of the result, float64 by default.
+    max_error : float, optional
+        With a float32 `coord_dtype`, raise ValueError if any coordinate
+        moves by more than `max_error`.
+
+    Returns
+    -------
+    result : GeoDataFrame
+        One row per record with the int32 ``object_id``, the
+        datetime64[ms] ``timestamp`` and the lon/lat ``geometry`` points.
+
+    Examples
+    --------
+    >>> records = cuspatial.io.read_soa_points("data/locust")
+    >>> objects, traj_offsets = cuspatial.derive_trajectories(
+    ...     records["object_id"], records["geometry"], records["timestamp"]
+    ... )
+    """
+    from cuspatial.core.geodataframe import GeoDataFrame
+    from cuspatial.core.geoseries import GeoSeries
+
+    path = os.fspath(path)
+    object_ids = _memmap(path + ".objectid", np.int32)
+    times = _memmap(path + ".time", np.uint32).reshape(-1, 2)
+    # lat, lon, alt per record
+    locations = _memmap(path + ".location", np.float64).reshape(-1, 3)
+    if not len(object_ids) == len(times) == len(locations):
+        raise ValueError(
+            f"{path}.objectid, {path}.time and {path}.location hold "
+            f"{len(object_ids)}, {len(times)} and {len(locations)} "
+            "records."
+        )
+
+    xy = cast_coords(
+        cp.asarray(locations)[:, [1, 0]].ravel(), coord_dtype, max_error
+    )
+    return GeoDataFrame(
+        {
+            "object_id": cudf.Series(cp.asarray(object_ids)),
+            "timestamp": _decode_times(cp.asarray(times)),
+            "geometry": GeoSeries.from_points_xy(xy),
+        }
+    )
+
+
+def read_soa_polygons(path, coord_dtype=None, max_error=None):
+    """Read the polygons written by poly2soa.
+
+    Each feature becomes a polygon whose rings are all rings of the
+    feature, in file order.
+
+    Parameters
+    ----------
+    path : str
+        The `.ply` file written by poly2soa.
+    coord_dtype : {"float32", "float64"}, optional
+        The dtype of the coordinates of the result, float64 by default.
+    max_error : float, optional
+        With a float32 `coord_dtype`, raise ValueError if any coordinate
+        moves by more than `max_error`.
+
+    Returns
+    -------
+    result : GeoSeries
+        One polygon per feature, across all groups.
+    """
+    from cuspatial.core.geoseries import GeoSeries
+
+    path = os.fspath(path)
+    num_groups, num_features, num_rings, num_vertices = (
+        int(n) for n in _memmap(path, np.int32, count=4)
+    )
+    expected_size = (
+        16 + 4 * (num_groups + num_features + num_rings) + (16 * num_vertices)
+    )
+    if os.path.getsize(path) != expected_size:
+        raise ValueError(
+            f"{path} has {os.path.getsize(path)} bytes, the header implies "
+            f"{expected_size}."
+        )
+
+    offset = 16 + 4 * num_groups
+    rings_per_feature = _memmap(path, np.int32, offset, num_features)
+    offset += 4 * num_features
+    vertices_per_ring = _memmap(path, np.int32, offset, num_rings)
+    offset += 4 * num_rings
+    x = _memmap(path, np.float64, offset, num_vertices)
+    y = _memmap(path, np.float64, offset + 8 * num_vertices, num_vertices)
+
+    xy = cp.empty(2 * num_vertices, dtype=np.float64)
+    xy[0::2] = cp.asarray(x)
+    xy[1::2] = cp.asarray(y)
+    xy = cast_coords(xy, coord_dtype, max_error)
+    ring_offset = cp.concatenate(
+        [cp.zeros(1, np.int32), cp.cumsum(cp.asarray(vertices_per_ring))]
+    )
+    part_offset = cp.concatenate(
+        [cp.zeros(1, np.int32), cp.cumsum(cp.asarray(rings_per_feature))]
+    )
+    geometry_offset = cp.arange(num_features + 1, dtype=np.int32)
+    return GeoSeries.from_polygons_xy(
+        xy, ring_offset, part_offset, geometry_offset
+    )
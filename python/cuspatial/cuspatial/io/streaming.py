@@ -0,0 +1,308 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import os
+import threading
+from queue import Empty, Full, Queue
+
+import cupy as cp
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from cuspatial.io import pygeoarrow
+from cuspatial.utils.column_utils import validate_coord_dtype
+
+_PARQUET_SUFFIXES = (".parquet", ".geoparquet", ".pq")
+_IPC_SUFFIXES = (".arrow", ".arrows", ".feather", ".ipc")
+
+
+def iter_batches(
+    source,
+    batch_rows=1 << 20,
+    column=None,
+    format=None,
+    prefetch=1,
+    coord_dtype=None,
+    max_error=None,
+):
+    """Iterate over a geometry column in GeoSeries batches of bounded size.
+
+    Only one batch per prefetch slot is materialized at a time, so sources
+    that do not fit in host or device memory can be processed batch by
+    batch.
+
+    Parameters
+    ----------
+    source : str, path, pa.RecordBatchReader or array-like
+        A GeoParquet file, an Arrow IPC file or stream, a
+        `pa.RecordBatchReader`, or an array of WKB bytes.
+    batch_rows : int, default 1048576
+        The maximum number of geometries in each batch.
+    column : str, optional
+        The geometry column to read. Defaults to the primary geometry
+        column of GeoParquet files and to the first GeoArrow, union or
+        "geometry" column of Arrow IPC sources.
+    format : {"parquet", "ipc", "wkb"}, optional
+        The format of `source`. Inferred from the file suffix for paths and
+        from the type of `source` otherwise.
+    prefetch : int, default 1
+        The number of batches read, decoded and copied to device on a
+        background thread while the caller processes the current one. Zero
+        reads each batch on demand.
+    coord_dtype : {"float32", "float64"}, optional
+        The dtype of the coordinates of the batches. By default native
+        columns keep their stored dtype and WKB is read as float64. Native
+        coordinates are cast on host, before they are copied to device.
+    max_error : float, optional
+        When narrowing, raise ValueError if any coordinate of a batch moves
+        by more than `max_error`. See `GeoSeries.astype_coords`.
+
+    Yields
+    ------
+    GeoSeries
+        Consecutive batches of at most `batch_rows` geometries, each with a
+        RangeIndex starting at zero.
+
+    Notes
+    -----
+    Coordinates of GeoArrow native columns are copied to device through a
+    pinned host staging buffer that is reused, and grown when needed,
+    across batches.
+
+    Examples
+    --------
+    >>> total = 0
+    >>> for points in cuspatial.io.iter_batches(
+    ...     "points.parquet", batch_rows=10_000_000
+    ... ):
+    ...     total += len(
+    ...         cuspatial.points_in_spatial_window(points, 0, 10, 0, 10)
+    ...     )
+    """
+    if batch_rows < 1:
+        raise ValueError("batch_rows must be positive")
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+    coord_dtype = validate_coord_dtype(coord_dtype)
+    if format is None:
+        format = _infer_format(source)
+
+    if format == "parquet":
+        arrays = _parquet_batches(source, batch_rows, column)
+    elif format == "ipc":
+        arrays = _ipc_batches(source, batch_rows, column)
+    elif format == "wkb":
+        arrays = _wkb_batches(source, batch_rows)
+    else:
+        raise ValueError(f"Unsupported format {format}")
+
+    staging = _PinnedStagingBuffer()
+    batches = (
+        _to_geoseries(*item, staging, coord_dtype, max_error)
+        for item in arrays
+    )
+    if prefetch == 0:
+        return batches
+    return _prefetch(batches, prefetch)
+
+
+def _infer_format(source):
+    if isinstance(source, pa.RecordBatchReader):
+        return "ipc"
+    if isinstance(source, (str, os.PathLike)):
+        suffix = os.path.splitext(os.fspath(source))[1].lower()
+        if suffix in _PARQUET_SUFFIXES:
+            return "parquet"
+        if suffix in _IPC_SUFFIXES:
+            return "ipc"
+        raise ValueError(
+            f"Cannot infer the format of {source}, pass `format`."
+        )
+    return "wkb"
+
+
+def _parquet_batches(source, batch_rows, column):
+    from cuspatial.io.geoparquet import _geo_metadata
+
+    parquet_file = pq.ParquetFile(source)
+    geo_meta = _geo_metadata(parquet_file.schema_arrow)
+    column = column or geo_meta["primary_column"]
+    encoding = geo_meta["columns"][column].get("encoding", "WKB").lower()
+    arrays = (
+        batch.column(0)
+        for batch in parquet_file.iter_batches(
+            batch_size=batch_rows, columns=[column]
+        )
+    )
+    for array in _rebatch(arrays, batch_rows):
+        yield array, encoding
+
+
+def _ipc_batches(source, batch_rows, column):
+    if isinstance(source, pa.RecordBatchReader):
+        schema, batches = source.schema, source
+    else:
+        memory_map = pa.memory_map(os.fspath(source))
+        try:
+            reader = pa.ipc.open_file(memory_map)
+            batches = (
+                reader.get_batch(i) for i in range(reader.num_record_batches)
+            )
+        except pa.ArrowInvalid:
+            memory_map.seek(0)
+            reader = pa.ipc.open_stream(memory_map)
+            batches = reader
+        schema = reader.schema
+
+    index = schema.get_field_index(column or _ipc_geometry_column(schema))
+    if index < 0:
+        raise ValueError(f"Column {column} not found")
+    field = schema.field(index)
+    encoding = pygeoarrow.geoarrow_field_encoding(field)
+    if pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type):
+        encoding = "wkb"
+    arrays = (batch.column(index) for batch in batches)
+    for array in _rebatch(arrays, batch_rows):
+        yield array, encoding
+
+
+def _ipc_geometry_column(schema: pa.Schema) -> str:
+    for field in schema:
+        if pygeoarrow.geoarrow_field_encoding(field) is not None or (
+            pa.types.is_union(field.type)
+        ):
+            return field.name
+    if "geometry" in schema.names:
+        return "geometry"
+    raise ValueError("No geometry column found, pass `column`.")
+
+
+def _wkb_batches(source, batch_rows):
+    if isinstance(source, pa.ChunkedArray):
+        arrays = source.chunks
+    elif isinstance(source, pa.Array):
+        arrays = [source]
+    else:
+        arrays = [pa.array(source, type=pa.binary())]
+    for array in _rebatch(arrays, batch_rows):
+        yield array, "wkb"
+
+
+def _rebatch(arrays, batch_rows):
+    """Slice and combine a stream of arrays into arrays of exactly
+    `batch_rows` rows, except for the last one.
+    """
+    pending = []
+    pending_rows = 0
+    for array in arrays:
+        offset = 0
+        while offset < len(array):
+            size = min(batch_rows - pending_rows, len(array) - offset)
+            pending.append(array.slice(offset, size))
+            pending_rows += size
+            offset += size
+            if pending_rows == batch_rows:
+                yield _concat_arrays(pending)
+                pending = []
+                pending_rows = 0
+    if pending_rows > 0:
+        yield _concat_arrays(pending)
+
+
+def _concat_arrays(arrays):
+    return arrays[0] if len(arrays) == 1 else pa.concat_arrays(arrays)
+
+
+def _to_geoseries(array, encoding, staging, coord_dtype=None, max_error=None):
+    from cuspatial.core.geoseries import GeoSeries
+
+    extension_encoding = pygeoarrow.geoarrow_encoding(array.type)
+    if extension_encoding is not None:
+        encoding = extension_encoding
+        array = array.storage
+    if encoding in pygeoarrow.GEOARROW_ENCODING_DEPTH:
+        return GeoSeries._from_geoarrow_native(
+            array, encoding, staging, coord_dtype, max_error
+        )
+    return GeoSeries.from_arrow(
+        array, encoding=encoding, coord_dtype=coord_dtype, max_error=max_error
+    )
+
+
+class _PinnedStagingBuffer:
+    """Copy host coordinates to device through a pinned host buffer that is
+    reused across calls and grown geometrically when a larger batch
+    arrives.
+    """
+
+    def __init__(self):
+        self._buffer = np.empty(0, dtype=np.uint8)
+
+    def __call__(self, coords: np.ndarray) -> cp.ndarray:
+        size = coords.size
+        nbytes = size * coords.dtype.itemsize
+        if nbytes > len(self._buffer):
+            capacity = max(nbytes, 2 * len(self._buffer))
+            memory = cp.cuda.alloc_pinned_memory(capacity)
+            self._buffer = np.frombuffer(memory, np.uint8, capacity)
+        staged = self._buffer[:nbytes].view(coords.dtype)
+        staged[:] = coords.ravel()
+        result = cp.empty(size, dtype=coords.dtype)
+        result.set(staged)
+        # The staging buffer is overwritten by the next batch.
+        cp.cuda.get_current_stream().synchronize()
+        return result
+
+
+class _Failure:
+    def __init__(self, error):
+        self.error = error
+
+
+def _prefetch(iterator, depth):
+    """Run `iterator` on a background thread, keeping up to `depth` items
+    ready ahead of the consumer.
+    """
+    queue = Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except BaseException as error:
+            put(_Failure(error))
+        else:
+            put(done)
+
+    thread = threading.Thread(
+        target=produce, name="cuspatial-prefetch", daemon=True
+    )
+    thread.start()
+    try:
+        while True:
+            item = queue.get()
+            if item is done:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        try:
+            while True:
+                queue.get_nowait()
+        except Empty:
+            pass
+        thread.join()
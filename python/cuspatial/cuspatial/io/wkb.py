@@ -0,0 +1,512 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+"""Vectorized host encoding and decoding of Well-Known Binary geometries.
+
+Both directions work in two passes over flat buffers. The first pass walks
+the WKB headers and counts (or, when encoding, the offset buffers) to size
+every output buffer, the second pass fills coordinates and counts with a
+single gather or scatter. Loops only run over the nesting structure, e.g.
+the maximum number of parts or rings in a geometry, never over rows.
+"""
+
+import numpy as np
+import pyarrow as pa
+from numpy.lib.stride_tricks import as_strided
+
+from cuspatial.core._column.geometa import Feature_Enum
+from cuspatial.io import pygeoarrow
+from cuspatial.io.geopandas_reader import NONE_OFFSET
+
+WKB_POINT = 1
+WKB_LINESTRING = 2
+WKB_POLYGON = 3
+WKB_MULTIPOINT = 4
+WKB_MULTILINESTRING = 5
+WKB_MULTIPOLYGON = 6
+
+_EWKB_Z = 0x80000000
+_EWKB_M = 0x40000000
+_EWKB_SRID = 0x20000000
+_EWKB_FLAGS = _EWKB_Z | _EWKB_M | _EWKB_SRID
+
+# The union child that holds each WKB type
+_FEATURE_OF_WKB_TYPE = {
+    WKB_POINT: Feature_Enum.POINT,
+    WKB_MULTIPOINT: Feature_Enum.MULTIPOINT,
+    WKB_LINESTRING: Feature_Enum.LINESTRING,
+    WKB_MULTILINESTRING: Feature_Enum.LINESTRING,
+    WKB_POLYGON: Feature_Enum.POLYGON,
+    WKB_MULTIPOLYGON: Feature_Enum.POLYGON,
+}
+
+# The WKB type of the parts of each union child
+_PART_TYPE_OF_FEATURE = {
+    Feature_Enum.POINT: WKB_POINT,
+    Feature_Enum.MULTIPOINT: WKB_POINT,
+    Feature_Enum.LINESTRING: WKB_LINESTRING,
+    Feature_Enum.POLYGON: WKB_POLYGON,
+}
+
+
+def _windows(buffer: np.ndarray, width: int) -> np.ndarray:
+    """Return a read/write view of every `width` consecutive bytes of
+    `buffer`, so that unaligned values can be gathered or scattered by
+    their byte position.
+    """
+    if len(buffer) < width:
+        return np.empty((0, width), dtype=np.uint8)
+    return as_strided(
+        buffer,
+        shape=(len(buffer) - width + 1, width),
+        strides=(buffer.strides[0], buffer.strides[0]),
+    )
+
+
+def _concat(arrays, dtype):
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+
+
+def _offsets_from_sizes(sizes) -> np.ndarray:
+    return np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)])
+
+
+class _Runs:
+    """Sizing pass output for one union child: each run is a block of
+    consecutive coordinates in the WKB buffer, keyed by the row, part and
+    ring it belongs to.
+    """
+
+    def __init__(self):
+        self.columns = {
+            key: []
+            for key in ("row", "part", "ring", "start", "size", "le", "dims")
+        }
+
+    def append(self, **kwargs):
+        for key, value in kwargs.items():
+            self.columns[key].append(np.asarray(value))
+
+    def sorted(self):
+        runs = {
+            key: _concat(values, np.int64)
+            for key, values in self.columns.items()
+        }
+        order = np.lexsort((runs["ring"], runs["part"], runs["row"]))
+        return {key: value[order] for key, value in runs.items()}
+
+
+class _WKBDecoder:
+    def __init__(self, data: np.ndarray):
+        self.data = data
+        self.w4 = _windows(data, 4)
+        self.w8 = _windows(data, 8)
+
+    def _read(self, windows, dtype, pos, little_endian):
+        values = windows[pos]
+        values = np.where(little_endian[:, None], values, values[:, ::-1])
+        return np.ascontiguousarray(values).view(dtype).ravel()
+
+    def uint32(self, pos, little_endian):
+        return self._read(self.w4, "<u4", pos, little_endian).astype(np.int64)
+
+    def float64(self, pos, little_endian):
+        return self._read(self.w8, "<f8", pos, little_endian)
+
+    def header(self, pos):
+        """Parse the byte order and (E)WKB or ISO WKB type at `pos`.
+
+        Returns the base geometry type, the byte order, the number of
+        dimensions and the position of the geometry body.
+        """
+        little_endian = self.data[pos] == 1
+        wkb_type = self.uint32(pos + 1, little_endian)
+        iso_type = (wkb_type & ~_EWKB_FLAGS) % 10000
+        iso_dims = iso_type // 1000
+        has_z = ((wkb_type & _EWKB_Z) != 0) | (iso_dims == 1) | (iso_dims == 3)
+        has_m = ((wkb_type & _EWKB_M) != 0) | (iso_dims == 2) | (iso_dims == 3)
+        has_srid = (wkb_type & _EWKB_SRID) != 0
+        base_type = iso_type % 1000
+        dims = 2 + has_z.astype(np.int64) + has_m.astype(np.int64)
+        body = pos + 5 + 4 * has_srid.astype(np.int64)
+        return base_type, little_endian, dims, body
+
+    def part(self, part_type, runs, rows, part, body, le, dims):
+        """Size the bodies of a set of parts of type `part_type`, recording
+        their coordinate runs. Returns the position following each part and,
+        for polygons, the number of rings of each part.
+        """
+        if part_type == WKB_POINT:
+            runs.append(
+                row=rows,
+                part=part,
+                ring=np.zeros_like(rows),
+                start=body,
+                size=np.ones_like(rows),
+                le=le,
+                dims=dims,
+            )
+            return body + 8 * dims, None
+        if part_type == WKB_LINESTRING:
+            size = self.uint32(body, le)
+            runs.append(
+                row=rows,
+                part=part,
+                ring=np.zeros_like(rows),
+                start=body + 4,
+                size=size,
+                le=le,
+                dims=dims,
+            )
+            return body + 4 + 8 * dims * size, None
+        num_rings = self.uint32(body, le)
+        cursor = body + 4
+        for ring in range(int(num_rings.max(initial=0))):
+            active = num_rings > ring
+            pos = cursor[active]
+            size = self.uint32(pos, le[active])
+            runs.append(
+                row=rows[active],
+                part=part[active],
+                ring=np.full(len(pos), ring),
+                start=pos + 4,
+                size=size,
+                le=le[active],
+                dims=dims[active],
+            )
+            cursor[active] = pos + 4 + 8 * dims[active] * size
+        return cursor, num_rings
+
+    def coords(self, runs) -> np.ndarray:
+        """Fill pass: gather the xy coordinates of every run."""
+        total = int(runs["size"].sum())
+        run_of_point = np.repeat(np.arange(len(runs["size"])), runs["size"])
+        first_point = _offsets_from_sizes(runs["size"])[:-1]
+        index = np.arange(total) - first_point[run_of_point]
+        stride = 8 * runs["dims"][run_of_point]
+        pos = runs["start"][run_of_point] + index * stride
+        le = runs["le"][run_of_point].astype(bool)
+        coords = np.empty((total, 2), dtype=np.float64)
+        coords[:, 0] = self.float64(pos, le)
+        coords[:, 1] = self.float64(pos + 8, le)
+        return coords
+
+
+def _binary_buffers(array):
+    """Return the row offsets, data bytes and validity of a binary array."""
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if pa.types.is_string(array.type):
+        array = array.cast(pa.binary())
+    elif pa.types.is_large_string(array.type):
+        array = array.cast(pa.large_binary())
+    offset_type = (
+        np.int64 if pa.types.is_large_binary(array.type) else np.int32
+    )
+    _, offsets, data = array.buffers()
+    offsets = np.frombuffer(offsets, dtype=offset_type)[
+        array.offset : array.offset + len(array) + 1
+    ]
+    data = (
+        np.frombuffer(data, dtype=np.uint8)
+        if data is not None
+        else np.empty(0, dtype=np.uint8)
+    )
+    valid = ~array.is_null().to_numpy(zero_copy_only=False)
+    return offsets.astype(np.int64), data, valid
+
+
+def from_wkb(array) -> pa.UnionArray:
+    """Decode a binary array of WKB geometries into a GeoArrow union.
+
+    Parameters
+    ----------
+    array : pa.BinaryArray
+        WKB, EWKB or ISO WKB geometries. Null rows become null geometries.
+        Only the xy coordinates are kept.
+
+    Returns
+    -------
+    result : pa.UnionArray
+        A dense union of point, multipoint, (multi)linestring and
+        (multi)polygon children in the layout of `GeoColumn`.
+    """
+    offsets, data, valid = _binary_buffers(array)
+    decoder = _WKBDecoder(data)
+    num_rows = len(valid)
+    rows = np.flatnonzero(valid)
+
+    # Sizing pass
+    base_type, le, dims, body = decoder.header(offsets[:-1][rows])
+    unsupported = ~np.isin(base_type, list(_FEATURE_OF_WKB_TYPE))
+    if unsupported.any():
+        raise ValueError(
+            f"Unsupported WKB geometry type {base_type[unsupported][0]}"
+        )
+
+    type_buffer = np.full(num_rows, Feature_Enum.NONE.value, dtype=np.int8)
+    num_parts = np.zeros(num_rows, dtype=np.int64)
+    runs = {feature: _Runs() for feature in _PART_TYPE_OF_FEATURE}
+    ring_counts = []
+
+    for wkb_type, feature in _FEATURE_OF_WKB_TYPE.items():
+        selected = base_type == wkb_type
+        if not selected.any():
+            continue
+        part_type = _PART_TYPE_OF_FEATURE[feature]
+        row = rows[selected]
+        type_buffer[row] = feature.value
+        if wkb_type == part_type:
+            num_parts[row] = 1
+            _, rings = decoder.part(
+                part_type,
+                runs[feature],
+                row,
+                np.zeros_like(row),
+                body[selected],
+                le[selected],
+                dims[selected],
+            )
+            if rings is not None:
+                ring_counts.append((row, np.zeros_like(row), rings))
+            continue
+        count = decoder.uint32(body[selected], le[selected])
+        num_parts[row] = count
+        cursor = body[selected] + 4
+        for part in range(int(count.max(initial=0))):
+            active = count > part
+            part_base, part_le, part_dims, part_body = decoder.header(
+                cursor[active]
+            )
+            if (part_base != part_type).any():
+                raise ValueError(
+                    f"WKB type {wkb_type} contains a part of type "
+                    f"{part_base[part_base != part_type][0]}"
+                )
+            cursor[active], rings = decoder.part(
+                part_type,
+                runs[feature],
+                row[active],
+                np.full(active.sum(), part),
+                part_body,
+                part_le,
+                part_dims,
+            )
+            if rings is not None:
+                ring_counts.append(
+                    (row[active], np.full(len(rings), part), rings)
+                )
+
+    # Fill pass
+    union_offsets = np.full(num_rows, NONE_OFFSET, dtype=np.int32)
+    children = []
+    for feature, feature_runs in runs.items():
+        feature_rows = type_buffer == feature.value
+        union_offsets[feature_rows] = np.arange(np.count_nonzero(feature_rows))
+        feature_runs = feature_runs.sorted()
+        coords = decoder.coords(feature_runs)
+        geometry_offset = _offsets_from_sizes(num_parts[feature_rows])
+        run_offset = _offsets_from_sizes(feature_runs["size"])
+        if feature == Feature_Enum.POINT:
+            ragged_offsets = ()
+        elif feature == Feature_Enum.MULTIPOINT:
+            ragged_offsets = (geometry_offset,)
+        elif feature == Feature_Enum.LINESTRING:
+            ragged_offsets = (run_offset, geometry_offset)
+        else:
+            ring_rows, ring_parts, rings = (
+                _concat([r[i] for r in ring_counts], np.int64)
+                for i in range(3)
+            )
+            order = np.lexsort((ring_parts, ring_rows))
+            part_offset = _offsets_from_sizes(rings[order])
+            ragged_offsets = (run_offset, part_offset, geometry_offset)
+        children.append(pygeoarrow.from_ragged_array(coords, ragged_offsets))
+
+    return pygeoarrow.from_pyarrow_lists(
+        pa.array(type_buffer), pa.array(union_offsets), *children
+    )
+
+
+class _WKBEncoder:
+    """Write WKB geometries into a preallocated little-endian buffer."""
+
+    def __init__(self, size: int):
+        self.data = np.zeros(size, dtype=np.uint8)
+        self.w4 = _windows(self.data, 4)
+        self.w16 = _windows(self.data, 16)
+
+    def header(self, pos, wkb_type, count=None):
+        self.data[pos] = 1
+        self.uint32(pos + 1, np.full(len(pos), wkb_type))
+        if count is not None:
+            self.uint32(pos + 5, count)
+
+    def uint32(self, pos, values):
+        values = np.ascontiguousarray(values, dtype="<u4")
+        self.w4[pos] = values.view(np.uint8).reshape(-1, 4)
+
+    def coords(self, pos, coords):
+        coords = np.ascontiguousarray(coords, dtype="<f8")
+        self.w16[pos] = coords.view(np.uint8).reshape(-1, 16)
+
+
+def _parts_layout(part_sizes, geometry_offset):
+    """Lay out the parts of each geometry. Geometries with exactly one part
+    are written as that part alone, others as a Multi* header followed by
+    their parts.
+
+    Returns the byte size of each geometry, the multi flag of each geometry
+    and the position of each part relative to the start of its geometry.
+    """
+    num_parts = np.diff(geometry_offset)
+    multi = num_parts != 1
+    part_start = _offsets_from_sizes(part_sizes)
+    sizes = 9 * multi + (
+        part_start[geometry_offset[1:]] - part_start[geometry_offset[:-1]]
+    )
+    part_geometry = np.repeat(np.arange(len(num_parts)), num_parts)
+    part_pos = (
+        9 * multi[part_geometry]
+        + part_start[:-1]
+        - part_start[geometry_offset[:-1]][part_geometry]
+    )
+    return sizes, multi, part_geometry, part_pos
+
+
+def _point_positions(part_offset):
+    """Return the part of every coordinate and its byte position relative
+    to the first coordinate of that part.
+    """
+    sizes = np.diff(part_offset)
+    point_part = np.repeat(np.arange(len(sizes)), sizes)
+    index = np.arange(part_offset[-1]) - part_offset[:-1][point_part]
+    return point_part, index * 16
+
+
+def _encode_feature(series, feature, union_offsets):
+    """Return the byte size of each geometry of `feature` and a function
+    writing them at given start positions.
+    """
+    coords, *offsets = series._host_feature_buffers(feature, union_offsets)
+
+    if feature == Feature_Enum.POINT:
+
+        def write(encoder, start):
+            encoder.header(start, WKB_POINT)
+            encoder.coords(start + 5, coords)
+
+        return np.full(len(coords), 21, dtype=np.int64), write
+
+    if feature == Feature_Enum.MULTIPOINT:
+        (geometry_offset,) = offsets
+        num_points = np.diff(geometry_offset)
+        point_geometry = np.repeat(np.arange(len(num_points)), num_points)
+        index = np.arange(len(coords)) - geometry_offset[:-1][point_geometry]
+
+        def write(encoder, start):
+            encoder.header(start, WKB_MULTIPOINT, num_points)
+            point_pos = start[point_geometry] + 9 + 21 * index
+            encoder.header(point_pos, WKB_POINT)
+            encoder.coords(point_pos + 5, coords)
+
+        return 9 + 21 * num_points, write
+
+    if feature == Feature_Enum.LINESTRING:
+        part_offset, geometry_offset = offsets
+        num_points = np.diff(part_offset)
+        sizes, multi, part_geometry, part_pos = _parts_layout(
+            9 + 16 * num_points, geometry_offset
+        )
+
+        def write(encoder, start):
+            encoder.header(
+                start[multi],
+                WKB_MULTILINESTRING,
+                np.diff(geometry_offset)[multi],
+            )
+            pos = start[part_geometry] + part_pos
+            encoder.header(pos, WKB_LINESTRING, num_points)
+            point_part, point_pos = _point_positions(part_offset)
+            encoder.coords(pos[point_part] + 9 + point_pos, coords)
+
+        return sizes, write
+
+    ring_offset, part_offset, geometry_offset = offsets
+    num_points = np.diff(ring_offset)
+    num_rings = np.diff(part_offset)
+    ring_start = _offsets_from_sizes(4 + 16 * num_points)
+    part_sizes = 9 + ring_start[part_offset[1:]] - ring_start[part_offset[:-1]]
+    sizes, multi, part_geometry, part_pos = _parts_layout(
+        part_sizes, geometry_offset
+    )
+    ring_part = np.repeat(np.arange(len(num_rings)), num_rings)
+    ring_pos = 9 + ring_start[:-1] - ring_start[part_offset[:-1]][ring_part]
+
+    def write(encoder, start):
+        encoder.header(
+            start[multi], WKB_MULTIPOLYGON, np.diff(geometry_offset)[multi]
+        )
+        pos = start[part_geometry] + part_pos
+        encoder.header(pos, WKB_POLYGON, num_rings)
+        rings = pos[ring_part] + ring_pos
+        encoder.uint32(rings, num_points)
+        point_ring, point_pos = _point_positions(ring_offset)
+        encoder.coords(rings[point_ring] + 4 + point_pos, coords)
+
+    return sizes, write
+
+
+def to_wkb(series) -> pa.Array:
+    """Encode a GeoSeries as little-endian WKB.
+
+    Single-part (multi)linestrings and (multi)polygons are written as
+    LineString and Polygon geometries, others as their Multi* type. Null
+    geometries are null.
+
+    Returns
+    -------
+    result : pa.BinaryArray
+        The WKB of each row, a `pa.LargeBinaryArray` if the output exceeds
+        2 GiB.
+    """
+    input_types = series._column._meta.input_types.values_host
+    union_offsets = series._column._meta.union_offsets.values_host
+    num_rows = len(input_types)
+
+    # Sizing pass
+    sizes = np.zeros(num_rows, dtype=np.int64)
+    writers = []
+    for feature in _PART_TYPE_OF_FEATURE:
+        mask = input_types == feature.value
+        if mask.any():
+            feature_sizes, write = _encode_feature(
+                series, feature, union_offsets[mask]
+            )
+            sizes[mask] = feature_sizes
+            writers.append((mask, write))
+    row_offsets = _offsets_from_sizes(sizes)
+
+    # Fill pass
+    encoder = _WKBEncoder(int(row_offsets[-1]))
+    for mask, write in writers:
+        write(encoder, row_offsets[:-1][mask])
+
+    valid = input_types != Feature_Enum.NONE.value
+    large = row_offsets[-1] > np.iinfo(np.int32).max
+    arrow_type = pa.large_binary() if large else pa.binary()
+    offset_dtype = np.int64 if large else np.int32
+    validity = (
+        None
+        if valid.all()
+        else pa.py_buffer(np.packbits(valid, bitorder="little"))
+    )
+    return pa.Array.from_buffers(
+        arrow_type,
+        num_rows,
+        [
+            validity,
+            pa.py_buffer(row_offsets.astype(offset_dtype)),
+            pa.py_buffer(encoder.data),
+        ],
+        null_count=int(num_rows - valid.sum()),
+    )
@@ -35,6 +35,19 @@ def test_polygon_bounding_boxes_one():
     )
 
 
+def test_polygon_bounding_boxes_not_shared():
+    s = cuspatial.GeoSeries(
+        [Polygon([(0, 0), (1, 0), (1, 1), (0, 0)])] * 2,
+    )
+    expected = cudf.from_pandas(s.to_geopandas().bounds)
+    result = cuspatial.polygon_bounding_boxes(s)
+    result["minx"] -= 1
+    result.loc[0, "maxy"] = 10.0
+    cudf.testing.assert_frame_equal(
+        cuspatial.polygon_bounding_boxes(s), expected
+    )
+
+
 def test_polygon_bounding_boxes_small():
 
     s = cuspatial.GeoSeries(
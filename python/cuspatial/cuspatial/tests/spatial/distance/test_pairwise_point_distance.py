@@ -60,6 +60,20 @@ def test_multipoint_multipoint_random(multipoint_generator):
     assert_series_equal(got.to_pandas(), expected)
 
 
+def test_mixed_point_multipoint_random(point_generator, multipoint_generator):
+    gs1 = gpd.GeoSeries(
+        [*point_generator(50), *multipoint_generator(50, 5)]
+    ).sample(frac=1, random_state=0, ignore_index=True)
+    gs2 = gpd.GeoSeries([*multipoint_generator(50, 3), *point_generator(50)])
+
+    cugs1 = cuspatial.from_geopandas(gs1)
+    cugs2 = cuspatial.from_geopandas(gs2)
+
+    got = cuspatial.pairwise_point_distance(cugs1, cugs2)
+    expected = gs1.distance(gs2)
+    assert_series_equal(got.to_pandas(), expected)
+
+
 def test_mismatched_input_size():
     gs1 = cuspatial.GeoSeries([Point(0, 0)])
     gs2 = cuspatial.GeoSeries([Point(0, 0), Point(1, 1)])
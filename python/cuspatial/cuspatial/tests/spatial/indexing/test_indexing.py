@@ -269,3 +269,113 @@ def test_small_number_of_points(dtype):
             }
         ),
     )
+
+
+def test_auto_parameters():
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 100, (8, 2))
+    xy = centers[rng.integers(0, 8, 20000)] + rng.normal(0, 0.1, (20000, 2))
+    points = cuspatial.GeoSeries.from_points_xy(xy.ravel())
+
+    order, quadtree, parameters = cuspatial.quadtree_on_points(
+        points, auto=True, target_size=64
+    )
+    x_min, y_min, x_max, y_max = points.total_bounds
+    assert (parameters["x_min"], parameters["x_max"]) == (x_min, x_max)
+    assert (parameters["y_min"], parameters["y_max"]) == (y_min, y_max)
+    assert 1 <= parameters["max_depth"] <= 15
+    assert parameters["max_size"] >= 64
+
+    # The parameters rebuild the same quadtree
+    expected_order, expected_quadtree = cuspatial.quadtree_on_points(
+        points, **parameters
+    )
+    cudf.testing.assert_series_equal(order, expected_order)
+    cudf.testing.assert_frame_equal(quadtree, expected_quadtree)
+
+    leaves = quadtree["length"][~quadtree["is_internal_node"]]
+    assert int(leaves.sum()) == len(points)
+    assert 16 <= leaves.mean() <= 256
+
+
+def test_auto_keeps_given_parameters():
+    points = cuspatial.GeoSeries.from_points_xy(
+        np.random.default_rng(0).uniform(0, 1, 2000)
+    )
+    _, _, parameters = cuspatial.quadtree_on_points(
+        points, *bbox_2, max_depth=4, max_size=10, auto=True
+    )
+    assert parameters["max_depth"] == 4
+    assert parameters["max_size"] == 10
+    assert (parameters["x_min"], parameters["x_max"]) == (0, 2)
+    assert parameters["scale"] == 2 / ((1 << 4) + 2)
+
+
+def test_missing_parameters():
+    with pytest.raises(ValueError, match="auto=True"):
+        cuspatial.quadtree_on_points(cuspatial.GeoSeries([]), *bbox_1)
+
+
+def test_quadtree_stats():
+    quadtree = cudf.DataFrame(
+        {
+            "key": cudf.Series(
+                [0, 1, 2, 0, 1, 3, 4, 7, 5, 6, 13, 14, 28, 31],
+                dtype=np.uint32,
+            ),
+            "level": cudf.Series(
+                [0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2], dtype=np.uint8
+            ),
+            "is_internal_node": cudf.Series(
+                [1, 1, 0, 0, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0], dtype=np.bool_
+            ),
+            "length": cudf.Series(
+                [3, 2, 11, 7, 2, 2, 9, 2, 9, 7, 5, 8, 8, 7],
+                dtype=np.uint32,
+            ),
+            "offset": cudf.Series(
+                [3, 6, 60, 0, 8, 10, 36, 12, 7, 16, 23, 28, 45, 53],
+                dtype=np.uint32,
+            ),
+        }
+    )
+    point_indices = cudf.Series(np.arange(71, dtype=np.uint32))
+    stats = cuspatial.quadtree_stats(quadtree, 8, point_indices)
+
+    depth = stats["depth"].to_pandas()
+    assert depth.index.tolist() == [0, 1, 2]
+    assert depth["nodes"].tolist() == [3, 5, 6]
+    assert depth["leaves"].tolist() == [1, 2, 6]
+    assert depth["points"].tolist() == [11, 16, 44]
+    assert stats["leaf_size"]["count"] == 9
+    assert stats["leaf_size"]["max"] == 11
+    assert stats["oversize_leaves"] == 3
+    # 14 of the 4 quadrants of the root and of the 5 internal nodes
+    assert stats["empty_quadrant_ratio"] == pytest.approx(1 - 14 / 24)
+    assert stats["memory_usage"] == quadtree.memory_usage().sum() + (
+        point_indices.memory_usage()
+    )
+    assert cuspatial.quadtree_stats(quadtree)["oversize_leaves"] is None
+
+
+def test_quadtree_join_stats():
+    quadtree = cudf.DataFrame(
+        {
+            "length": cudf.Series([2, 5, 3, 0, 4], dtype=np.uint32),
+        }
+    )
+    pairs = cudf.DataFrame(
+        {
+            "bbox_offset": cudf.Series([0, 0, 2, 2, 2], dtype=np.uint32),
+            "quad_offset": cudf.Series([1, 4, 0, 1, 2], dtype=np.uint32),
+        }
+    )
+    hits = cudf.Series([0, 0, 2, 2, 2, 2, 2], dtype=np.uint32)
+    stats = cuspatial.quadtree_join_stats(quadtree, pairs, hits, 4)
+    assert stats["pairs"].values_host.tolist() == [2, 0, 3, 0]
+    assert stats["candidates"].values_host.tolist() == [9, 0, 10, 0]
+    assert stats["hits"].values_host.tolist() == [2, 0, 5, 0]
+
+    stats = cuspatial.quadtree_join_stats(quadtree, pairs)
+    assert stats.columns.tolist() == ["pairs", "candidates"]
+    assert len(stats) == 3
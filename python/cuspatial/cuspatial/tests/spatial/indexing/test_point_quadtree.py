@@ -0,0 +1,154 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+import cupy as cp
+import geopandas as gpd
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+import cudf
+
+import cuspatial
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    return cuspatial.GeoSeries.from_points_xy(rng.uniform(0, 10, 2000))
+
+
+def test_build_parameters(points):
+    index = cuspatial.PointQuadtree(points, max_depth=4, max_size=16)
+    x_min, y_min, x_max, y_max = points.total_bounds
+    assert (index.x_min, index.x_max) == (x_min, x_max)
+    assert (index.y_min, index.y_max) == (y_min, y_max)
+    assert index.max_size == 16
+    assert len(index) == len(points)
+
+    point_indices, quadtree = cuspatial.quadtree_on_points(
+        points, x_min, x_max, y_min, y_max, index.scale, 4, 16
+    )
+    cudf.testing.assert_series_equal(point_indices, index.point_indices)
+    cudf.testing.assert_frame_equal(quadtree, index.quadtree)
+
+
+@pytest.mark.parametrize(
+    "window", [(2, 5, 1, 4), (5, 2, 4, 1), (-1, 11, -1, 11), (20, 30, 0, 1)]
+)
+def test_query_window(points, window):
+    index = cuspatial.PointQuadtree(points, max_depth=5, max_size=8)
+    min_x, max_x, min_y, max_y = window
+    min_x, max_x = sorted((min_x, max_x))
+    min_y, max_y = sorted((min_y, max_y))
+    x = points.points.x.values_host
+    y = points.points.y.values_host
+    expected = np.flatnonzero(
+        (min_x < x) & (x < max_x) & (min_y < y) & (y < max_y)
+    )
+    got = index.query_window(*window)
+    np.testing.assert_array_equal(got.values_host, expected)
+
+
+def test_points_in_polygons(points):
+    polygons = cuspatial.GeoSeries(
+        [
+            Polygon([(1, 1), (4, 1), (4, 3), (1, 1)]),
+            Polygon([(5, 5), (9, 5), (9, 9), (5, 9), (5, 5)]),
+        ]
+    )
+    index = cuspatial.PointQuadtree(points, max_depth=5, max_size=8)
+    got = index.points_in_polygons(polygons).to_pandas()
+
+    host_points = points.to_geopandas()
+    for i, polygon in enumerate(polygons.to_geopandas()):
+        expected = np.flatnonzero(host_points.within(polygon))
+        np.testing.assert_array_equal(
+            np.sort(got["point_index"][got["polygon_index"] == i]), expected
+        )
+
+
+def test_contains_properly_index(points):
+    polygons = cuspatial.GeoSeries(
+        [Polygon([(1, 1), (4, 1), (4, 3), (1, 1)])] * 40
+    )
+    index = cuspatial.PointQuadtree(points, max_depth=5, max_size=8)
+    got = polygons.contains_properly(points, allpairs=True, index=index)
+    cudf.testing.assert_frame_equal(
+        got, polygons.contains_properly(points, allpairs=True)
+    )
+    cudf.testing.assert_frame_equal(
+        got, polygons.contains_properly(points, allpairs=True, index=index)
+    )
+
+    expected = gpd.GeoSeries(polygons.to_geopandas()[0]).contains(
+        points.to_geopandas()
+    )
+    assert cp.unique(got["point_index"].values).get().tolist() == list(
+        np.flatnonzero(expected)
+    )
+
+
+def test_contains_properly_index_mismatch(points):
+    polygons = cuspatial.GeoSeries([Polygon([(1, 1), (4, 1), (4, 3), (1, 1)])])
+    index = cuspatial.PointQuadtree(points[:10])
+    with pytest.raises(ValueError):
+        polygons.contains_properly(points, allpairs=True, index=index)
+
+
+def test_auto(points):
+    index = cuspatial.PointQuadtree(points, auto=True, target_size=32)
+    _, quadtree, parameters = cuspatial.quadtree_on_points(
+        points, auto=True, target_size=32
+    )
+    for name, value in parameters.items():
+        assert getattr(index, name) == value
+    cudf.testing.assert_frame_equal(index.quadtree, quadtree)
+    np.testing.assert_array_equal(
+        index.query_window(2, 5, 1, 4).values_host,
+        cuspatial.PointQuadtree(points).query_window(2, 5, 1, 4).values_host,
+    )
+
+
+def test_join_stats(points):
+    polygons = cuspatial.GeoSeries(
+        [
+            Polygon([(1, 1), (4, 1), (4, 3), (1, 1)]),
+            Polygon([(5, 5), (9, 5), (9, 9), (5, 9), (5, 5)]),
+        ]
+    )
+    index = cuspatial.PointQuadtree(points, max_depth=5, max_size=8)
+    stats = index.join_stats(polygons).to_pandas()
+
+    host_points = points.to_geopandas()
+    for i, polygon in enumerate(polygons.to_geopandas()):
+        assert stats["hits"][i] == host_points.within(polygon).sum()
+    assert (stats["candidates"] >= stats["hits"]).all()
+    assert index.stats()["depth"]["points"].sum() == len(points)
+
+
+def test_query_windows(points):
+    index = cuspatial.PointQuadtree(points, max_depth=5, max_size=8)
+    windows = cudf.DataFrame(
+        {
+            "minx": [2.0, 5.0, -1.0, 20.0, 3.0],
+            "miny": [1.0, 4.0, -1.0, 0.0, 3.0],
+            "maxx": [5.0, 2.0, 11.0, 30.0, 3.5],
+            "maxy": [4.0, 1.0, 11.0, 1.0, 9.0],
+        }
+    )
+    got = index.query_windows(windows).to_pandas()
+
+    x = points.points.x.values_host
+    y = points.points.y.values_host
+    for i, window in windows.to_pandas().iterrows():
+        min_x, max_x = sorted((window.minx, window.maxx))
+        min_y, max_y = sorted((window.miny, window.maxy))
+        expected = np.flatnonzero(
+            (min_x < x) & (x < max_x) & (min_y < y) & (y < max_y)
+        )
+        np.testing.assert_array_equal(
+            got["point_index"][got["window_index"] == i], expected
+        )
+    assert got["window_index"].is_monotonic_increasing
+
+    empty = index.query_windows(windows.iloc[:0])
+    assert len(empty) == 0
@@ -0,0 +1,127 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import LineString, Polygon
+
+import cudf
+
+import cuspatial
+
+
+@pytest.fixture
+def boxes():
+    rng = np.random.default_rng(0)
+    corner = rng.uniform(0, 100, (3000, 2))
+    size = rng.uniform(0, 3, (3000, 2))
+    boxes = pd.DataFrame(
+        {
+            "minx": corner[:, 0],
+            "miny": corner[:, 1],
+            "maxx": corner[:, 0] + size[:, 0],
+            "maxy": corner[:, 1] + size[:, 1],
+        }
+    )
+    boxes.iloc[7] = np.nan
+    return boxes
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(1)
+    return cuspatial.GeoSeries.from_points_xy(rng.uniform(-10, 110, 400))
+
+
+def to_pandas(df):
+    return df if isinstance(df, pd.DataFrame) else df.to_pandas()
+
+
+def point_box_distances(boxes, points):
+    x = points.points.x.values_host[:, None]
+    y = points.points.y.values_host[:, None]
+    dx = np.maximum(
+        np.maximum(boxes.minx.values - x, x - boxes.maxx.values), 0
+    )
+    dy = np.maximum(
+        np.maximum(boxes.miny.values - y, y - boxes.maxy.values), 0
+    )
+    return np.nan_to_num(np.hypot(dx, dy), nan=np.inf)
+
+
+@pytest.mark.parametrize("device", [True, False])
+@pytest.mark.parametrize("node_size", [2, 16])
+def test_query(boxes, device, node_size):
+    tree = cuspatial.PackedRTree(
+        cudf.DataFrame.from_pandas(boxes, nan_as_null=False)
+        if device
+        else boxes,
+        node_size,
+        device,
+    )
+    assert len(tree) == len(boxes) - 1
+
+    queries = boxes.iloc[::10].reset_index(drop=True).fillna(50)
+    got = to_pandas(tree.query(queries, batch_size=37))
+    expected = [
+        (i, j)
+        for i, q in queries.iterrows()
+        for j in np.flatnonzero(
+            (boxes.minx <= q.maxx)
+            & (boxes.maxx >= q.minx)
+            & (boxes.miny <= q.maxy)
+            & (boxes.maxy >= q.miny)
+        )
+    ]
+    assert list(zip(got.query_index, got.bbox_index)) == expected
+
+
+@pytest.mark.parametrize("device", [True, False])
+def test_query_points(boxes, points, device):
+    tree = cuspatial.PackedRTree(boxes, device=device)
+    got = to_pandas(tree.query_points(points))
+    contains = point_box_distances(boxes, points) == 0
+    expected = list(zip(*np.nonzero(contains)))
+    assert list(zip(got.point_index, got.bbox_index)) == expected
+
+
+@pytest.mark.parametrize("device", [True, False])
+@pytest.mark.parametrize("k", [1, 4])
+def test_nearest(boxes, points, device, k):
+    tree = cuspatial.PackedRTree(boxes, node_size=4, device=device)
+    got = to_pandas(tree.nearest(points, k=k, batch_size=100))
+    distances = point_box_distances(boxes, points)
+
+    np.testing.assert_array_equal(
+        got.point_index, np.repeat(np.arange(len(points)), k)
+    )
+    np.testing.assert_allclose(
+        got.distance.values.reshape(-1, k), np.sort(distances, axis=1)[:, :k]
+    )
+    np.testing.assert_allclose(
+        distances[got.point_index, got.bbox_index], got.distance
+    )
+
+
+def test_from_geoseries():
+    gs = cuspatial.GeoSeries(
+        [
+            Polygon([(0, 0), (1, 0), (1, 1), (0, 0)]),
+            None,
+            LineString([(5, 5), (6, 7)]),
+        ]
+    )
+    tree = cuspatial.PackedRTree.from_geoseries(gs)
+    assert sorted(tree.bbox_index.tolist()) == [0, 2]
+    got = tree.query_points(cuspatial.GeoSeries.from_points_xy([5.5, 6]))
+    assert got["bbox_index"].values_host.tolist() == [2]
+
+
+def test_empty():
+    tree = cuspatial.PackedRTree(
+        pd.DataFrame(columns=["minx", "miny", "maxx", "maxy"], dtype="f8"),
+        device=False,
+    )
+    assert len(tree) == 0
+    points = cuspatial.GeoSeries.from_points_xy([0, 0])
+    assert len(tree.nearest(points)) == 0
+    assert len(tree.query_points(points)) == 0
@@ -2,7 +2,7 @@
 
 import pytest
 from geopandas.testing import assert_geoseries_equal
-from shapely.geometry import Point
+from shapely.geometry import LineString, MultiPoint, Point, Polygon
 
 import cudf
 
@@ -105,3 +105,33 @@ def test_values():
     assert_geoseries_equal(
         result.to_geopandas(), expected.to_geopandas(), check_less_precise=True
     )
+
+
+def test_mixed_geometries():
+    cam_lon, cam_lat = -90.66511046, 42.49197018
+    coords = [
+        (-90.66518941, 42.49207437),
+        (-90.66540743, 42.49202408),
+        (-90.66489239, 42.49266787),
+    ]
+    lonlat = cuspatial.GeoSeries(
+        [
+            Point(coords[0]),
+            LineString(coords),
+            None,
+            Polygon(coords),
+            MultiPoint(coords[1:]),
+        ]
+    )
+    projected = cuspatial.sinusoidal_projection(
+        cam_lon,
+        cam_lat,
+        cuspatial.GeoSeries([Point(c) for c in coords]),
+    ).to_geopandas()
+    xy = [(p.x, p.y) for p in projected]
+    expected = cuspatial.GeoSeries(
+        [Point(xy[0]), LineString(xy), None, Polygon(xy), MultiPoint(xy[1:])]
+    )
+
+    result = cuspatial.sinusoidal_projection(cam_lon, cam_lat, lonlat)
+    assert_geoseries_equal(result.to_geopandas(), expected.to_geopandas())
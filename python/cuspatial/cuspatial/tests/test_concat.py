@@ -0,0 +1,94 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from geopandas.testing import assert_geoseries_equal
+from shapely.geometry import Point
+
+import cudf
+
+import cuspatial
+
+
+def test_concat(gs):
+    cugs = cuspatial.from_geopandas(gs)
+    parts = [cugs[0:5], cugs[[11, 3]], cugs[5:12]]
+    got = cuspatial.concat(parts)
+    expected = pd.concat([gs[0:5], gs.iloc[[11, 3]], gs[5:12]])
+    assert_geoseries_equal(expected, got.to_geopandas())
+
+
+def test_concat_selections(gs):
+    cugs = cuspatial.from_geopandas(gs)
+    mask = cudf.Series([i % 3 == 0 for i in range(len(gs))])
+    got = cuspatial.concat([cugs[:2], cugs[3:], cugs.loc[[4, 8]], cugs[mask]])
+    expected = pd.concat(
+        [gs[:2], gs[3:], gs.loc[[4, 8]], gs[mask.to_pandas().values]]
+    )
+    assert_geoseries_equal(expected, got.to_geopandas())
+
+
+def test_concat_ignore_index_and_nulls():
+    first = gpd.GeoSeries([Point(0, 0), None], name="geometry")
+    second = gpd.GeoSeries([None, Point(1, 1)], name="geometry")
+    got = cuspatial.concat(
+        [cuspatial.GeoSeries(first), cuspatial.GeoSeries(second)],
+        ignore_index=True,
+    )
+    assert got.name == "geometry"
+    assert_geoseries_equal(
+        pd.concat([first, second], ignore_index=True), got.to_geopandas()
+    )
+
+
+@pytest.mark.parametrize("ignore_index", [False, True])
+def test_concat_geodataframes(gs, ignore_index):
+    gpdf = gpd.GeoDataFrame(
+        {"id": range(len(gs)), "geometry": gs, "value": [0.5] * len(gs)}
+    )
+    cugpdf = cuspatial.from_geopandas(gpdf)
+    got = cuspatial.concat(
+        [cugpdf[5:12], cugpdf[0:5], cugpdf.iloc[[11, 3]]],
+        ignore_index=ignore_index,
+    )
+    expected = pd.concat(
+        [gpdf[5:12], gpdf[0:5], gpdf.iloc[[11, 3]]], ignore_index=ignore_index
+    )
+    assert isinstance(got, cuspatial.GeoDataFrame)
+    pd.testing.assert_frame_equal(expected, got.to_pandas())
+
+
+def test_concat_geodataframes_invalid(gs):
+    cugpdf = cuspatial.from_geopandas(gpd.GeoDataFrame({"geometry": gs}))
+    with pytest.raises(ValueError, match="different columns"):
+        cuspatial.concat([cugpdf, cugpdf.rename(columns={"geometry": "g"})])
+    with pytest.raises(TypeError):
+        cuspatial.concat([cugpdf, cugpdf["geometry"]])
+
+
+def test_concat_invalid():
+    with pytest.raises(ValueError, match="No objects"):
+        cuspatial.concat([])
+    with pytest.raises(TypeError):
+        cuspatial.concat([cudf.Series([1.0])])
+
+
+@pytest.mark.parametrize("capacity", [1, 1024])
+def test_builder(gs, capacity):
+    cugs = cuspatial.from_geopandas(gs)
+    builder = cuspatial.GeoSeriesBuilder(name="geometry", capacity=capacity)
+    for start in range(0, 12, 5):
+        builder.append(cugs[start : start + 5])
+    first = builder.build()
+    builder.append(cugs[[9, 0]])
+    got = builder.build()
+
+    assert len(builder) == 14
+    assert_geoseries_equal(
+        gs.rename("geometry").reset_index(drop=True), first.to_geopandas()
+    )
+    assert_geoseries_equal(
+        pd.concat([gs, gs.iloc[[9, 0]]], ignore_index=True).rename("geometry"),
+        got.to_geopandas(),
+    )
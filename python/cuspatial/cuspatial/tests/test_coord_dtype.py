@@ -0,0 +1,148 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import geopandas as gpd
+import numpy as np
+import pyarrow as pa
+import pytest
+from geopandas.testing import assert_geoseries_equal
+from shapely.geometry import LineString, Point, Polygon
+
+import cudf
+
+import cuspatial
+
+
+def test_astype_coords(gs):
+    cugs = cuspatial.from_geopandas(gs)
+    got = cugs.astype_coords("float32")
+    assert got.coord_dtype == np.float32
+    assert got.points.xy.dtype == np.float32
+    assert got.polygons.x.dtype == np.float32
+    assert got.astype_coords(np.float32) is got
+    assert_geoseries_equal(gs, got.astype_coords("float64").to_geopandas())
+    assert_geoseries_equal(gs, got.to_geopandas())
+
+
+def test_astype_coords_precision_check():
+    points = cuspatial.GeoSeries.from_points_xy([0.5, 1e6 + 0.1])
+    points.astype_coords("float32", max_error=0.1)
+    with pytest.raises(ValueError, match="max_error"):
+        points.astype_coords("float32", max_error=1e-3)
+    with pytest.raises(ValueError, match="overflow"):
+        cuspatial.GeoSeries.from_points_xy([0.0, 1e300]).astype_coords(
+            "float32"
+        )
+    with pytest.raises(ValueError, match="float32 or float64"):
+        points.astype_coords("int32")
+
+
+def test_from_geopandas_coord_dtype(gpdf):
+    got = cuspatial.from_geopandas(gpdf, coord_dtype="float32")
+    assert got["geometry"].coord_dtype == np.float32
+    got = cuspatial.from_geopandas(gpdf["geometry"], coord_dtype="float32")
+    assert got.coord_dtype == np.float32
+
+
+def test_from_geopandas_max_error(gpdf):
+    got = cuspatial.from_geopandas(gpdf["geometry"], coord_dtype="float32")
+    for child in ("points", "mpoints", "lines", "polygons"):
+        assert getattr(got._column, child).dtype.leaf_type == np.float32
+
+    points = gpd.GeoSeries([Point(0.5, 1e6 + 0.1)], name="geometry")
+    cuspatial.from_geopandas(points, coord_dtype="float32", max_error=0.1)
+    with pytest.raises(ValueError, match="max_error"):
+        cuspatial.from_geopandas(points, coord_dtype="float32", max_error=1e-3)
+    with pytest.raises(ValueError, match="max_error"):
+        cuspatial.from_geopandas(
+            gpd.GeoDataFrame({"id": [0]}, geometry=points),
+            coord_dtype="float32",
+            max_error=1e-3,
+        )
+
+
+@pytest.mark.parametrize("encoding", ["WKB", "geoarrow"])
+def test_readers_max_error(tmp_path, encoding):
+    path = tmp_path / "points.parquet"
+    gpdf = gpd.GeoDataFrame(geometry=[Point(0.5, 1e6 + 0.1)])
+    cuspatial.from_geopandas(gpdf).to_geoparquet(path, encoding=encoding)
+    got = cuspatial.read_geoparquet(path, coord_dtype="float32", max_error=0.1)
+    assert got["geometry"].coord_dtype == np.float32
+    with pytest.raises(ValueError, match="max_error"):
+        cuspatial.read_geoparquet(path, coord_dtype="float32", max_error=1e-3)
+    with pytest.raises(ValueError, match="max_error"):
+        list(
+            cuspatial.io.iter_batches(
+                path, coord_dtype="float32", max_error=1e-3, prefetch=0
+            )
+        )
+
+
+def test_to_arrow_float32(gs):
+    cugs = cuspatial.from_geopandas(gs, coord_dtype="float32")
+    got = cuspatial.GeoSeries.from_arrow(cugs.to_arrow())
+    assert got.coord_dtype == np.float32
+    assert_geoseries_equal(gs, got.to_geopandas())
+
+
+@pytest.mark.parametrize("encoding", ["WKB", "geoarrow"])
+def test_read_geoparquet_coord_dtype(tmp_path, encoding):
+    path = tmp_path / "lines.parquet"
+    gpdf = gpd.GeoDataFrame(
+        geometry=[LineString([(0, 0), (1, 1)]), LineString([(2, 2), (3, 4)])]
+    )
+    cuspatial.from_geopandas(gpdf).to_geoparquet(path, encoding=encoding)
+    got = cuspatial.read_geoparquet(path, coord_dtype="float32")
+    assert got["geometry"].coord_dtype == np.float32
+    assert_geoseries_equal(gpdf.geometry, got["geometry"].to_geopandas())
+
+
+@pytest.mark.parametrize("interleaved", [True, False])
+def test_to_geoarrow_float32(interleaved):
+    gs = gpd.GeoSeries([Point(0, 1), None, Point(2, 3)])
+    cugs = cuspatial.from_geopandas(gs, coord_dtype="float32")
+    array = cugs.to_geoarrow(interleaved=interleaved)
+    coords = array.storage.values if interleaved else array.storage.field(0)
+    assert coords.type == pa.float32()
+    got = cuspatial.GeoSeries.from_arrow(array)
+    assert got.coord_dtype == np.float32
+    assert_geoseries_equal(gs, got.to_geopandas())
+
+
+def test_geoparquet_native_keeps_float32(tmp_path):
+    path = tmp_path / "polygons.parquet"
+    gpdf = gpd.GeoDataFrame(
+        geometry=[Polygon([(0, 0), (1, 0), (1, 1), (0, 0)]), None]
+    )
+    cuspatial.from_geopandas(gpdf, coord_dtype="float32").to_geoparquet(
+        path, encoding="geoarrow"
+    )
+    got = cuspatial.read_geoparquet(path)
+    assert got["geometry"].coord_dtype == np.float32
+    assert_geoseries_equal(gpdf.geometry, got["geometry"].to_geopandas())
+
+
+def test_spatial_preserves_float32():
+    points = cuspatial.GeoSeries(
+        [Point(0, 0), Point(3, 4), Point(0.5, 0.5)]
+    ).astype_coords("float32")
+    distance = cuspatial.pairwise_point_distance(points[:2], points[1:])
+    assert distance.dtype == np.float32
+
+    polygons = cuspatial.GeoSeries(
+        [Polygon([(0, 0), (1, 0), (1, 1), (0, 0)])]
+    ).astype_coords("float32")
+    bounds = cuspatial.polygon_bounding_boxes(polygons)
+    assert (bounds.dtypes == np.float32).all()
+    cudf.testing.assert_series_equal(
+        polygons.contains_properly(points[2:]),
+        cudf.Series([True]),
+        check_names=False,
+    )
+
+
+def test_mixed_coord_dtypes_promote():
+    points32 = cuspatial.GeoSeries([Point(0, 0)]).astype_coords("float32")
+    points64 = cuspatial.GeoSeries([Point(3, 4)])
+    distance = cuspatial.pairwise_point_distance(points32, points64)
+    assert distance.dtype == np.float64
+    assert distance.values_host[0] == 5.0
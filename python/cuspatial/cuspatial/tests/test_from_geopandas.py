@@ -1,7 +1,9 @@
-# Copyright (c) 2020-2021, NVIDIA CORPORATION.
+# Copyright (c) 2020-2023, NVIDIA CORPORATION.
 import geopandas as gpd
 import pandas as pd
+import pytest
 from shapely.geometry import (
+    GeometryCollection,
     LineString,
     MultiLineString,
     MultiPoint,
@@ -213,3 +215,53 @@ def test_from_geopandas_multipolygon():
         ),
         cudf.Series([0, 2], dtype="int32"),
     )
+
+
+def test_from_geopandas_union_offsets():
+    gs = gpd.GeoSeries(
+        [
+            Point(0, 0),
+            None,
+            LineString([(0, 0), (1, 1)]),
+            Point(1, 1),
+            MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3)]]),
+        ]
+    )
+    cugs = cuspatial.from_geopandas(gs)
+    cudf.testing.assert_series_equal(
+        cugs._column._meta.input_types,
+        cudf.Series([0, -1, 2, 0, 2], dtype="int8"),
+    )
+    cudf.testing.assert_series_equal(
+        cugs._column._meta.union_offsets,
+        cudf.Series([0, -1, 0, 1, 1], dtype="int32"),
+    )
+    assert gs.equals(cugs.to_geopandas())
+
+
+def test_from_geopandas_geometrycollection_raises():
+    gs = gpd.GeoSeries([GeometryCollection([Point(0, 0)])])
+    with pytest.raises(TypeError):
+        cuspatial.from_geopandas(gs)
+
+
+def test_from_geopandas_drops_z():
+    gs = gpd.GeoSeries(
+        [
+            Point(0, 1, 2),
+            MultiPoint([(3, 4, 5), (6, 7, 8)]),
+            LineString([(0, 0, 9), (1, 1, 9)]),
+            Polygon([(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 0, 1)]),
+        ]
+    )
+    cugs = cuspatial.from_geopandas(gs)
+    expected = gpd.GeoSeries.from_wkt(
+        [
+            "POINT (0 1)",
+            "MULTIPOINT (3 4, 6 7)",
+            "LINESTRING (0 0, 1 1)",
+            "POLYGON ((0 0, 1 0, 1 1, 0 0))",
+        ]
+    )
+    assert expected.equals(cugs.to_geopandas())
+    assert cugs.points.xy.values_host.tolist() == [0.0, 1.0]
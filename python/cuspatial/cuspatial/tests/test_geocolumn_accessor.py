@@ -11,6 +11,8 @@ from shapely.geometry import (
     Polygon,
 )
 
+import cudf
+
 import cuspatial
 
 
@@ -250,3 +252,53 @@ def test_multipolygons_ring_offset(range, expected):
     got = t1.polygons.ring_offset
     expected = cp.array(expected)
     assert cp.array_equal(got, expected)
+
+
+@pytest.mark.parametrize("item", [slice(1, 4), [1, 2, 3], [3, 1]])
+def test_polygon_accessor_views(item):
+    polygons = [
+        Polygon([(0, 0), (1, 0), (1, 1), (0, 0)]),
+        MultiPolygon(
+            [
+                Polygon([(2, 2), (3, 2), (3, 3), (2, 2)]),
+                Polygon([(4, 4), (5, 4), (5, 5), (4, 4)]),
+            ]
+        ),
+        Polygon(
+            [(6, 6), (9, 6), (9, 9), (6, 9), (6, 6)],
+            [[(7, 7), (8, 7), (8, 8), (7, 7)]],
+        ),
+        Polygon([(10, 10), (11, 10), (11, 11), (10, 10)]),
+    ]
+    gs = cuspatial.from_geopandas(gpd.GeoSeries(polygons))[item]
+    expected = cuspatial.from_geopandas(gpd.GeoSeries(polygons).iloc[item])
+
+    for attr in ("geometry_offset", "part_offset", "ring_offset"):
+        assert cp.array_equal(
+            getattr(gs.polygons, attr), getattr(expected.polygons, attr)
+        )
+    for attr in ("x", "y", "xy"):
+        cudf.testing.assert_series_equal(
+            getattr(gs.polygons, attr), getattr(expected.polygons, attr)
+        )
+    assert gs.polygons.x._column is gs.polygons.x._column
+
+
+def test_accessor_cache_follows_types():
+    gs = cuspatial.GeoSeries.from_points_xy([0.0, 1.0, 2.0, 3.0])
+    assert len(gs.points.x) == 2
+    meta = gs._column._meta
+    meta.input_types = cudf.Series([-1, 0], dtype="int8")
+    meta.union_offsets = cudf.Series([-1, 1], dtype="int32")
+    cudf.testing.assert_series_equal(gs.points.x, cudf.Series([2.0]))
+
+
+def test_accessor_series_are_not_shared():
+    gs = cuspatial.GeoSeries.from_points_xy([0.0, 1.0, 2.0, 3.0])
+    expected = cudf.Series([0.0, 2.0])
+    x = gs.points.x
+    x -= 1
+    x.name = "x"
+    x.index = cudf.Index([5, 6])
+    cudf.testing.assert_series_equal(gs.points.x, expected)
+    assert gs.points.xy is not gs.points.xy
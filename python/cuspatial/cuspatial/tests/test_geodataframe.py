@@ -469,3 +469,14 @@ def test_apply_boolean_mask_length_one(mask_factory):
     got = d_geodf[mask]
 
     assert_geodataframe_equal(expected, got.to_geopandas())
+
+
+def test_repr_truncated():
+    geodf = gpd.GeoDataFrame(
+        {
+            "id": np.arange(1000),
+            "geometry": gpd.points_from_xy(np.arange(1000), np.arange(1000)),
+        }
+    )
+    d_geodf = cuspatial.from_geopandas(geodf)
+    assert repr(d_geodf) == repr(geodf) + "\n(GPU)\n"
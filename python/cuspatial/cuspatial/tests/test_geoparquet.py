@@ -0,0 +1,158 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import json
+
+import geopandas as gpd
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from shapely.geometry import Point, Polygon
+
+import cuspatial
+
+
+def test_read_geoparquet_wkb(tmp_path, gpdf):
+    path = tmp_path / "wkb.parquet"
+    gpdf.to_parquet(path)
+    got = cuspatial.read_geoparquet(path)
+    pd.testing.assert_frame_equal(gpdf, got.to_pandas())
+
+
+def test_read_geoparquet_columns(tmp_path, gpdf):
+    path = tmp_path / "wkb.parquet"
+    gpdf.to_parquet(path)
+    got = cuspatial.read_geoparquet(path, columns=["geometry", "integer"])
+    assert list(got.columns) == ["geometry", "integer"]
+    assert gpdf["geometry"].equals(got["geometry"].to_pandas())
+
+
+def _write_covered_points(path, xs, row_group_size):
+    points = gpd.GeoSeries([Point(x, x) for x in xs])
+    bbox = pa.StructArray.from_arrays(
+        [pa.array(xs, pa.float64())] * 4, ["xmin", "ymin", "xmax", "ymax"]
+    )
+    geo = {
+        "version": "1.1.0",
+        "primary_column": "geometry",
+        "columns": {
+            "geometry": {
+                "encoding": "point",
+                "geometry_types": ["Point"],
+                "covering": {
+                    "bbox": {
+                        key: ["bbox", key]
+                        for key in ["xmin", "ymin", "xmax", "ymax"]
+                    }
+                },
+            }
+        },
+    }
+    coords = pa.StructArray.from_arrays(
+        [pa.array(points.x), pa.array(points.y)], ["x", "y"]
+    )
+    table = pa.table(
+        {"id": pa.array(range(len(xs))), "geometry": coords, "bbox": bbox}
+    ).replace_schema_metadata({"geo": json.dumps(geo)})
+    pq.write_table(table, path, row_group_size=row_group_size)
+    return points
+
+
+def test_read_geoparquet_native_points(tmp_path):
+    path = tmp_path / "points.parquet"
+    expected = _write_covered_points(path, [0.0, 1.0, 2.0, 3.0], 2)
+    got = cuspatial.read_geoparquet(path, columns=["geometry"])
+    assert expected.equals(got["geometry"].to_pandas())
+
+
+def test_read_geoparquet_bbox(tmp_path):
+    path = tmp_path / "points.parquet"
+    _write_covered_points(path, [float(x) for x in range(8)], 2)
+    got = cuspatial.read_geoparquet(
+        path, columns=["id", "geometry"], bbox=(2.5, 2.5, 4.5, 4.5)
+    )
+    assert list(got.columns) == ["id", "geometry"]
+    assert got["id"].values_host.tolist() == [3, 4]
+
+
+def test_read_geoparquet_native_polygon(tmp_path):
+    path = tmp_path / "polygons.parquet"
+    polygons = gpd.GeoSeries(
+        [
+            Polygon([(0, 0), (1, 0), (1, 1), (0, 0)]),
+            Polygon([(2, 2), (3, 2), (3, 3), (2, 2)]),
+        ]
+    )
+    vertices = pa.list_(pa.struct([("x", pa.float64()), ("y", pa.float64())]))
+    rings = [
+        [[{"x": x, "y": y} for x, y in polygon.exterior.coords]]
+        for polygon in polygons
+    ]
+    geo = {
+        "version": "1.1.0",
+        "primary_column": "geometry",
+        "columns": {"geometry": {"encoding": "polygon"}},
+    }
+    table = pa.table(
+        {"geometry": pa.array(rings, type=pa.list_(vertices))}
+    ).replace_schema_metadata({"geo": json.dumps(geo)})
+    pq.write_table(table, path)
+    got = cuspatial.read_geoparquet(path)
+    assert polygons.equals(got["geometry"].to_pandas())
+
+
+@pytest.mark.parametrize("encoding", ["WKB", "geoarrow"])
+def test_to_geoparquet_roundtrip(tmp_path, encoding):
+    gpdf = gpd.GeoDataFrame(
+        {
+            "id": [0, 1, 2],
+            "geometry": [
+                Polygon([(0, 0), (1, 0), (1, 1), (0, 0)]),
+                None,
+                Polygon([(2, 2), (3, 2), (3, 3), (2, 2)]),
+            ],
+        }
+    )
+    path = tmp_path / "roundtrip.parquet"
+    cuspatial.from_geopandas(gpdf).to_geoparquet(path, encoding=encoding)
+    got = cuspatial.read_geoparquet(path, columns=["id", "geometry"])
+    pd.testing.assert_frame_equal(gpdf, got.to_pandas())
+
+
+def test_to_geoparquet_covering(tmp_path):
+    xs = [float(x) for x in range(8)]
+    gpdf = gpd.GeoDataFrame(
+        {"id": range(8), "geometry": [Point(x, x) for x in reversed(xs)]}
+    )
+    path = tmp_path / "sorted.parquet"
+    cuspatial.from_geopandas(gpdf).to_geoparquet(
+        path, encoding="geoarrow", sort_key="morton", row_group_size=2
+    )
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.num_row_groups == 4
+    got = cuspatial.read_geoparquet(path, bbox=(2.5, 2.5, 4.5, 4.5))
+    assert sorted(got["id"].values_host.tolist()) == [3, 4]
+
+
+@pytest.mark.parametrize("encoding", ["WKB", "geoarrow"])
+def test_to_geoparquet_morton_keeps_labels(tmp_path, encoding):
+    gpdf = gpd.GeoDataFrame(
+        {
+            "id": range(6),
+            "geometry": [Point(x, 5 - x) for x in [5, 0, 3, 1, 4, 2]],
+        }
+    )
+    path = tmp_path / "sorted.parquet"
+    cuspatial.from_geopandas(gpdf).to_geoparquet(
+        path, encoding=encoding, sort_key="morton"
+    )
+    got = cuspatial.read_geoparquet(path).to_pandas()
+    assert got.index.tolist() != list(range(6))
+    pd.testing.assert_frame_equal(gpdf, got.sort_index())
+
+
+def test_to_geoparquet_mixed_native_raises(tmp_path, gpdf):
+    with pytest.raises(ValueError):
+        cuspatial.from_geopandas(gpdf).to_geoparquet(
+            tmp_path / "mixed.parquet", encoding="geoarrow"
+        )
@@ -7,6 +7,7 @@ import cupy as cp
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from geopandas.testing import assert_geoseries_equal
 from shapely.affinity import rotate
@@ -757,3 +758,257 @@ def test_from_polygons_xy_example():
         [Polygon([(0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (0, 0)])]
     )
     gpd.testing.assert_geoseries_equal(gpolygon.to_geopandas(), hpolygon)
+
+
+def test_from_arrow_union(gs):
+    cugs = cuspatial.from_geopandas(gs)
+    got = cuspatial.GeoSeries.from_arrow(cugs.to_arrow())
+    assert_geoseries_equal(gs, got.to_geopandas())
+
+
+@pytest.mark.parametrize("interleaved", [True, False])
+@pytest.mark.parametrize(
+    "geoms, encoding",
+    [
+        ([Point(0, 1), None, Point(2, 3)], "point"),
+        ([MultiPoint([(0, 1), (2, 3)]), None], "multipoint"),
+        ([LineString([(0, 1), (2, 3)]), None], "linestring"),
+        (
+            [MultiLineString([[(0, 1), (2, 3)], [(4, 5), (6, 7)]]), None],
+            "multilinestring",
+        ),
+        ([Polygon([(0, 0), (1, 0), (1, 1)]), None], "polygon"),
+        (
+            [
+                MultiPolygon(
+                    [
+                        Polygon([(0, 0), (1, 0), (1, 1)]),
+                        Polygon([(5, 5), (6, 5), (6, 6)]),
+                    ]
+                ),
+                None,
+            ],
+            "multipolygon",
+        ),
+    ],
+)
+def test_geoarrow_roundtrip(geoms, encoding, interleaved):
+    expected = gpd.GeoSeries(geoms)
+    arrow = cuspatial.GeoSeries(expected).to_geoarrow(interleaved=interleaved)
+    assert arrow.type.extension_name == f"geoarrow.{encoding}"
+    assert arrow.null_count == 1
+    got = cuspatial.GeoSeries.from_arrow(arrow)
+    assert_geoseries_equal(expected, got.to_geopandas())
+
+
+def test_geoarrow_interleaved_field_name():
+    arrow = cuspatial.GeoSeries([Point(0, 1)]).to_geoarrow(interleaved=True)
+    assert arrow.type.storage_type.value_field.name == "xy"
+
+
+def test_geoarrow_types_not_registered():
+    # Another GeoArrow implementation can still register the names
+    geoarrow_type = cuspatial.GeoSeries([Point(0, 1)]).to_geoarrow().type
+    pa.register_extension_type(geoarrow_type)
+    pa.unregister_extension_type("geoarrow.point")
+
+
+def test_geoarrow_mixed_is_wkb(gs):
+    arrow = cuspatial.from_geopandas(gs).to_geoarrow()
+    assert arrow.type.extension_name == "geoarrow.wkb"
+    got = cuspatial.GeoSeries.from_arrow(arrow)
+    assert_geoseries_equal(gs, got.to_geopandas())
+
+
+def test_geoarrow_capsule_interface():
+    expected = gpd.GeoSeries([LineString([(0, 1), (2, 3)])] * 3)
+    cugs = cuspatial.GeoSeries(expected)
+
+    class ArrayExporter:
+        def __arrow_c_array__(self, requested_schema=None):
+            return cugs.__arrow_c_array__(requested_schema)
+
+    class StreamExporter:
+        def __arrow_c_stream__(self, requested_schema=None):
+            return cugs.__arrow_c_stream__(requested_schema)
+
+    for exporter in (ArrayExporter(), StreamExporter()):
+        got = cuspatial.GeoSeries.from_arrow(exporter)
+        assert_geoseries_equal(expected, got.to_geopandas())
+
+
+def test_from_arrow_storage_requires_encoding():
+    storage = cuspatial.GeoSeries.from_points_xy([0.0, 1.0]).to_geoarrow()
+    with pytest.raises(ValueError, match="pass `encoding`"):
+        cuspatial.GeoSeries.from_arrow(storage.storage)
+    got = cuspatial.GeoSeries.from_arrow(storage.storage, encoding="point")
+    assert_geoseries_equal(gpd.GeoSeries([Point(0, 1)]), got.to_geopandas())
+
+
+def test_column_type_from_cached_type_counts(gs):
+    from cuspatial.core._column.geocolumn import ColumnType
+    from cuspatial.core._column.geometa import Feature_Enum
+    from cuspatial.utils.column_utils import has_multipolygons
+
+    cugs = cuspatial.from_geopandas(gs)
+    assert cugs.column_type == ColumnType.MIXED
+    assert "type_counts" in cugs._column._meta._cache
+    assert cugs[0:1].column_type == ColumnType.POINT
+    assert cugs[0:4].column_type == ColumnType.MULTIPOINT
+    assert cugs[4:8].column_type == ColumnType.LINESTRING
+    assert cugs[8:12].column_type == ColumnType.POLYGON
+    assert not has_multipolygons(cugs[8:9])
+    assert has_multipolygons(cugs[8:12])
+
+    meta = cugs[0:1]._column._meta
+    assert meta.type_counts[Feature_Enum.POINT] == 1
+    meta.input_types = cudf.Series([Feature_Enum.NONE.value], dtype="int8")
+    assert meta.type_counts[Feature_Enum.POINT] == 0
+    assert meta.type_counts[Feature_Enum.NONE] == 1
+
+
+@pytest.mark.parametrize("item", [slice(2, 7), [11, 0, 5, 5], slice(8, 12)])
+def test_compact(gs, item):
+    cugs = cuspatial.from_geopandas(gs)
+    selection = cugs.iloc[item]
+    compacted, reclaimed = selection.compact(return_reclaimed=True)
+    assert reclaimed == (
+        selection._column.memory_usage - compacted._column.memory_usage
+    )
+    assert compacted._column.referenced_fraction == 1.0
+    cudf.testing.assert_index_equal(selection.index, compacted.index)
+    assert_geoseries_equal(selection.to_geopandas(), compacted.to_geopandas())
+    assert selection.compact(threshold=0.0) is selection
+
+
+def test_compact_points_reclaimed():
+    points = cuspatial.GeoSeries.from_points_xy(cp.arange(200.0))
+    compacted, reclaimed = points[:10].compact(return_reclaimed=True)
+    assert reclaimed == 1800
+    cudf.testing.assert_series_equal(
+        compacted.points.xy, points.points.xy[:20]
+    )
+
+
+def test_auto_compact(monkeypatch):
+    points = cuspatial.GeoSeries.from_points_xy(cp.arange(200.0))
+    monkeypatch.setattr(cuspatial.GeoSeries, "auto_compact_threshold", 0.5)
+    assert len(points.iloc[:60]._column.points) == 100
+    assert len(points.iloc[:40]._column.points) == 40
+
+
+def test_loc_hash_index(gs):
+    gs.index = [10 * i for i in range(12)]
+    cugs = cuspatial.from_geopandas(gs)
+    assert cugs.loc[30] == gs.loc[30]
+    labels = cugs.loc._labels
+    assert_eq_geo(gs.loc[[110, 0, 50]], cugs.loc[[110, 0, 50]].to_geopandas())
+    assert_eq_geo(gs.loc[20:70], cugs.loc[20:70].to_geopandas())
+    assert_eq_geo(
+        gs.loc[[50, 60]],
+        cugs.loc[cudf.Series([50, 60])].to_geopandas(),
+    )
+    assert cugs.loc._labels is labels
+    with pytest.raises(KeyError):
+        cugs.loc[[0, 5]]
+
+    cugs.index = cudf.Index(list("abcdefghijkl"))
+    assert cugs.loc["b"] == gs.iloc[1]
+
+
+def test_loc_duplicate_labels(gs):
+    gs.index = [0, 1, 1, 2] * 3
+    cugs = cuspatial.from_geopandas(gs)
+    got = cugs.loc[[2, 1]]
+    assert list(got.index.to_pandas()) == list(gs.loc[[2, 1]].index)
+    assert_eq_geo(
+        gs.loc[[2, 1]].reset_index(drop=True),
+        got.to_geopandas().reset_index(drop=True),
+    )
+
+    # A duplicated scalar label selects every row with the label
+    got = cugs.loc[1]
+    assert isinstance(got, cuspatial.GeoSeries)
+    assert_eq_geo(gs.loc[1], got.to_geopandas())
+    assert cugs.loc[0].index.to_pandas().tolist() == [0, 0, 0]
+
+    # Sorted duplicates are located with a slice
+    gs.index = sorted(gs.index)
+    cugs = cuspatial.from_geopandas(gs)
+    assert_eq_geo(gs.loc[1], cugs.loc[1].to_geopandas())
+
+
+def test_bounds(gs):
+    gs = pd.concat([gs, gpd.GeoSeries([None])], ignore_index=True)
+    cugs = cuspatial.from_geopandas(gs)
+    pd.testing.assert_frame_equal(gs.bounds, cugs.bounds.to_pandas())
+    np.testing.assert_array_equal(gs.total_bounds, cugs.total_bounds)
+    assert cugs.bounds.index.equals(cugs.index)
+
+    sliced = cugs[3:9]
+    pd.testing.assert_frame_equal(gs[3:9].bounds, sliced.bounds.to_pandas())
+    np.testing.assert_array_equal(gs[3:9].total_bounds, sliced.total_bounds)
+
+
+def test_bounds_cached():
+    points = cuspatial.GeoSeries.from_points_xy([0.0, 1.0, 2.0, 3.0])
+    meta = points._column._meta
+    first = points.bounds
+    assert "bounds" in meta._cache
+    pd.testing.assert_frame_equal(first.to_pandas(), points.bounds.to_pandas())
+    meta.input_types = meta.input_types
+    assert "bounds" not in meta._cache
+
+
+def test_bounds_not_shared():
+    points = cuspatial.GeoSeries.from_points_xy([0.0, 1.0, 2.0, 3.0])
+    expected = points.bounds.to_pandas()
+    bounds = points.bounds
+    bounds["minx"] -= 1
+    bounds.loc[0, "maxy"] = 10.0
+    pd.testing.assert_frame_equal(expected, points.bounds.to_pandas())
+
+
+def test_binpred_mixed_geometries():
+    lhs = cuspatial.GeoSeries(
+        [
+            Point(0, 0),
+            LineString([(0, 0), (1, 1)]),
+            None,
+            Point(2, 2),
+            LineString([(0, 1), (1, 0)]),
+        ]
+    )
+    rhs = cuspatial.GeoSeries(
+        [
+            Point(0, 0),
+            LineString([(1, 0), (0, 1)]),
+            Point(0, 0),
+            Point(3, 3),
+            LineString([(5, 5), (6, 6)]),
+        ]
+    )
+    got = lhs.intersects(rhs).to_pandas(nullable=True)
+    expected = lhs.to_geopandas().intersects(rhs.to_geopandas())
+    expected = expected.astype("boolean").mask(lhs.to_geopandas().isna())
+    pd.testing.assert_series_equal(got, expected)
+
+
+def test_repr_truncated(monkeypatch):
+    points = cuspatial.GeoSeries.from_points_xy(cp.arange(2000.0))
+    points.name = "geometry"
+    expected = repr(points.to_geopandas())
+
+    converted = []
+    to_geopandas = cuspatial.GeoSeries.to_geopandas
+
+    def counting_to_geopandas(self, *args, **kwargs):
+        converted.append(len(self))
+        return to_geopandas(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        cuspatial.GeoSeries, "to_geopandas", counting_to_geopandas
+    )
+    assert repr(points) == expected
+    assert "Length: 1000" in repr(points)
+    assert sum(converted) <= 2 * (pd.get_option("display.max_rows") + 2)
@@ -0,0 +1,54 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import geopandas as gpd
+import pytest
+
+import cudf
+
+import cuspatial
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(tmp_path, gs, mmap):
+    path = tmp_path / "geoseries.arrow"
+    cugs = cuspatial.from_geopandas(gs)
+    cugs.name = "geometry"
+    cugs.save(path)
+    got = cuspatial.GeoSeries.load(path, mmap=mmap)
+    assert got.name == "geometry"
+    cudf.testing.assert_index_equal(cugs.index, got.index)
+    gpd.testing.assert_geoseries_equal(
+        gs.rename("geometry"), got.to_geopandas()
+    )
+
+
+def test_save_load_sliced_with_index(tmp_path, gs):
+    path = tmp_path / "geoseries.arrow"
+    cugs = cuspatial.from_geopandas(gs)[3:9]
+    cugs.save(path)
+    got = cuspatial.GeoSeries.load(path)
+    cudf.testing.assert_index_equal(cugs.index, got.index)
+    gpd.testing.assert_geoseries_equal(cugs.to_geopandas(), got.to_geopandas())
+
+
+def test_save_load_quadtree(tmp_path):
+    path = tmp_path / "points.arrow"
+    points = cuspatial.GeoSeries.from_points_xy(
+        cudf.Series([0.5, 0.5, 1.5, 1.5, 0.25, 1.75])
+    )
+    point_indices, quadtree = cuspatial.quadtree_on_points(
+        points, 0, 2, 0, 2, 1, 1, 1
+    )
+    points.save(path, quadtree=(point_indices, quadtree))
+    got, (got_indices, got_quadtree) = cuspatial.GeoSeries.load(
+        path, quadtree=True
+    )
+    gpd.testing.assert_geoseries_equal(
+        points.to_geopandas(), got.to_geopandas()
+    )
+    cudf.testing.assert_series_equal(point_indices, got_indices)
+    cudf.testing.assert_frame_equal(quadtree, got_quadtree)
+
+    points.save(path)
+    with pytest.raises(ValueError, match="does not hold a quadtree"):
+        cuspatial.GeoSeries.load(path, quadtree=True)
@@ -0,0 +1,55 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import geopandas as gpd
+import pandas as pd
+import pyarrow as pa
+import pytest
+import shapely
+from shapely.geometry import Point
+
+import cuspatial
+
+
+def _collect(batches):
+    return pd.concat(
+        [batch.to_geopandas() for batch in batches], ignore_index=True
+    )
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_batches_geoparquet(tmp_path, gpdf, prefetch):
+    path = tmp_path / "wkb.parquet"
+    gpdf.to_parquet(path, row_group_size=3)
+    batches = list(
+        cuspatial.io.iter_batches(path, batch_rows=4, prefetch=prefetch)
+    )
+    assert [len(batch) for batch in batches] == [4, 4, 4]
+    gpd.testing.assert_geoseries_equal(
+        gpdf["geometry"].reset_index(drop=True), _collect(batches)
+    )
+
+
+def test_iter_batches_ipc_native(tmp_path):
+    expected = gpd.GeoSeries([Point(i, -i) for i in range(10)])
+    arrow = cuspatial.GeoSeries(expected).to_geoarrow()
+    path = tmp_path / "points.arrow"
+    table = pa.table({"id": range(10), "geometry": arrow})
+    with pa.ipc.new_file(path, table.schema) as writer:
+        writer.write_table(table, max_chunksize=3)
+    batches = list(cuspatial.io.iter_batches(path, batch_rows=4))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    gpd.testing.assert_geoseries_equal(expected, _collect(batches))
+
+
+def test_iter_batches_wkb(gs):
+    wkb = pa.array(shapely.to_wkb(gs.values), type=pa.binary())
+    batches = list(cuspatial.io.iter_batches(wkb, batch_rows=5))
+    assert [len(batch) for batch in batches] == [5, 5, 2]
+    gpd.testing.assert_geoseries_equal(gs, _collect(batches))
+
+
+def test_iter_batches_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError, match="batch_rows"):
+        cuspatial.io.iter_batches([], batch_rows=0)
+    with pytest.raises(ValueError, match="infer the format"):
+        cuspatial.io.iter_batches(tmp_path / "points.csv")
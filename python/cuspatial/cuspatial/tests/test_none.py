@@ -1,7 +1,8 @@
 # Copyright (c) 2022 NVIDIA CORPORATION.
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point, Polygon
+from shapely.geometry import LineString, MultiPoint, Point, Polygon
 
 import cuspatial
 
@@ -46,3 +47,89 @@ def test_middle_from_geopandas():
     )
     got = cuspatial.from_geopandas(expected)
     pd.testing.assert_series_equal(expected, got.to_geopandas())
+
+
+def test_null_count():
+    gs = cuspatial.GeoSeries([None, Point(0, 1), None, Point(1, 2)])
+    assert gs.has_nulls
+    assert gs._column.null_count == 2
+    assert gs._column.valid_count == 2
+    assert gs.isna().to_pandas().tolist() == [True, False, True, False]
+    assert gs._column.validity_mask.get().tolist() == [0b1010]
+    assert cuspatial.GeoSeries([Point(0, 1)])._column.validity_mask is None
+
+
+def test_to_arrow_nulls():
+    expected = gpd.GeoSeries(
+        [None, Point(0, 1), Polygon([(0, 0), (1, 0), (1, 1)])]
+    )
+    cugs = cuspatial.from_geopandas(expected)
+    arrow = cugs.to_arrow()
+    assert arrow.to_pylist()[0] is None
+    got = cuspatial.GeoSeries.from_arrow(arrow)
+    assert got._column.null_count == 1
+    pd.testing.assert_series_equal(expected, got.to_geopandas())
+
+
+def test_distance_nulls():
+    points1 = cuspatial.GeoSeries([Point(0, 0), None, Point(1, 1)])
+    points2 = cuspatial.GeoSeries([Point(3, 4), Point(0, 0), None])
+    expected = pd.Series([5.0, None, None], dtype="Float64")
+    got = cuspatial.pairwise_point_distance(points1, points2)
+    pd.testing.assert_series_equal(got.to_pandas(nullable=True), expected)
+
+    # Arguments can still be passed by keyword
+    got = cuspatial.pairwise_point_distance(points1=points1, points2=points2)
+    pd.testing.assert_series_equal(got.to_pandas(nullable=True), expected)
+    got = cuspatial.haversine_distance(
+        p1=points1.iloc[:1], p2=points1.iloc[:1]
+    )
+    assert got.values_host.tolist() == [0.0]
+
+
+def test_hausdorff_nulls():
+    spaces = cuspatial.GeoSeries(
+        [MultiPoint([(0, 0), (1, 0)]), None, MultiPoint([(0, 1), (0, 2)])]
+    )
+    got = cuspatial.directed_hausdorff_distance(spaces).to_pandas(
+        nullable=True
+    )
+    expected = cuspatial.directed_hausdorff_distance(
+        spaces.iloc[[0, 2]]
+    ).to_pandas()
+    assert got.iloc[1].isna().all()
+    assert got[1].isna().all()
+    np.testing.assert_allclose(
+        got.iloc[[0, 2], [0, 2]].to_numpy(dtype="float64"),
+        expected.to_numpy(),
+    )
+
+
+def test_nearest_points_nulls():
+    points = cuspatial.GeoSeries([Point(0, 1), None, Point(2, 1)])
+    linestrings = cuspatial.GeoSeries(
+        [
+            LineString([(0, 0), (1, 0)]),
+            LineString([(0, 0), (1, 0)]),
+            None,
+        ]
+    )
+    got = cuspatial.pairwise_point_linestring_nearest_points(
+        points, linestrings
+    )
+    assert got["segment_id"].to_pandas(nullable=True).isna().tolist() == [
+        False,
+        True,
+        True,
+    ]
+    expected = gpd.GeoSeries([Point(0, 0), None, None])
+    assert expected.equals(got["geometry"].to_geopandas())
+
+
+def test_binpred_nulls():
+    points = cuspatial.GeoSeries([Point(0, 0), None, Point(1, 1)])
+    got = points.geom_equals(points)
+    pd.testing.assert_series_equal(
+        got.to_pandas(nullable=True),
+        pd.Series([True, None, True], dtype="boolean"),
+    )
@@ -0,0 +1,47 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import pickle
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+
+import cuspatial
+
+
+def _roundtrip_out_of_band(obj):
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    return pickle.loads(data, buffers=buffers), buffers
+
+
+@pytest.mark.parametrize("protocol", [2, 4, 5])
+def test_pickle_geoseries(gs, protocol):
+    cugs = cuspatial.from_geopandas(gs)[2:10]
+    got = pickle.loads(pickle.dumps(cugs, protocol=protocol))
+    assert isinstance(got, cuspatial.GeoSeries)
+    gpd.testing.assert_geoseries_equal(cugs.to_geopandas(), got.to_geopandas())
+
+
+def test_pickle_geoseries_out_of_band(gs):
+    cugs = cuspatial.from_geopandas(gs)
+    got, buffers = _roundtrip_out_of_band(cugs)
+    assert len(buffers) > 0
+    gpd.testing.assert_geoseries_equal(gs, got.to_geopandas())
+
+
+def test_pickle_geodataframe_out_of_band(gpdf):
+    cugpdf = cuspatial.from_geopandas(gpdf)
+    got, buffers = _roundtrip_out_of_band(cugpdf)
+    assert isinstance(got, cuspatial.GeoDataFrame)
+    assert len(buffers) > 0
+    pd.testing.assert_frame_equal(gpdf, got.to_pandas())
+
+
+def test_pickle_geocolumn_out_of_band(gs):
+    column = cuspatial.from_geopandas(gs)._column
+    got, buffers = _roundtrip_out_of_band(column)
+    assert len(buffers) > 0
+    gpd.testing.assert_geoseries_equal(
+        gs, cuspatial.GeoSeries(got).to_geopandas()
+    )
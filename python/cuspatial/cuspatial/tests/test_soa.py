@@ -0,0 +1,101 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point, Polygon
+
+import cudf
+
+import cuspatial
+
+
+def _pack_time(year, month, day, hour, minute, second, millisecond):
+    low = (
+        (year - 2000)
+        | (month - 1) << 6
+        | day << 10
+        | hour << 15
+        | minute << 20
+        | second << 26
+    )
+    return [low, millisecond << 12]
+
+
+def test_read_soa_points(tmp_path):
+    root = str(tmp_path / "locust")
+    np.array([3, 1, 3], dtype=np.int32).tofile(root + ".objectid")
+    np.array(
+        [
+            _pack_time(2017, 1, 1, 0, 0, 0, 0),
+            _pack_time(2017, 3, 1, 12, 30, 15, 250),
+            _pack_time(2020, 2, 29, 23, 59, 59, 999),
+        ],
+        dtype=np.uint32,
+    ).tofile(root + ".time")
+    # lat, lon, alt
+    np.array([[10.0, 20.0, 0.0], [11.0, 21.0, 0.0], [12.0, 22.0, 5.0]]).tofile(
+        root + ".location"
+    )
+
+    got = cuspatial.io.read_soa_points(root)
+    cudf.testing.assert_series_equal(
+        got["object_id"],
+        cudf.Series([3, 1, 3], dtype=np.int32, name="object_id"),
+    )
+    pd.testing.assert_series_equal(
+        got["timestamp"].to_pandas(),
+        pd.Series(
+            pd.to_datetime(
+                [
+                    "2017-01-01 00:00:00.000",
+                    "2017-03-01 12:30:15.250",
+                    "2020-02-29 23:59:59.999",
+                ]
+            ).astype("datetime64[ms]"),
+            name="timestamp",
+        ),
+    )
+    gpd.testing.assert_geoseries_equal(
+        got["geometry"].to_geopandas(),
+        gpd.GeoSeries(
+            [Point(20, 10), Point(21, 11), Point(22, 12)], name="geometry"
+        ),
+    )
+
+
+def test_read_soa_points_mismatched_files(tmp_path):
+    root = str(tmp_path / "locust")
+    np.array([1, 2], dtype=np.int32).tofile(root + ".objectid")
+    np.zeros((1, 2), dtype=np.uint32).tofile(root + ".time")
+    np.zeros((1, 3)).tofile(root + ".location")
+    with pytest.raises(ValueError, match="records"):
+        cuspatial.io.read_soa_points(root)
+
+
+def test_read_soa_polygons(tmp_path):
+    path = tmp_path / "polygons.ply"
+    shell = [(0, 0), (4, 0), (4, 4), (0, 4), (0, 0)]
+    hole = [(1, 1), (2, 1), (2, 2), (1, 1)]
+    other = [(5, 5), (6, 5), (6, 6), (5, 5)]
+    rings = [shell, hole, other]
+    vertices = np.array([v for ring in rings for v in ring], dtype=np.float64)
+    with open(path, "wb") as f:
+        np.array([1, 2, 3, len(vertices)], dtype=np.int32).tofile(f)
+        np.array([2], dtype=np.int32).tofile(f)
+        np.array([2, 1], dtype=np.int32).tofile(f)
+        np.array([len(ring) for ring in rings], dtype=np.int32).tofile(f)
+        vertices[:, 0].tofile(f)
+        vertices[:, 1].tofile(f)
+
+    got = cuspatial.io.read_soa_polygons(path)
+    gpd.testing.assert_geoseries_equal(
+        got.to_geopandas(),
+        gpd.GeoSeries([Polygon(shell, [hole]), Polygon(other)]),
+    )
+
+    with open(path, "ab") as f:
+        f.write(b"\0")
+    with pytest.raises(ValueError, match="header implies"):
+        cuspatial.io.read_soa_polygons(path)
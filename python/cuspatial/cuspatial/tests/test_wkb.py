@@ -0,0 +1,62 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+import shapely
+from shapely.geometry import LineString, Point
+
+import cuspatial
+
+
+def test_from_wkb(gs):
+    wkb = pa.array(shapely.to_wkb(gs.values), type=pa.binary())
+    got = cuspatial.GeoSeries.from_wkb(wkb)
+    gpd.testing.assert_geoseries_equal(gs, got.to_geopandas())
+
+
+@pytest.mark.parametrize("byte_order", [0, 1])
+@pytest.mark.parametrize("output_dimension", [2, 3])
+def test_from_wkb_byte_order_and_z(gs, byte_order, output_dimension):
+    geoms = gs.values
+    if output_dimension == 3:
+        geoms = shapely.force_3d(geoms, 1.0)
+    wkb = shapely.to_wkb(
+        geoms, byte_order=byte_order, output_dimension=output_dimension
+    )
+    got = cuspatial.GeoSeries.from_wkb(pd.Series(wkb, index=gs.index))
+    gpd.testing.assert_geoseries_equal(gs, got.to_geopandas())
+
+
+def test_from_wkb_nulls_and_ewkb():
+    geoms = shapely.set_srid(
+        np.array([Point(1, 2), None, LineString([(0, 0), (1, 1)])]), 4326
+    )
+    wkb = shapely.to_wkb(geoms, flavor="extended", include_srid=True)
+    got = cuspatial.GeoSeries.from_wkb(list(wkb))
+    expected = gpd.GeoSeries([Point(1, 2), None, LineString([(0, 0), (1, 1)])])
+    gpd.testing.assert_geoseries_equal(expected, got.to_geopandas())
+
+
+def test_from_wkb_unsupported_type():
+    wkb = shapely.to_wkb(shapely.geometrycollections([Point(0, 0)]))
+    with pytest.raises(ValueError, match="Unsupported WKB geometry type 7"):
+        cuspatial.GeoSeries.from_wkb([wkb])
+
+
+def test_to_wkb(gs):
+    got = cuspatial.from_geopandas(gs).to_wkb()
+    assert got.to_pylist() == list(shapely.to_wkb(gs.values))
+
+
+def test_to_wkb_roundtrip_sliced(gs):
+    gs = gs.copy()
+    gs[4] = None
+    cugs = cuspatial.from_geopandas(gs)[3:13]
+    got = cuspatial.GeoSeries.from_wkb(cugs.to_wkb())
+    assert got.to_wkb().null_count == 1
+    gpd.testing.assert_geoseries_equal(
+        gs[3:13].reset_index(drop=True), got.to_geopandas()
+    )
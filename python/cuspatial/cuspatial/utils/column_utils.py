@@ -2,6 +2,7 @@
 
 from typing import TypeVar
 
+import cupy as cp
 import numpy as np
 
 from cudf.api.types import is_datetime_dtype
@@ -17,6 +18,8 @@ from cuspatial.core.dtypes import (
 
 GeoSeries = TypeVar("GeoSeries", bound="GeoSeries")
 
+COORD_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
 
 def normalize_point_columns(*cols):
     """
@@ -57,30 +60,113 @@ def normalize_timestamp_column(ts, fallback_dtype="datetime64[ms]"):
     return ts if is_datetime_dtype(ts.dtype) else ts.astype(fallback_dtype)
 
 
+def _type_counts(gs: GeoSeries):
+    return gs._column._meta.type_counts
+
+
+def validate_coord_dtype(coord_dtype):
+    """
+    Return `coord_dtype` as a numpy dtype, raising ValueError if it is not
+    one of the supported coordinate dtypes. None is returned unchanged.
+    """
+    if coord_dtype is None:
+        return None
+    dtype = np.dtype(coord_dtype)
+    if dtype not in COORD_DTYPES:
+        raise ValueError(
+            f"coord_dtype must be float32 or float64, got {coord_dtype}"
+        )
+    return dtype
+
+
+def cast_coords(values, coord_dtype, max_error=None):
+    """
+    Cast a numpy or cupy array of coordinates to `coord_dtype`.
+
+    Narrowing casts are checked for precision loss: a finite coordinate
+    that overflows `coord_dtype` raises ValueError, and so does any
+    coordinate moved by more than `max_error`, if given.
+
+    Parameters
+    ----------
+    values : numpy.ndarray or cupy.ndarray
+        Floating point coordinates.
+    coord_dtype : dtype or None
+        float32 or float64. None returns `values` unchanged.
+    max_error : float, optional
+        The largest absolute change of a coordinate to accept.
+
+    Returns
+    -------
+    result : numpy.ndarray or cupy.ndarray
+        `values` itself if it already has `coord_dtype`.
+    """
+    coord_dtype = validate_coord_dtype(coord_dtype)
+    if coord_dtype is None or values.dtype == coord_dtype:
+        return values
+    with np.errstate(over="ignore"):
+        result = values.astype(coord_dtype)
+    if coord_dtype.itemsize >= values.dtype.itemsize or len(values) == 0:
+        return result
+
+    xp = cp.get_array_module(values)
+    if bool(xp.any(xp.isinf(result) & xp.isfinite(values))):
+        raise ValueError(f"Coordinates overflow {coord_dtype}")
+    if max_error is not None:
+        error = float(xp.nanmax(xp.abs(result.astype(values.dtype) - values)))
+        if error > max_error:
+            raise ValueError(
+                f"Casting to {coord_dtype} moves coordinates by up to "
+                f"{error}, more than max_error={max_error}"
+            )
+    return result
+
+
+def promote_coord_dtypes(*series):
+    """
+    Return the GeoSeries in `series` with their coordinates cast to a common
+    dtype, so that kernels taking several of them see one coordinate type.
+    float32 is kept when every non-empty GeoSeries has it. Other arguments
+    are returned unchanged.
+    """
+    dtypes = {
+        s.coord_dtype
+        for s in series
+        if hasattr(s, "astype_coords") and len(s) > 0
+    }
+    if len(dtypes) < 2:
+        return series
+    dtype = np.result_type(*dtypes)
+    return tuple(
+        s.astype_coords(dtype) if hasattr(s, "astype_coords") else s
+        for s in series
+    )
+
+
 def contain_single_type_geometry(gs: GeoSeries):
     """
     Returns true if `gs` contains only single type of geometries
 
     A geometry is considered as the same type to its multi-geometry variant.
+    Answered from the per-type counts cached on the column's `GeoMeta`.
     """
-    has_points = len(gs.points.xy) > 0
-    has_multipoints = len(gs.multipoints.xy) > 0
-    has_lines = len(gs.lines.xy) > 0
-    has_polygons = len(gs.polygons.xy) > 0
-
-    return (
-        len(gs) > 0
-        and ((has_points or has_multipoints) + has_lines + has_polygons) == 1
+    counts = _type_counts(gs)
+    has_points = (
+        counts[Feature_Enum.POINT] + counts[Feature_Enum.MULTIPOINT] > 0
     )
+    has_lines = counts[Feature_Enum.LINESTRING] > 0
+    has_polygons = counts[Feature_Enum.POLYGON] > 0
+
+    return len(gs) > 0 and (has_points + has_lines + has_polygons) == 1
 
 
 def contains_only_points(gs: GeoSeries):
     """
     Returns true if `gs` contains only points or multipoints
     """
-
+    counts = _type_counts(gs)
     return contain_single_type_geometry(gs) and (
-        len(gs.points.xy) > 0 or len(gs.multipoints.xy) > 0
+        counts[Feature_Enum.POINT] + counts[Feature_Enum.MULTIPOINT] > 0
     )
 
 
@@ -88,24 +174,32 @@ def contains_only_multipoints(gs: GeoSeries):
     """
     Returns true if `gs` contains only multipoints
     """
-
-    return contain_single_type_geometry(gs) and (len(gs.multipoints.xy) > 0)
+    counts = _type_counts(gs)
+    return (
+        contain_single_type_geometry(gs)
+        and counts[Feature_Enum.MULTIPOINT] > 0
+    )
 
 
 def contains_only_linestrings(gs: GeoSeries):
     """
     Returns true if `gs` contains only linestrings
     """
-
-    return contain_single_type_geometry(gs) and len(gs.lines.xy) > 0
+    counts = _type_counts(gs)
+    return (
+        contain_single_type_geometry(gs)
+        and counts[Feature_Enum.LINESTRING] > 0
+    )
 
 
 def contains_only_polygons(gs: GeoSeries):
     """
     Returns true if `gs` contains only polygons
     """
-
-    return contain_single_type_geometry(gs) and len(gs.polygons.xy) > 0
+    counts = _type_counts(gs)
+    return (
+        contain_single_type_geometry(gs) and counts[Feature_Enum.POLYGON] > 0
+    )
 
 
 def has_same_geometry(lhs: GeoSeries, rhs: GeoSeries):
@@ -130,7 +224,12 @@ def has_multipolygons(gs: GeoSeries):
     """
     Returns true if `gs` contains any MultiPolygons
     """
-    return len(gs.polygons.geometry_offset) != len(gs.polygons.part_offset)
+    meta = gs._column._meta
+    return meta.cached(
+        "has_multipolygons",
+        lambda: len(gs.polygons.geometry_offset)
+        != len(gs.polygons.part_offset),
+    )
 
 
 def empty_geometry_column(feature: Feature_Enum, base_type):
@@ -0,0 +1,212 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+
+"""Run functions that accept a single geometry type on GeoSeries that mix
+several, by grouping their rows by feature type.
+
+A group is selected with `iloc`, which only gathers the feature types and
+union offsets of its rows, so the coordinates are never copied to split a
+GeoSeries.
+"""
+
+import functools
+import inspect
+
+import cupy as cp
+import numpy as np
+
+import cudf
+from cudf.core.column import as_column, build_list_column
+
+from cuspatial.core._column.geocolumn import GeoColumn
+from cuspatial.core._column.geometa import Feature_Enum
+from cuspatial.io.geopandas_reader import NONE_OFFSET
+from cuspatial.utils.column_utils import empty_geometry_column
+
+_FEATURES = (
+    Feature_Enum.POINT,
+    Feature_Enum.MULTIPOINT,
+    Feature_Enum.LINESTRING,
+    Feature_Enum.POLYGON,
+)
+
+
+def partition_by_type(*series):
+    """Group the rows of equal length GeoSeries by their feature types.
+
+    Parameters
+    ----------
+    *series : GeoSeries
+        GeoSeries of the same length, compared row by row.
+
+    Returns
+    -------
+    groups : dict
+        Maps each tuple of Feature_Enum, one per GeoSeries, to the
+        ascending positions of the rows that have these types. Rows that
+        are null in any GeoSeries are in no group.
+    """
+    if len({len(s) for s in series}) > 1:
+        raise ValueError("GeoSeries must have the same length")
+    num_features = len(_FEATURES)
+    keys = None
+    for s in series:
+        types = s._column._meta.input_types.values.astype(cp.int32)
+        if keys is None:
+            keys = types
+        else:
+            keys = cp.where(
+                (keys < 0) | (types < 0), -1, keys * num_features + types
+            )
+    if keys is None:
+        return {}
+
+    groups = {}
+    for key in cp.unique(keys[keys >= 0]).get().tolist():
+        types, rest = [], key
+        for _ in series:
+            rest, value = divmod(rest, num_features)
+            types.append(Feature_Enum(value))
+        groups[tuple(reversed(types))] = cp.flatnonzero(keys == key)
+    return groups
+
+
+def apply_by_type(func, *series, dtype=None):
+    """Apply a function of GeoSeries of single feature types to each type
+    group of `series` and scatter its results back into row order.
+
+    Parameters
+    ----------
+    func : callable
+        Called with the rows of one group of each GeoSeries and returns a
+        Series with one value per row.
+    *series : GeoSeries
+        GeoSeries of the same length.
+    dtype : numpy.dtype, optional
+        The dtype of the result, by default the dtype of the first result
+        of `func`.
+
+    Returns
+    -------
+    result : cudf.Series
+        The results of `func` in the row order of `series`. Rows that are
+        null in any GeoSeries are null.
+    """
+    groups = partition_by_type(*series)
+    if len(groups) == 1:
+        (positions,) = groups.values()
+        if len(positions) == len(series[0]):
+            return func(*series).reset_index(drop=True)
+
+    result = None
+    for positions in groups.values():
+        values = func(*(s.iloc[positions] for s in series))
+        values = cudf.Series(values).values
+        if result is None:
+            result = cp.zeros(
+                len(series[0]),
+                dtype=values.dtype if dtype is None else dtype,
+            )
+        result[positions] = values
+    if result is None:
+        result = cp.zeros(len(series[0]), dtype=dtype or np.float64)
+    result = cudf.Series(result)
+
+    valid = None
+    for s in series:
+        if s._column.has_nulls():
+            s_valid = s._column._meta.valid.values
+            valid = s_valid if valid is None else valid & s_valid
+    return result if valid is None else result.mask(~valid)
+
+
+def propagate_nulls(func):
+    """Make a row-wise function of GeoSeries return null for the rows that
+    are null in any of them, instead of passing null geometries to its
+    kernels. The valid rows are grouped by feature type, see
+    `apply_by_type`. The function keeps its signature, so its arguments
+    can still be passed by keyword.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        names = [
+            name
+            for name, value in bound.arguments.items()
+            if isinstance(getattr(value, "_column", None), GeoColumn)
+        ]
+        series = [bound.arguments[name] for name in names]
+        if not any(s._column.has_nulls() for s in series):
+            return func(*bound.args, **bound.kwargs)
+
+        def call(*selected):
+            arguments = dict(bound.arguments, **dict(zip(names, selected)))
+            return func(**arguments)
+
+        return apply_by_type(call, *series)
+
+    return wrapper
+
+
+def map_coordinates(gs, transform):
+    """Replace every coordinate of `gs`, whatever its feature types.
+
+    Parameters
+    ----------
+    gs : GeoSeries
+        The geometries to transform.
+    transform : callable
+        Called once per feature type with the x and y Series of its
+        coordinates, and returns the transformed x and y Series.
+
+    Returns
+    -------
+    result : GeoSeries
+        The geometries of `gs` with the transformed coordinates, with a
+        RangeIndex. Only the coordinates of the rows of `gs` are kept.
+    """
+    meta = gs._column._meta
+    input_types = meta.input_types.values
+    accessors = {
+        Feature_Enum.POINT: gs.points,
+        Feature_Enum.MULTIPOINT: gs.multipoints,
+        Feature_Enum.LINESTRING: gs.lines,
+        Feature_Enum.POLYGON: gs.polygons,
+    }
+    union_offsets = cp.full(len(gs), NONE_OFFSET, dtype=np.int32)
+    coord_dtype = gs.coord_dtype
+    columns = {}
+    for feature in _FEATURES:
+        count = meta.type_counts[feature]
+        if count == 0:
+            continue
+        accessor = accessors[feature]
+        offsets, _ = accessor._levels()
+        x, y = transform(accessor.x, accessor.y)
+        coord_dtype = x.dtype
+        column = cudf.DataFrame({"x": x, "y": y}).interleave_columns()._column
+        for level in reversed(offsets):
+            column = build_list_column(
+                indices=as_column(level),
+                elements=column,
+                size=len(level) - 1,
+            )
+        columns[feature] = column
+        union_offsets[input_types == feature.value] = cp.arange(
+            count, dtype=np.int32
+        )
+
+    children = tuple(
+        cudf.Series(
+            columns.get(feature, empty_geometry_column(feature, coord_dtype))
+        )
+        for feature in _FEATURES
+    )
+    return type(gs)(
+        GeoColumn(
+            children,
+            {"input_types": meta.input_types, "union_offsets": union_offsets},
+        )
+    )